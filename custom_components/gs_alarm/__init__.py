@@ -4,7 +4,7 @@
 The `gs_alarm` integration.
 """
 from __future__ import annotations
-from typing import Any, cast, TYPE_CHECKING
+from typing import Any, Optional, Tuple, cast, TYPE_CHECKING
 from types import MappingProxyType
 import asyncio
 import logging
@@ -18,6 +18,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import (
     ConfigEntryNotReady, ConfigEntryError
 )
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     DOMAIN,
@@ -31,8 +34,14 @@ from .const import (
     CONF_OPT_NOTIFICATIONS_LOCAL,
     CONF_OPT_NOTIFICATIONS_CLOUD,
     CONF_OPT_NOTIFICATIONS_CLOUD_UPSTREAM,
+    HISTORY_SYNC_INTERVAL,
 )
 from .coordinator import GsAlarmCoordinator
+from .history import history_store
+from .services import async_setup_services
+from .client_pool import (
+    GsAlarmPooledClient, async_get_client_pool, DATA_CLIENT_POOL,
+)
 if TYPE_CHECKING:
     type GsAlarmConfigEntry = ConfigEntry[GsAlarmCoordinator]
 
@@ -41,20 +50,82 @@ PLATFORMS = [
     "alarm_control_panel", "switch", "binary_sensor", "sensor", "select",
     "button", "text", "number"
 ]
+# pylint: disable=invalid-name
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
-async def _options_notifications_protocol(
-    g90_client: G90Alarm, options: MappingProxyType[str, Any]
-) -> None:
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
     """
-    Configure the selected notifications protocol during options (configure)
-    flow
+    Set up the integration, registering its services.
+    """
+    async_setup_services(hass)
+    return True
+
+
+def _notifications_fingerprint(
+    options: MappingProxyType[str, Any]
+) -> Tuple[Any, ...]:
+    """
+    Fingerprint of the effective notifications settings.
+
+    Only the options relevant to the selected protocol are included, with
+    defaults resolved, so that updates to other options (or the title of the
+    entry) result in the same fingerprint.
+
+    :param options: Options of the config entry.
+    :return: The fingerprint.
     """
     # Protocol defaults to local notifications if not set in the options
     # (e.g. during initial component setup)
     notifications_protocol = options.get(
         CONF_NOTIFICATIONS_PROTOCOL, CONF_OPT_NOTIFICATIONS_LOCAL
     )
+    relevant_options: Tuple[str, ...] = ()
+    if notifications_protocol in [CONF_OPT_NOTIFICATIONS_CLOUD,
+                                  CONF_OPT_NOTIFICATIONS_CLOUD_UPSTREAM]:
+        relevant_options += (
+            CONF_CLOUD_IP, CONF_CLOUD_PORT, CONF_CLOUD_LOCAL_PORT
+        )
+    if notifications_protocol == CONF_OPT_NOTIFICATIONS_CLOUD_UPSTREAM:
+        relevant_options += (
+            CONF_CLOUD_UPSTREAM_HOST, CONF_CLOUD_UPSTREAM_PORT
+        )
+
+    return (
+        notifications_protocol,
+        *(options.get(key) for key in relevant_options),
+    )
+
+
+async def _options_notifications_protocol(
+    pooled_client: Optional[GsAlarmPooledClient], g90_client: G90Alarm,
+    options: MappingProxyType[str, Any]
+) -> None:
+    """
+    Configure the selected notifications protocol during options (configure)
+    flow
+
+    :param pooled_client: The pooled client, tracking the notifications
+     settings the client has been configured with.
+    :param g90_client: The client to configure notifications for.
+    :param options: Options of the config entry.
+    """
+    notifications_fingerprint = _notifications_fingerprint(options)
+    # Restarting the notifications listeners might lose the packets from the
+    # panel, so those are reconfigured only when the effective settings have
+    # changed - e.g. not on title-only updates of the entry, or when the
+    # client is reused across reloads of the entry
+    if (
+        pooled_client is not None
+        and pooled_client.notifications_fingerprint
+        == notifications_fingerprint
+    ):
+        _LOGGER.debug(
+            'Notifications settings not changed, skipping reconfiguration'
+        )
+        return
+
+    notifications_protocol = notifications_fingerprint[0]
 
     # Local notifications protocol has been selected
     if notifications_protocol == CONF_OPT_NOTIFICATIONS_LOCAL:
@@ -116,10 +187,12 @@ async def _options_notifications_protocol(
 
     # Start listening for notifications
     await g90_client.listen_notifications()
+    if pooled_client is not None:
+        pooled_client.notifications_fingerprint = notifications_fingerprint
 
 
 async def options_update_listener(
-    _hass: HomeAssistant, entry: GsAlarmConfigEntry
+    hass: HomeAssistant, entry: GsAlarmConfigEntry
 ) -> None:
     """
     Handles options update.
@@ -132,7 +205,14 @@ async def options_update_listener(
         )
 
         # Configure the selected notifications protocol
-        await _options_notifications_protocol(g90_client, entry.options)
+        await _options_notifications_protocol(
+            async_get_client_pool(hass).get(entry.data.get(CONF_IP_ADDR)),
+            g90_client, entry.options
+        )
+
+        # Add or remove per-sensor entities according to the entity profile
+        await entry.runtime_data.entity_profile.async_apply_profile()
+        entry.runtime_data.apply_slow_callback_threshold()
     except G90TimeoutError as exc:
         raise ConfigEntryNotReady(
             f"Timeout while connecting to '{g90_client.host}'"
@@ -148,13 +228,38 @@ async def async_setup_entry(
     Sets up gs_alarm from a config entry.
     """
     host = entry.data.get(CONF_IP_ADDR, None)
+    client_pool = async_get_client_pool(hass)
+    # Release clients the entry no longer uses, e.g. when the host has changed
+    await client_pool.async_release_entry(entry.entry_id, keep_host=host)
+    pooled_client = client_pool.get(host)
+    # Reuse the client kept from the previous setup of the entry, if any
+    client_reused = (
+        pooled_client is not None and pooled_client.entry_id == entry.entry_id
+    )
+    if pooled_client is not None and not client_reused:
+        # The client belongs to another entry for the same host
+        await client_pool.async_release(host)
+        pooled_client = None
+
     try:
-        g90_client = G90Alarm(host)
+        if pooled_client is None:
+            _LOGGER.debug("Creating client for '%s'", host)
+            g90_client = G90Alarm(host)
+        else:
+            _LOGGER.debug("Reusing client for '%s'", host)
+            g90_client = pooled_client.client
         coordinator = GsAlarmCoordinator(hass, entry, g90_client)
+        # Unregister callbacks once the entry is unloaded or its setup fails,
+        # otherwise those are left registered with the (possibly pooled)
+        # client, added up on every retry
+        entry.async_on_unload(coordinator.callbacks.remove_all)
         # Fetch essential data into the coordinator, since setting up the
         # below platforms depend on it to generate IDs and device info
         await coordinator.init_essential_data()
         entry.runtime_data = coordinator
+        await coordinator.history.async_load()
+        # Prefetch last states of the entities before those are created
+        coordinator.prefetch_last_states()
     except G90TimeoutError as exc:
         raise ConfigEntryNotReady(
             f"Timeout while connecting to '{host}'"
@@ -169,7 +274,27 @@ async def async_setup_entry(
     entry.async_on_unload(entry.add_update_listener(options_update_listener))
 
     # Perform the initial data refresh
-    await entry.runtime_data.async_config_entry_first_refresh()
+    try:
+        await entry.runtime_data.async_config_entry_first_refresh()
+    except (ConfigEntryNotReady, ConfigEntryError):
+        # Platforms have been set up already, those need to be unloaded for
+        # the retry to set them up again
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        raise
+    # The client is pooled only once the initial refresh succeeded, so failed
+    # setup doesn't leave it behind
+    if pooled_client is None:
+        client_pool.add(host, g90_client, entry.entry_id)
+    if client_reused:
+        # Sensors and relays are known to the reused client already, so the
+        # refresh above reports them as updated rather than added - replay
+        # those to get their entities created
+        coordinator.replay_panel_entities()
+
+    # Synchronize the panel history into the local store periodically
+    entry.async_on_unload(async_track_time_interval(
+        hass, coordinator.history.async_periodic_sync, HISTORY_SYNC_INTERVAL
+    ))
 
     # Update the entry's title
     if not hass.config_entries.async_update_entry(
@@ -203,10 +328,29 @@ async def async_unload_entry(
         'Platforms unloaded %ssuccessfully', '' if unload_ok else 'un'
     )
     if unload_ok:
-        # Ensure task simulating alerts from history is stopped
-        await entry.runtime_data.client.stop_simulating_alerts_from_history()
-        # Stop listening for notifications
-        await entry.runtime_data.client.close_notifications()
+        # Ensure simulation of alerts from history is stopped
+        entry.runtime_data.simulation.async_stop()
+        # Persist the panel history not yet saved
+        await entry.runtime_data.history.async_save()
+        # The client is kept in the pool (along with its notifications
+        # listeners) if the entry is being reloaded, otherwise it is released
+        # stopping listening for notifications
+        if hass.is_stopping or entry.disabled_by is not None:
+            await async_get_client_pool(hass).async_release(
+                entry.data.get(CONF_IP_ADDR)
+            )
         _LOGGER.debug('Custom component unloaded')
 
     return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: GsAlarmConfigEntry
+) -> None:
+    """
+    Handles removal of the config entry, releasing its client.
+    """
+    if DATA_CLIENT_POOL in hass.data:
+        await hass.data[DATA_CLIENT_POOL].async_release_entry(entry.entry_id)
+    # Remove the panel history stored locally
+    await history_store(hass, entry.entry_id).async_remove()
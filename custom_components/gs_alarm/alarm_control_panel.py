@@ -23,6 +23,8 @@ from pyg90alarm import G90ArmDisarmTypes, G90Error, G90TimeoutError
 
 from .entity_base import GSAlarmEntityBase
 from .coordinator import GsAlarmCoordinator
+from .dedup import GsAlarmEventDedup
+from .const import EVENT_ALARM, EVENT_ARMDISARM
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
 
@@ -74,20 +76,54 @@ class G90AlarmPanel(
         self._attr_has_entity_name = True
         self._attr_changed_by = None
         self._attr_alarm_state = None
-        self.coordinator.client.armdisarm_callback.add(self.armdisarm_callback)
-        self.coordinator.client.alarm_callback.add(self.alarm_callback)
+        # Suppresses same state delivered by multiple notification paths
+        self._dedup = GsAlarmEventDedup()
+        # Availability last written to HASS by the coordinator update
+        self._written_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """
+        Invoked by HASS when entity is added.
+        """
+        await super().async_added_to_hass()
+        # Register callbacks for panel state changes, those are unregistered
+        # when the entity is removed
+        self.async_on_remove(
+            self.coordinator.callbacks.add(
+                self.coordinator.client.armdisarm_callback,
+                self.armdisarm_callback
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.callbacks.add(
+                self.coordinator.client.alarm_callback, self.alarm_callback
+            )
+        )
 
     def armdisarm_callback(self, state: G90ArmDisarmTypes) -> None:
         """
         Invoked by `G90Alarm` when panel is armed or disarmed.
         """
         _LOGGER.debug('Received arm/disarm callback: %s', state)
+        duplicate = self._dedup.is_duplicate(EVENT_ARMDISARM, None, state)
+        # The panel returning to the state it had before the alarm is never
+        # suppressed, otherwise the entity would be stuck in triggered state
+        if (
+            duplicate
+            and self._attr_alarm_state != AlarmControlPanelState.TRIGGERED
+        ):
+            self.coordinator.performance.record_state_write(self, False)
+            return
+        # Alarms following the panel armed or disarmed are new ones, even if
+        # triggered by the same sensor within the deduplication window
+        self._dedup.forget(EVENT_ALARM)
         self._attr_alarm_state = STATE_MAPPING[state]
         # Reset `changed_by` attribute so the value it possibly has (name of
         # sensor caused last alarm) isn't carried on indefinitely which might
         # be confusing
         self._attr_changed_by = None
         # Update HA entity since the panel state has changed
+        self.coordinator.performance.record_state_write(self, True)
         self.async_write_ha_state()
 
     def alarm_callback(
@@ -103,19 +139,32 @@ class G90AlarmPanel(
          triggered the alarm
         :param extra_data: Extra data might have been set to the
          `G90Sensor` instance via `G90Sensor.extra_data` associated with the
-         alarm. The integration stores ID of sensor entity there, so it is
-         extracted and used for `changed_by` attribute of the HASS alarm panel
+         alarm. The integration stores ID of sensor entity there, it is used
+         if the sensor entity isn't found in the panel index
         """
+        # Entity ID of the sensor is looked up in the panel index by the
+        # sensor index, falling back to the one stored in `extra_data`
+        entity_id = (
+            self.coordinator.panel_index.primary_sensor_entity_id(sensor_idx)
+            or extra_data
+        )
         _LOGGER.debug(
             'Received alarm callback: %s (idx=%s), entity id: %s',
-            sensor_name, sensor_idx, extra_data
+            sensor_name, sensor_idx, entity_id
         )
+        if self._dedup.is_duplicate(EVENT_ALARM, sensor_idx, None):
+            self.coordinator.performance.record_state_write(
+                self, False, sensor_idx
+            )
+            return
         # Set `changed_by` panel attribute to the sensor entity ID if available
-        # in `extra_data`
-        if extra_data:
-            self._attr_changed_by = extra_data
+        if entity_id:
+            self._attr_changed_by = entity_id
         self._attr_alarm_state = AlarmControlPanelState.TRIGGERED
         # Update HA entity since the panel state has changed
+        self.coordinator.performance.record_state_write(
+            self, True, sensor_idx
+        )
         self.async_write_ha_state()
 
     @callback
@@ -125,11 +174,29 @@ class G90AlarmPanel(
         """
         _LOGGER.debug('Updating state')
 
-        host_state = self.coordinator.data.host_status.host_status
-        self._attr_alarm_state = STATE_MAPPING[host_state]
+        alarm_state = STATE_MAPPING[
+            self.coordinator.data.host_status.host_status
+        ]
+        available = self.coordinator.last_update_success
+        # The state the entity already has (e.g. just received by the
+        # notification) is skipped, unless the entity availability needs to
+        # be reflected. Leaving triggered state is never skipped, since the
+        # states differ then
+        if (
+            alarm_state == self._attr_alarm_state
+            and available == self._written_available
+        ):
+            self.coordinator.performance.record_state_write(self, False)
+            return
+        self._written_available = available
+        if alarm_state != self._attr_alarm_state:
+            # See `armdisarm_callback()`
+            self._dedup.forget(EVENT_ALARM)
+        self._attr_alarm_state = alarm_state
         _LOGGER.debug(
             '%s: Providing state %s', self.unique_id, self._attr_alarm_state
         )
+        self.coordinator.performance.record_state_write(self, True)
         self.async_write_ha_state()
 
     async def async_alarm_disarm(self, _code: str | None = None) -> None:
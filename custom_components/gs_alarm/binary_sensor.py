@@ -4,10 +4,11 @@
 Binary sensors for `gs_alarm` integration.
 """
 from __future__ import annotations
-from typing import Mapping, Any, TYPE_CHECKING
+from typing import Dict, Mapping, Any, Optional, TYPE_CHECKING
+from datetime import datetime, timedelta
 import logging
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.const import EntityCategory
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -16,7 +17,9 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     DOMAIN as BINARY_SENSOR_DOMAIN,
 )
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 
 from pyg90alarm import (
     G90Sensor, G90PeripheralTypes, G90HostInfoWifiStatus, G90HostInfoGsmStatus
@@ -24,14 +27,22 @@ from pyg90alarm import (
 
 from .coordinator import GsAlarmCoordinator
 from .mixin import (
-    GSAlarmGenerateIDsSensorMixin, GsAlarmRestoreBoolGatedMixin
+    GSAlarmGenerateIDsSensorMixin, GsAlarmRestoreBoolGatedMixin,
+    GsAlarmPanelNameMixinBase, GsAlarmPanelIndexMixinBase,
 )
 from .entity_base import GSAlarmEntityBase
+from .hold_off import GsAlarmStateHoldOff
+from .dedup import GsAlarmEventDedup
 from .const import (
+    CONF_MOTION_SENSOR_HOLD_OFF,
+    CONF_VIBRATION_SENSOR_HOLD_OFF,
+    EVENT_SENSOR,
     NOTIFICATIONS_PROTOCOL_SENSOR_LAST_DEVICE_TIMESTAMP_ATTR,
     NOTIFICATIONS_PROTOCOL_SENSOR_LAST_UPSTREAM_TIMESTAMP_ATTR,
     NOTIFICATIONS_PROTOCOL_SENSOR_TTL,
     NOTIFICATIONS_PROTOCOL_SENSOR_UNRECORDED_ATTRIBUTES,
+    SENSOR_ENTITY_FAMILY_STATE,
+    SENSOR_ENTITY_FAMILY_ATTRIBUTES,
 )
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
@@ -69,6 +80,13 @@ HASS_SENSOR_TYPES_MAPPING = {
     G90PeripheralTypes.CORD_DEV: BinarySensorDeviceClass.MOTION,
 }
 
+# Options for hold-off period of sensor types known to report frequently
+SENSOR_HOLD_OFF_OPTIONS = {
+    G90PeripheralTypes.INFRARED: CONF_MOTION_SENSOR_HOLD_OFF,
+    G90PeripheralTypes.IN_BEAM: CONF_MOTION_SENSOR_HOLD_OFF,
+    G90PeripheralTypes.VIB: CONF_VIBRATION_SENSOR_HOLD_OFF,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -77,26 +95,28 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up a config entry."""
-    def sensor_list_change_callback(sensor: G90Sensor, added: bool) -> None:
-        if added:
-            # Register HASS entities for the new sensor and its attributes
-            # exposed separately
-            entities = [
-                # Sensor itself
-                G90BinarySensor(sensor, entry.runtime_data),
-                # Sensor attributes
-                G90SensorAttributeTampered(sensor, entry.runtime_data),
-                G90SensorAttributeLowBattery(sensor, entry.runtime_data),
-                G90SensorAttributeDoorOpenWhenArming(
-                    sensor, entry.runtime_data
-                ),
-            ]
-
-            async_add_entities(entities)
-
-    # Register callback for panel's sensors added/removed
-    entry.runtime_data.client.sensor_list_change_callback.add(
-        sensor_list_change_callback
+    def sensor_entities(sensor: G90Sensor) -> list[Entity]:
+        # Sensor itself
+        return [G90BinarySensor(sensor, entry.runtime_data)]
+
+    def sensor_attribute_entities(sensor: G90Sensor) -> list[Entity]:
+        # Sensor attributes exposed separately
+        return [
+            G90SensorAttributeTampered(sensor, entry.runtime_data),
+            G90SensorAttributeLowBattery(sensor, entry.runtime_data),
+            G90SensorAttributeDoorOpenWhenArming(
+                sensor, entry.runtime_data
+            ),
+        ]
+
+    # Register HASS entities to be created for panel's sensors, subject to
+    # entity profile
+    entry.runtime_data.entity_profile.register_family(
+        SENSOR_ENTITY_FAMILY_STATE, sensor_entities, async_add_entities
+    )
+    entry.runtime_data.entity_profile.register_family(
+        SENSOR_ENTITY_FAMILY_ATTRIBUTES, sensor_attribute_entities,
+        async_add_entities
     )
 
     # Add WiFi, GSM and GPRS/3G status sensors
@@ -120,7 +140,8 @@ class G90PanelBinarySensorEntity(BinarySensorEntity, GSAlarmEntityBase):
 
 class G90BinarySensor(
     BinarySensorEntity, CoordinatorEntity[GsAlarmCoordinator],
-    GSAlarmGenerateIDsSensorMixin, GsAlarmRestoreBoolGatedMixin
+    GSAlarmGenerateIDsSensorMixin, GsAlarmRestoreBoolGatedMixin,
+    GsAlarmPanelNameMixinBase, GsAlarmPanelIndexMixinBase,
 ):
     """
     Binary sensor for alarm panel's sensor.
@@ -133,6 +154,7 @@ class G90BinarySensor(
     UNIQUE_ID_FMT = "{guid}_sensor_{sensor.index}"
     ENTITY_ID_FMT = "{guid}_{sensor.name}"
     ENTITY_DOMAIN = BINARY_SENSOR_DOMAIN
+    INDEX_PRIMARY = True
 
     def __init__(
         self, g90_sensor: G90Sensor, coordinator: GsAlarmCoordinator
@@ -150,9 +172,7 @@ class G90BinarySensor(
         # Derive name from sensor's name
         self._attr_name = None
         self._attr_translation_key = 'sensor'
-        self._attr_translation_placeholders = {
-            'sensor': g90_sensor.name,
-        }
+        self._attr_translation_placeholders = self.panel_name_placeholders()
 
         # Extra attributes over sensor characteristics, useful for
         # troubleshooting to identify sensor type and its number as panel
@@ -176,13 +196,13 @@ class G90BinarySensor(
         if hass_sensor_type:
             self._attr_device_class = hass_sensor_type
 
-        # Register callbacks to handle sensor state changes
-        g90_sensor.state_callback.add(self.state_callback)
-        g90_sensor.low_battery_callback.add(self.low_battery_callback)
-        g90_sensor.tamper_callback.add(self.tamper_callback)
-        g90_sensor.door_open_when_arming_callback.add(
-            self.door_open_when_arming_callback
-        )
+        # Hold-off of state changes, created once the entity is added
+        self._state_hold_off: Optional[GsAlarmStateHoldOff] = None
+        # Sensor state last written to HASS, reported while state changes are
+        # held off
+        self._written_occupancy = False
+        # Suppresses same state delivered by multiple notification paths
+        self._state_dedup = GsAlarmEventDedup()
 
     async def async_added_to_hass(self) -> None:
         """
@@ -196,8 +216,39 @@ class G90BinarySensor(
             self._g90_sensor.name, self._g90_sensor.index, self.entity_id
         )
         self._g90_sensor.extra_data = self.entity_id
+        # Register callbacks to handle sensor state changes, those are
+        # unregistered when the entity is removed
+        callbacks = self.coordinator.callbacks
+        index = self._g90_sensor.index
+        self.async_on_remove(callbacks.add(
+            self._g90_sensor.state_callback, self.state_callback, index
+        ))
+        self.async_on_remove(callbacks.add(
+            self._g90_sensor.low_battery_callback, self.low_battery_callback,
+            index
+        ))
+        self.async_on_remove(callbacks.add(
+            self._g90_sensor.tamper_callback, self.tamper_callback, index
+        ))
+        self.async_on_remove(callbacks.add(
+            self._g90_sensor.door_open_when_arming_callback,
+            self.door_open_when_arming_callback, index
+        ))
+        self._state_hold_off = GsAlarmStateHoldOff(
+            self.hass, self.hold_off_period, self.write_occupancy
+        )
+        self.async_on_remove(self._state_hold_off.cancel)
         await self.restore_state(self.coordinator.config_entry)
 
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        return {
+            'sensor': self._g90_sensor.name,
+        }
+
+    @property
+    def indexed_panel_entity(self) -> G90Sensor:
+        return self._g90_sensor
+
     def state_callback(self, value: bool) -> None:
         """
         Invoked by `pyg90alarm` when its sensor changes the state.
@@ -205,9 +256,67 @@ class G90BinarySensor(
         :param value: New state value.
         """
         _LOGGER.debug('%s: Received state callback: %s', self.unique_id, value)
+        performance = self.coordinator.performance
+        index = self._g90_sensor.index
+        if self._state_dedup.is_duplicate(EVENT_SENSOR, index, value):
+            performance.record_state_write(self, False, index)
+            return
         self.clear_restored_state()
+        if self._state_hold_off is None:
+            self.write_occupancy()
+            return
+        # Frequent state changes of noisy sensors are coalesced, the write is
+        # skipped until the hold-off period ends
+        if self._state_hold_off.is_holding_off:
+            performance.record_state_write(self, False, index)
+        self._state_hold_off.state_changed()
+
+    @callback
+    def alarm_triggered(self) -> None:
+        """
+        Invoked by the panel index when the sensor triggers the alarm.
+
+        The sensor state is written immediately, since it must not be held
+        off.
+        """
+        if self._state_hold_off is None:
+            return
+        _LOGGER.debug(
+            '%s: Sensor (idx %s) triggered alarm, writing state immediately',
+            self.unique_id, self._g90_sensor.index
+        )
+        self._state_hold_off.flush()
+
+    def hold_off_period(self) -> timedelta:
+        """
+        Hold-off period of the sensor state changes, configured per sensor
+        type.
+
+        :return: The period, zero if the state changes are not held off.
+        """
+        option = SENSOR_HOLD_OFF_OPTIONS.get(self._g90_sensor.type)
+        if option is None or self.coordinator.config_entry is None:
+            return timedelta()
+        return timedelta(
+            seconds=self.coordinator.config_entry.options.get(option, 0)
+        )
+
+    def write_occupancy(self) -> None:
+        """
+        Writes the sensor state to HASS.
+        """
+        self._written_occupancy = self._g90_sensor.occupancy
         # Signal HASS to update the sensor's state, which will trigger the
         # `is_on()` method
+        self._schedule_state_write()
+
+    def _schedule_state_write(self) -> None:
+        """
+        Schedules the sensor state and attributes to be written to HASS.
+        """
+        self.coordinator.performance.record_state_write(
+            self, True, self._g90_sensor.index
+        )
         self.schedule_update_ha_state()
 
     def low_battery_callback(self) -> None:
@@ -219,7 +328,7 @@ class G90BinarySensor(
         )
         # Signal HASS to update the sensor's attributes, which will trigger the
         # `extra_state_attributes()` method
-        self.schedule_update_ha_state()
+        self._schedule_state_write()
 
     def tamper_callback(self) -> None:
         """
@@ -230,7 +339,7 @@ class G90BinarySensor(
         )
         # Signal HASS to update the sensor's attributes, which will trigger the
         # `extra_state_attributes()` method
-        self.schedule_update_ha_state()
+        self._schedule_state_write()
 
     def door_open_when_arming_callback(self) -> None:
         """
@@ -241,7 +350,7 @@ class G90BinarySensor(
         )
         # Signal HASS to update the sensor's attributes, which will trigger the
         # `extra_state_attributes()` method
-        self.schedule_update_ha_state()
+        self._schedule_state_write()
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
@@ -271,10 +380,15 @@ class G90BinarySensor(
         """
         Indicates if sensor is active.
         """
+        occupancy = self._g90_sensor.occupancy
+        # State changes are held off, the state last written is reported
+        # until those are passed through
+        if self._state_hold_off and self._state_hold_off.is_holding_off:
+            occupancy = self._written_occupancy
         live = (
             # None translates to unknown state in HASS for disabled sensor
             None if not self._g90_sensor.enabled
-            else self._g90_sensor.occupancy
+            else occupancy
         )
         val = self.state_with_restore(live)
 
@@ -284,7 +398,8 @@ class G90BinarySensor(
 
 class G90SensorAttributeBase(
     BinarySensorEntity, CoordinatorEntity[GsAlarmCoordinator],
-    GSAlarmGenerateIDsSensorMixin, GsAlarmRestoreBoolGatedMixin
+    GSAlarmGenerateIDsSensorMixin, GsAlarmRestoreBoolGatedMixin,
+    GsAlarmPanelNameMixinBase, GsAlarmPanelIndexMixinBase,
 ):
     """
     Binary sensor representing a specific sensor attribute.
@@ -306,9 +421,7 @@ class G90SensorAttributeBase(
         self._g90_sensor = g90_sensor
         self._attr_has_entity_name = True
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_translation_placeholders = {
-            'sensor': g90_sensor.name,
-        }
+        self._attr_translation_placeholders = self.panel_name_placeholders()
         self._sensor_attr = sensor_attr
 
         # Generate unique ID and entity ID
@@ -319,18 +432,34 @@ class G90SensorAttributeBase(
             coordinator, g90_sensor
         )
 
-        # Register callbacks to handle sensor attribute changes
-        g90_sensor.tamper_callback.add(self.attr_callback)
-        g90_sensor.low_battery_callback.add(self.attr_callback)
-        g90_sensor.door_open_when_arming_callback.add(self.attr_callback)
-
     async def async_added_to_hass(self) -> None:
         """
         Invoked by HASS when entity is added.
         """
         await super().async_added_to_hass()
+        # Register callbacks to handle sensor attribute changes, those are
+        # unregistered when the entity is removed
+        for callback_list in (
+            self._g90_sensor.tamper_callback,
+            self._g90_sensor.low_battery_callback,
+            self._g90_sensor.door_open_when_arming_callback,
+        ):
+            self.async_on_remove(
+                self.coordinator.callbacks.add(
+                    callback_list, self.attr_callback, self._g90_sensor.index
+                )
+            )
         await self.restore_state(self.coordinator.config_entry)
 
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        return {
+            'sensor': self._g90_sensor.name,
+        }
+
+    @property
+    def indexed_panel_entity(self) -> G90Sensor:
+        return self._g90_sensor
+
     def attr_callback(self) -> None:
         """
         Callback invoked when a sensor attribute (e.g., tamper, low battery,
@@ -344,6 +473,9 @@ class G90SensorAttributeBase(
         self.clear_restored_state()
         # Signal HASS to update the sensor's attributes, which will trigger the
         # `extra_state_attributes()` method
+        self.coordinator.performance.record_state_write(
+            self, True, self._g90_sensor.index
+        )
         self.schedule_update_ha_state()
 
     @property
@@ -518,7 +650,7 @@ class G90NotificationsProtocol(G90PanelBinarySensorEntity):
     """
     Binary sensor for notifications protocol connectivity.
     """
-    # pylint: disable=too-many-ancestors
+    # pylint: disable=too-many-ancestors,too-many-instance-attributes
     UNIQUE_ID_FMT = "{guid}_sensor_notifications_protocol"
     ENTITY_ID_FMT = "{guid}_notifications_protocol"
     _unrecorded_attributes = (
@@ -532,50 +664,129 @@ class G90NotificationsProtocol(G90PanelBinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = 'mdi:lan-connect'
+        self._attr_is_on = False
+        self._attr_extra_state_attributes = {}
+        self._expiry_unsub: Optional[CALLBACK_TYPE] = None
+        # Availability last written to HASS by the coordinator update
+        self._written_available = True
 
-    @property
-    def is_on(self) -> bool:
+    async def async_added_to_hass(self) -> None:
         """
-        Indicates if the notifications protocol appears connected.
+        Invoked when the entity is added to HASS.
+        """
+        await super().async_added_to_hass()
+        # Notifications from the panel indicate a packet has just been
+        # received, so the sensor is updated immediately rather than upon next
+        # coordinator refresh
+        client = self.coordinator.client
+        callbacks = self.coordinator.callbacks
+        self.async_on_remove(callbacks.add(
+            client.sensor_callback, self.packet_callback
+        ))
+        self.async_on_remove(callbacks.add(
+            client.armdisarm_callback, self.packet_callback
+        ))
+        self.async_on_remove(callbacks.add(
+            client.alarm_callback, self.packet_callback
+        ))
+        self.async_on_remove(self._cancel_expiry)
+        self._update_state()
 
-        The sensor is considered connected if the last device packet timestamp
-        is within the TTL window.
+    @callback
+    def packet_callback(self, *_args: Any) -> None:
         """
-        packet_timestamp = self.coordinator.data.last_device_packet_time
+        Invoked when notification is received from the panel.
 
-        if packet_timestamp is None:
-            _LOGGER.debug(
-                '%s: Last device packet timestamp absent, returning False',
-                self.unique_id
-            )
-            return False
+        The state is written only if the sensor got connected, the packet
+        timestamps are refreshed upon next transition instead.
+        """
+        written = self._update_state()
+        self.coordinator.performance.record_state_write(self, written)
+        if written:
+            self.async_write_ha_state()
 
-        now = dt_util.utcnow()
-        result = (now - packet_timestamp) <= NOTIFICATIONS_PROTOCOL_SENSOR_TTL
-        _LOGGER.debug(
-            '%s: Last device packet timestamp is %s (now: %s), TTL is %s, '
-            'notifications protocol is %s',
-            self.unique_id, packet_timestamp, now,
-            NOTIFICATIONS_PROTOCOL_SENSOR_TTL,
-            "connected" if result else "disconnected"
-        )
-        return result
+    @callback
+    def _cancel_expiry(self) -> None:
+        """
+        Cancels the timer to expire the connected state, if any.
+        """
+        if self._expiry_unsub is not None:
+            self._expiry_unsub()
+            self._expiry_unsub = None
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any]:
+    @callback
+    def _handle_expiry(self, now: datetime) -> None:
         """
-        Provides packet timestamps for diagnostics.
+        Invoked when the last device packet falls out of TTL window.
+
+        :param now: Time the timer has fired at.
         """
-        return {
+        self._expiry_unsub = None
+        if self._update_state(now=now):
+            self.coordinator.performance.record_state_write(self, True)
+            self.async_write_ha_state()
+
+    @callback
+    def _update_state(self, now: Optional[datetime] = None) -> bool:
+        """
+        Updates the sensor from the packet timestamps, with no state written.
+
+        The sensor is considered connected if the last device packet timestamp
+        is within the TTL window, with a timer scheduled to the moment it
+        falls out of the window.
+
+        :param now: Current time, defaults to the actual one.
+        :return: Whether the connectivity has changed.
+        """
+        client = self.coordinator.client
+        packet_timestamp = client.last_device_packet_time
+        upstream_packet_timestamp = client.last_upstream_packet_time
+
+        self._cancel_expiry()
+        is_on = False
+        if packet_timestamp is not None:
+            expires_at = packet_timestamp + NOTIFICATIONS_PROTOCOL_SENSOR_TTL
+            is_on = (now or dt_util.utcnow()) < expires_at
+            if is_on:
+                self._expiry_unsub = async_track_point_in_utc_time(
+                    self.hass, self._handle_expiry, expires_at
+                )
+
+        self._attr_extra_state_attributes = {
             NOTIFICATIONS_PROTOCOL_SENSOR_LAST_DEVICE_TIMESTAMP_ATTR:
-                self.coordinator.data.last_device_packet_time,
+                packet_timestamp,
             NOTIFICATIONS_PROTOCOL_SENSOR_LAST_UPSTREAM_TIMESTAMP_ATTR:
-                self.coordinator.data.last_upstream_packet_time,
+                upstream_packet_timestamp,
         }
+        # Timestamps change with every packet, so those alone don't make the
+        # state changed
+        if is_on == self._attr_is_on:
+            return False
+
+        _LOGGER.debug(
+            '%s: Last device packet timestamp is %s, TTL is %s, '
+            'notifications protocol is %s',
+            self.unique_id, packet_timestamp,
+            NOTIFICATIONS_PROTOCOL_SENSOR_TTL,
+            "connected" if is_on else "disconnected"
+        )
+        self._attr_is_on = is_on
+        return True
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """
         Invoked when HomeAssistant needs to update the sensor state.
+
+        The state is written only if the connectivity or the entity
+        availability has changed, the packet timestamps are refreshed along
+        with it.
         """
-        self.async_write_ha_state()
+        available = self.coordinator.last_update_success
+        written = (
+            self._update_state() or available != self._written_available
+        )
+        self.coordinator.performance.record_state_write(self, written)
+        if written:
+            self._written_available = available
+            self.async_write_ha_state()
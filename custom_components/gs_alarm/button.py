@@ -4,7 +4,7 @@
 Buttons for `gs_alarm` integration.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 from abc import ABCMeta, abstractmethod
 import logging
 
@@ -17,6 +17,7 @@ from homeassistant.components.button.const import DOMAIN as BUTTON_DOMAIN
 from homeassistant.components.persistent_notification import (
     DOMAIN as NOTIFICATION_DOMAIN, ATTR_MESSAGE, ATTR_TITLE
 )
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -24,6 +25,7 @@ from pyg90alarm import G90Device, G90Sensor, G90Error, G90TimeoutError
 
 from .mixin import (
     GSAlarmGenerateIDsSensorMixin, GSAlarmGenerateIDsDeviceMixin,
+    GsAlarmPanelNameMixinBase, GsAlarmPanelIndexMixinBase,
 )
 from .entity_base import GSAlarmEntityBase
 from .coordinator import GsAlarmCoordinator
@@ -31,7 +33,7 @@ from .binary_sensor import G90BinarySensor
 from .switch import G90Switch
 from .text import G90NewSensorName, G90NewDeviceName
 from .select import G90NewSensorType, G90NewDeviceType
-from .const import DOMAIN
+from .const import DOMAIN, SENSOR_ENTITY_FAMILY_DELETE
 from .utils import translate
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
@@ -50,18 +52,21 @@ async def async_setup_entry(
         if added and device.subindex == 0:
             async_add_entities([G90SwitchDelete(device, entry.runtime_data)])
 
-    def sensor_list_change_callback(sensor: G90Sensor, added: bool) -> None:
+    def sensor_delete_entities(sensor: G90Sensor) -> list[Entity]:
         # New sensor is in the list, add button to delete it
-        if added:
-            async_add_entities([G90SensorDelete(sensor, entry.runtime_data)])
+        return [G90SensorDelete(sensor, entry.runtime_data)]
 
     # Register callbacks to add delete buttons when new devices/sensors are
     # added
-    entry.runtime_data.client.device_list_change_callback.add(
-        device_list_change_callback
+    entry.async_on_unload(
+        entry.runtime_data.callbacks.add(
+            entry.runtime_data.client.device_list_change_callback,
+            device_list_change_callback
+        )
     )
-    entry.runtime_data.client.sensor_list_change_callback.add(
-        sensor_list_change_callback
+    entry.runtime_data.entity_profile.register_family(
+        SENSOR_ENTITY_FAMILY_DELETE, sensor_delete_entities,
+        async_add_entities
     )
 
     # Add buttons to register new sensors/relays
@@ -73,6 +78,7 @@ async def async_setup_entry(
 
 class G90EntityDeleteButtonBase(
     ButtonEntity, CoordinatorEntity[GsAlarmCoordinator],
+    GsAlarmPanelNameMixinBase, GsAlarmPanelIndexMixinBase,
     metaclass=ABCMeta
 ):
     """
@@ -82,6 +88,7 @@ class G90EntityDeleteButtonBase(
     :param coordinator: The GS Alarm coordinator.
     """
     # pylint:disable=too-many-instance-attributes,abstract-method
+    # pylint:disable=too-many-ancestors
     def __init__(
         self, g90_entity: G90Sensor | G90Device,
         coordinator: GsAlarmCoordinator
@@ -99,6 +106,10 @@ class G90EntityDeleteButtonBase(
         The kind of entity being deleted (sensor or device).
         """
 
+    @property
+    def indexed_panel_entity(self) -> G90Sensor | G90Device:
+        return self._g90_entity
+
     async def async_press(self) -> None:
         """
         Delete the alarm entity.
@@ -134,7 +145,7 @@ class G90SwitchDeleteButtonEntity(
     G90EntityDeleteButtonBase,
     GSAlarmGenerateIDsDeviceMixin,
 ):
-    # pylint: disable=too-many-ancestors
+    # pylint: disable=too-many-ancestors,abstract-method
     """Delete relay button base; ENTITY_DOMAIN for generated entity IDs."""
     ENTITY_DOMAIN = BUTTON_DOMAIN
 
@@ -143,7 +154,7 @@ class G90SensorDeleteButtonEntity(
     G90EntityDeleteButtonBase,
     GSAlarmGenerateIDsSensorMixin,
 ):
-    # pylint: disable=too-many-ancestors
+    # pylint: disable=too-many-ancestors,abstract-method
     """Delete sensor button base; ENTITY_DOMAIN for generated entity IDs."""
     ENTITY_DOMAIN = BUTTON_DOMAIN
 
@@ -174,14 +185,17 @@ class G90SwitchDelete(G90SwitchDeleteButtonEntity):
         )
 
         self._attr_translation_key = 'device_delete'
-        self._attr_translation_placeholders = {
-            'relay': device.protocol_data.parent_name,
-        }
+        self._attr_translation_placeholders = self.panel_name_placeholders()
 
     @property
     def entity_kind(self) -> str:
         return 'device'
 
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        return {
+            'relay': self._g90_entity.protocol_data.parent_name,
+        }
+
 
 class G90SensorDelete(G90SensorDeleteButtonEntity):
     """
@@ -209,14 +223,17 @@ class G90SensorDelete(G90SensorDeleteButtonEntity):
         )
 
         self._attr_translation_key = 'sensor_delete'
-        self._attr_translation_placeholders = {
-            'sensor': sensor.name,
-        }
+        self._attr_translation_placeholders = self.panel_name_placeholders()
 
     @property
     def entity_kind(self) -> str:
         return 'sensor'
 
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        return {
+            'sensor': self._g90_entity.name,
+        }
+
 
 class G90NewEntityRegisterButtonBase(
     ButtonEntity, GSAlarmEntityBase,
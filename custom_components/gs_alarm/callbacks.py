@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tracking of callbacks registered with `pyg90alarm` by `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Any, List, Optional, Tuple, TypeVar, cast
+from functools import wraps
+import inspect
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from pyg90alarm.callback import G90CallbackList, Callback
+
+from .performance import GsAlarmPerformanceMetrics
+
+_LOGGER = logging.getLogger(__name__)
+T = TypeVar('T', bound=Callback)
+
+
+class GsAlarmCallbacks:
+    """
+    Tracks callbacks registered with `pyg90alarm`, so those could be
+    unregistered once the registering party (platform or entity) goes away.
+
+    Otherwise, the callbacks keep references to the entities removed or
+    unloaded, leaking those and invoking them on every panel event.
+
+    Invocations of the callbacks, along with the time those spend in the
+    event loop, are recorded into the performance metrics.
+
+    :param performance: The performance metrics to record into.
+    """
+    def __init__(self, performance: GsAlarmPerformanceMetrics) -> None:
+        self._performance = performance
+        self._registrations: List[
+            Tuple[G90CallbackList[Any], Any]
+        ] = []
+
+    @callback
+    def add(
+        self, callback_list: G90CallbackList[T], callback_fn: T,
+        index: Optional[int] = None
+    ) -> CALLBACK_TYPE:
+        """
+        Register the callback.
+
+        :param callback_list: The `pyg90alarm` list of callbacks to add the
+         callback to.
+        :param callback_fn: The callback.
+        :param index: Index of the sensor the callback relates to, recorded
+         into the trace.
+        :return: Callable to unregister the callback, suitable for
+         `async_on_unload` and `async_on_remove`.
+        """
+        callback_fn = self._timed(callback_fn, index)
+        callback_list.add(callback_fn)
+        registration = (callback_list, callback_fn)
+        self._registrations.append(registration)
+
+        @callback
+        def remove_callback() -> None:
+            callback_list.remove(callback_fn)
+            if registration in self._registrations:
+                self._registrations.remove(registration)
+
+        return remove_callback
+
+    def _timed(self, callback_fn: T, index: Optional[int]) -> T:
+        """
+        Wrap the callback to record its invocations, along with the time it
+        spends in the event loop.
+
+        Coroutine callbacks are timed around the await, the time those spend
+        suspended included, so the time is recorded as their latency instead.
+
+        :param callback_fn: The callback.
+        :param index: Index of the sensor the callback relates to.
+        :return: The wrapped callback.
+        """
+        func = cast(Any, callback_fn)
+        name = getattr(func, '__name__', 'callback')
+        owner = getattr(func, '__self__', None)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> None:
+                started = time.perf_counter()
+                try:
+                    await func(*args, **kwargs)
+                finally:
+                    self._performance.record_coroutine_callback(
+                        name, index, args, time.perf_counter() - started
+                    )
+
+            return cast(T, timed_coroutine)
+
+        @wraps(func)
+        def timed_callback(*args: Any, **kwargs: Any) -> None:
+            started = time.perf_counter()
+            try:
+                func(*args, **kwargs)
+            finally:
+                self._performance.record_callback(
+                    name, owner, index, args, time.perf_counter() - started
+                )
+
+        return cast(T, timed_callback)
+
+    @callback
+    def remove_all(self) -> None:
+        """
+        Unregister all callbacks remaining.
+        """
+        if self._registrations:
+            _LOGGER.debug(
+                'Unregistering %s remaining callbacks',
+                len(self._registrations)
+            )
+        for callback_list, callback_fn in self._registrations:
+            callback_list.remove(callback_fn)
+        self._registrations.clear()
+
+    def __len__(self) -> int:
+        """
+        Number of callbacks currently registered.
+        """
+        return len(self._registrations)
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Pool of `G90Alarm` clients for `gs-alarm` integration, keeping those alive
+across reloads of config entries.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import HomeAssistant, Event, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.util.hass_dict import HassKey
+
+from pyg90alarm import G90Alarm
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CLIENT_POOL: HassKey[GsAlarmClientPool] = HassKey(f'{DOMAIN}_client_pool')
+
+
+@dataclass
+class GsAlarmPooledClient:
+    """
+    Client in the pool, along with the state it has been configured with.
+    """
+    client: G90Alarm
+    entry_id: str
+    # Fingerprint of the settings the notifications have been configured
+    # with, `None` if not configured yet
+    notifications_fingerprint: Optional[Tuple[Any, ...]] = None
+
+
+class GsAlarmClientPool:
+    """
+    Pool of `G90Alarm` clients by panel host.
+
+    Reloading a config entry reuses the client of the panel, so that its
+    notification listeners (and their sockets) stay bound and no push events
+    are lost while the entry is being reloaded.
+    """
+    def __init__(self) -> None:
+        self._clients: Dict[Optional[str], GsAlarmPooledClient] = {}
+
+    def get(self, host: Optional[str]) -> Optional[GsAlarmPooledClient]:
+        """
+        Get the pooled client for the host.
+
+        :param host: The host of the panel.
+        :return: The pooled client, or `None` if there is none.
+        """
+        return self._clients.get(host)
+
+    def add(
+        self, host: Optional[str], client: G90Alarm, entry_id: str
+    ) -> GsAlarmPooledClient:
+        """
+        Add the client for the host to the pool.
+
+        :param host: The host of the panel.
+        :param client: The client.
+        :param entry_id: ID of the config entry the client is for.
+        :return: The pooled client.
+        """
+        pooled_client = GsAlarmPooledClient(client=client, entry_id=entry_id)
+        self._clients[host] = pooled_client
+        return pooled_client
+
+    async def async_release(self, host: Optional[str]) -> None:
+        """
+        Remove the client for the host from the pool, closing its
+        notification listeners.
+
+        :param host: The host of the panel.
+        """
+        pooled_client = self._clients.pop(host, None)
+        if pooled_client is None:
+            return
+
+        _LOGGER.debug("Releasing client for '%s'", host)
+        await pooled_client.client.close_notifications()
+
+    async def async_release_entry(
+        self, entry_id: str, keep_host: Optional[str] = None
+    ) -> None:
+        """
+        Release the clients of the config entry.
+
+        :param entry_id: ID of the config entry.
+        :param keep_host: Host to keep the client for, e.g. the one the entry
+         currently uses.
+        """
+        for host, pooled_client in list(self._clients.items()):
+            if pooled_client.entry_id == entry_id and host != keep_host:
+                await self.async_release(host)
+
+    async def async_release_all(self) -> None:
+        """
+        Release all clients in the pool.
+        """
+        for host in list(self._clients):
+            await self.async_release(host)
+
+
+@callback
+def async_get_client_pool(hass: HomeAssistant) -> GsAlarmClientPool:
+    """
+    Get the client pool, creating it if needed.
+
+    :param hass: Home Assistant instance.
+    :return: The client pool.
+    """
+    if DATA_CLIENT_POOL not in hass.data:
+        client_pool = GsAlarmClientPool()
+        hass.data[DATA_CLIENT_POOL] = client_pool
+
+        async def async_stop(_event: Event) -> None:
+            await client_pool.async_release_all()
+
+        # Config entries aren't unloaded when Home Assistant stops, so the
+        # clients are released explicitly
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop)
+    return hass.data[DATA_CLIENT_POOL]
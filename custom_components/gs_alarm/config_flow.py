@@ -5,6 +5,7 @@ Config flow for `gs_alarm` integrarion.
 """
 
 from __future__ import annotations
+from ipaddress import IPv4Network
 import logging
 
 from typing import Any, Self, Dict
@@ -20,12 +21,14 @@ from homeassistant.config_entries import (
 from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
 )
 
-from pyg90alarm import G90Alarm
 from pyg90alarm.const import (
     LOCAL_CLOUD_NOTIFICATIONS_PORT, REMOTE_CLOUD_PORT,
 )
@@ -43,7 +46,18 @@ from .const import (
     CONF_OPT_NOTIFICATIONS_CLOUD,
     CONF_OPT_NOTIFICATIONS_CLOUD_UPSTREAM,
     CONF_RESTORE_STATE_AT_STARTUP,
+    CONF_ENTITY_PROFILE,
+    CONF_OPT_ENTITY_PROFILE_MINIMAL,
+    CONF_OPT_ENTITY_PROFILE_STANDARD,
+    CONF_OPT_ENTITY_PROFILE_FULL,
+    CONF_MOTION_SENSOR_HOLD_OFF,
+    CONF_VIBRATION_SENSOR_HOLD_OFF,
+    CONF_LIVE_DIAGNOSTICS,
+    CONF_SLOW_CALLBACK_THRESHOLD,
+    CONF_DISCOVERY_NETWORK,
+    DISCOVERY_SWEEP_MAX_HOSTS,
 )
+from .discovery import async_discover
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +67,12 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     },
 )
 
+STEP_CONFIRM_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DISCOVERY_NETWORK): str,
+    },
+)
+
 
 class G90ConfigFlow(ConfigFlow, domain=DOMAIN):
     """
@@ -65,12 +85,40 @@ class G90ConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """
         Handles discovering devices upon user confirmation.
+
+        The devices are discovered with the broadcast, additionally sweeping
+        the network if specified - e.g. when the panels are on other network
+        segments or the broadcasts are filtered.
         """
         if user_input is None:
-            self._set_confirm_only()
-            return self.async_show_form(step_id="confirm")
+            return self.async_show_form(
+                step_id="confirm",
+                data_schema=STEP_CONFIRM_DATA_SCHEMA
+            )
 
-        devices = await self.hass.async_create_task(G90Alarm.discover())
+        network = None
+        if user_input.get(CONF_DISCOVERY_NETWORK):
+            try:
+                network = IPv4Network(
+                    user_input[CONF_DISCOVERY_NETWORK], strict=False
+                )
+            except ValueError:
+                return self.async_show_form(
+                    step_id="confirm",
+                    data_schema=STEP_CONFIRM_DATA_SCHEMA,
+                    errors={CONF_DISCOVERY_NETWORK: 'invalid_network'}
+                )
+            if network.num_addresses > DISCOVERY_SWEEP_MAX_HOSTS:
+                return self.async_show_form(
+                    step_id="confirm",
+                    data_schema=STEP_CONFIRM_DATA_SCHEMA,
+                    errors={CONF_DISCOVERY_NETWORK: 'network_too_large'},
+                    description_placeholders={
+                        'max_hosts': str(DISCOVERY_SWEEP_MAX_HOSTS)
+                    }
+                )
+
+        devices = await self.hass.async_create_task(async_discover(network))
         _LOGGER.debug('Discovered devices: %s', devices)
         # No devices discovered, present form for manual hostname/IP entry
         if not devices:
@@ -209,7 +257,7 @@ class OptionsFlowHandler(OptionsFlow):
         """
         schema: dict[
             vol.Required | vol.Optional,
-            SelectSelector | BooleanSelector
+            SelectSelector | BooleanSelector | NumberSelector
         ] = {
             vol.Required(
                 CONF_NOTIFICATIONS_PROTOCOL,
@@ -234,6 +282,57 @@ class OptionsFlowHandler(OptionsFlow):
                     CONF_RESTORE_STATE_AT_STARTUP, True
                 ),
             ): BooleanSelector(),
+            vol.Optional(
+                CONF_ENTITY_PROFILE,
+                default=self.config_entry.options.get(
+                    CONF_ENTITY_PROFILE, CONF_OPT_ENTITY_PROFILE_FULL
+                ),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        CONF_OPT_ENTITY_PROFILE_MINIMAL,
+                        CONF_OPT_ENTITY_PROFILE_STANDARD,
+                        CONF_OPT_ENTITY_PROFILE_FULL,
+                    ],
+                    multiple=False,
+                    mode=SelectSelectorMode.LIST,
+                    translation_key=CONF_ENTITY_PROFILE,
+                )
+            ),
+            **{
+                vol.Optional(
+                    option,
+                    default=self.config_entry.options.get(option, 0),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0, max=300, step=1,
+                        unit_of_measurement='s',
+                        mode=NumberSelectorMode.BOX,
+                    )
+                )
+                for option in (
+                    CONF_MOTION_SENSOR_HOLD_OFF,
+                    CONF_VIBRATION_SENSOR_HOLD_OFF,
+                )
+            },
+            vol.Optional(
+                CONF_LIVE_DIAGNOSTICS,
+                default=self.config_entry.options.get(
+                    CONF_LIVE_DIAGNOSTICS, False
+                ),
+            ): BooleanSelector(),
+            vol.Optional(
+                CONF_SLOW_CALLBACK_THRESHOLD,
+                default=self.config_entry.options.get(
+                    CONF_SLOW_CALLBACK_THRESHOLD, 0
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=1000, step=1,
+                    unit_of_measurement='ms',
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
         }
 
         # Present the form back if no user input
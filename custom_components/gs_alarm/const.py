@@ -15,12 +15,56 @@ CONF_CLOUD_UPSTREAM_HOST = "cloud_upstream_host"
 CONF_CLOUD_UPSTREAM_PORT = "cloud_upstream_port"
 CONF_NOTIFICATIONS_PROTOCOL = "notifications_protocol"
 CONF_RESTORE_STATE_AT_STARTUP = "restore_state_at_startup"
+CONF_ENTITY_PROFILE = "entity_profile"
+CONF_MOTION_SENSOR_HOLD_OFF = "motion_sensor_hold_off"
+CONF_VIBRATION_SENSOR_HOLD_OFF = "vibration_sensor_hold_off"
+CONF_LIVE_DIAGNOSTICS = "live_diagnostics"
+CONF_SLOW_CALLBACK_THRESHOLD = "slow_callback_threshold"
+CONF_DISCOVERY_NETWORK = "discovery_network"
 
 # Options for CONF_NOTIFICATIONS_PROTOCOL
 CONF_OPT_NOTIFICATIONS_LOCAL = "local"
 CONF_OPT_NOTIFICATIONS_CLOUD = "cloud"
 CONF_OPT_NOTIFICATIONS_CLOUD_UPSTREAM = "cloud_upstream"
 
+# Options for CONF_ENTITY_PROFILE
+CONF_OPT_ENTITY_PROFILE_MINIMAL = "minimal"
+CONF_OPT_ENTITY_PROFILE_STANDARD = "standard"
+CONF_OPT_ENTITY_PROFILE_FULL = "full"
+
+# Families of entities created for each panel sensor
+SENSOR_ENTITY_FAMILY_STATE = "state"
+SENSOR_ENTITY_FAMILY_ATTRIBUTES = "attributes"
+SENSOR_ENTITY_FAMILY_FLAGS = "flags"
+SENSOR_ENTITY_FAMILY_ALERT_MODE = "alert_mode"
+SENSOR_ENTITY_FAMILY_RENAME = "rename"
+SENSOR_ENTITY_FAMILY_DELETE = "delete"
+# Panel-level editor for configuration of the selected sensor, alternative to
+# per-sensor configuration entities
+SENSOR_ENTITY_FAMILY_EDITOR = "editor"
+
+# Per-sensor entity families created for each entity profile
+ENTITY_PROFILE_SENSOR_FAMILIES = {
+    CONF_OPT_ENTITY_PROFILE_MINIMAL: frozenset({
+        SENSOR_ENTITY_FAMILY_STATE,
+        SENSOR_ENTITY_FAMILY_EDITOR,
+    }),
+    CONF_OPT_ENTITY_PROFILE_STANDARD: frozenset({
+        SENSOR_ENTITY_FAMILY_STATE,
+        SENSOR_ENTITY_FAMILY_ATTRIBUTES,
+        SENSOR_ENTITY_FAMILY_EDITOR,
+    }),
+    CONF_OPT_ENTITY_PROFILE_FULL: frozenset({
+        SENSOR_ENTITY_FAMILY_STATE,
+        SENSOR_ENTITY_FAMILY_ATTRIBUTES,
+        SENSOR_ENTITY_FAMILY_FLAGS,
+        SENSOR_ENTITY_FAMILY_ALERT_MODE,
+        SENSOR_ENTITY_FAMILY_RENAME,
+        SENSOR_ENTITY_FAMILY_DELETE,
+        SENSOR_ENTITY_FAMILY_EDITOR,
+    }),
+}
+
 # Data update interval
 SCAN_INTERVAL = timedelta(seconds=30)
 
@@ -36,3 +80,97 @@ NOTIFICATIONS_PROTOCOL_SENSOR_UNRECORDED_ATTRIBUTES = frozenset({
     NOTIFICATIONS_PROTOCOL_SENSOR_LAST_DEVICE_TIMESTAMP_ATTR,
     NOTIFICATIONS_PROTOCOL_SENSOR_LAST_UPSTREAM_TIMESTAMP_ATTR,
 })
+
+# Rolling window for metrics of notifications observed over notifications
+# protocol
+NOTIFICATION_METRICS_WINDOW = timedelta(minutes=15)
+# Maximum number of notifications tracked within the window, to bound the
+# memory
+NOTIFICATION_METRICS_MAX_SAMPLES = 1000
+# Unit of measurement for notification rate sensors
+NOTIFICATIONS_PER_MINUTE = 'notifications/min'
+
+# Events fired on Home Assistant event bus
+EVENT_ALARM = f"{DOMAIN}_alarm"
+EVENT_ARMDISARM = f"{DOMAIN}_armdisarm"
+EVENT_SENSOR = f"{DOMAIN}_sensor"
+EVENT_SLOW_CALLBACK = f"{DOMAIN}_slow_callback"
+# Data of the events
+EVENT_ATTR_GUID = 'guid'
+EVENT_ATTR_SENSOR_IDX = 'sensor_idx'
+EVENT_ATTR_SENSOR_NAME = 'sensor_name'
+EVENT_ATTR_ENTITY_ID = 'entity_id'
+EVENT_ATTR_STATE = 'state'
+EVENT_ATTR_ENTITY_CLASS = 'entity_class'
+EVENT_ATTR_CALLBACK = 'callback'
+EVENT_ATTR_DURATION = 'duration'
+# Window to suppress duplicate events within, e.g. delivered over both local
+# and cloud paths
+EVENT_DEDUP_WINDOW = timedelta(seconds=5)
+
+# Local store of panel history
+HISTORY_STORE_VERSION = 1
+# Delay to coalesce writes to the store
+HISTORY_SAVE_DELAY = timedelta(seconds=10)
+# Interval to synchronize the history from the panel at
+HISTORY_SYNC_INTERVAL = timedelta(minutes=5)
+# Number of history entries fetched from the panel at once
+HISTORY_SYNC_PAGE_SIZE = 20
+# Maximum number of history entries fetched during single synchronization,
+# limits the time initial one takes
+HISTORY_SYNC_MAX_RECORDS = 200
+# The history action serves the stored history, synchronizing it first only
+# if the last synchronization is older than the age
+HISTORY_SERVICE_MAX_AGE = timedelta(seconds=60)
+# Retention limits of the history stored
+HISTORY_MAX_RECORDS = 1000
+HISTORY_MAX_AGE = timedelta(days=30)
+
+# Simulation of alerts from panel history. Polling interval is reset to the
+# minimum once new history entries are found, and grows by the factor up to
+# the maximum while there are none
+SIMULATION_INTERVAL_MIN = timedelta(seconds=5)
+SIMULATION_INTERVAL_MAX = timedelta(seconds=60)
+SIMULATION_INTERVAL_FACTOR = 2
+# Maximum number of requests to the panel simulation could send within the
+# window
+SIMULATION_PACKET_BUDGET = 240
+SIMULATION_PACKET_BUDGET_WINDOW = timedelta(hours=1)
+
+# Networks swept for the panels are limited in size, with the number of
+# hosts queried concurrently, each for the timeout
+DISCOVERY_SWEEP_MAX_HOSTS = 1024
+DISCOVERY_SWEEP_CONCURRENCY = 64
+DISCOVERY_SWEEP_HOST_TIMEOUT = timedelta(seconds=1)
+
+# Diagnostics are served from the data the integration holds, in live mode
+# the sections older than the age are fetched from the panel instead - up to
+# the number of those concurrently, each limited by the timeout
+DIAGNOSTICS_LIVE_MAX_AGE = timedelta(seconds=60)
+DIAGNOSTICS_CONCURRENCY = 4
+DIAGNOSTICS_SECTION_TIMEOUT = timedelta(seconds=15)
+# Number of most recent history entries included into diagnostics
+DIAGNOSTICS_HISTORY_ENTRIES = 50
+
+# Number of most recent samples performance metrics keep durations for
+PERFORMANCE_MAX_SAMPLES = 100
+
+# Number of records the in-memory trace of hot-path events holds
+TRACE_BUFFER_SIZE = 1024
+
+# Number of hotspots summarized once the integration has been profiled
+PROFILE_HOTSPOTS = 10
+
+# Services
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_GET_TRACE = "get_trace"
+SERVICE_PROFILE = "profile"
+# Fields of the services
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START_TIME = "start_time"
+ATTR_END_TIME = "end_time"
+ATTR_EVENT_TYPE = "event_type"
+ATTR_SENSOR_IDX = "sensor_idx"
+ATTR_LIMIT = "limit"
+ATTR_CURSOR = "cursor"
+ATTR_DURATION = "duration"
@@ -4,10 +4,11 @@
 Data update coordinator for the `gs-alarm` integration.
 """
 from __future__ import annotations
-from typing import List, TYPE_CHECKING, Optional
+from typing import Any, Dict, List, TYPE_CHECKING, Optional
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from pyg90alarm import (
     G90Alarm, G90Error, G90TimeoutError,
@@ -16,12 +17,33 @@ from pyg90alarm import (
     G90SiaConfig, G90CidConfig,
 )
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.helpers import (
+    device_registry as dr, entity_registry as er,
+)
+from homeassistant.helpers.restore_state import (
+    async_get as async_get_restore_state_data,
+)
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed
 )
-from .const import DOMAIN, SCAN_INTERVAL
+from .const import (
+    DOMAIN, SCAN_INTERVAL, CONF_RESTORE_STATE_AT_STARTUP,
+    CONF_SLOW_CALLBACK_THRESHOLD,
+)
+from .id_cache import GsAlarmIDCache
+from .callbacks import GsAlarmCallbacks
+from .entity_profile import GsAlarmEntityProfile
+from .sensor_editor import GsAlarmSensorEditor
+from .notification_metrics import GsAlarmNotificationMetrics
+from .performance import GsAlarmPerformanceMetrics
+from .trace import GsAlarmTrace
+from .panel_index import GsAlarmPanelIndex
+from .events import GsAlarmEvents
+from .history import GsAlarmHistory
+from .simulation import GsAlarmAlertSimulation
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
 
@@ -46,6 +68,9 @@ class GsAlarmData:
     cid_config: Optional[G90CidConfig]
     last_device_packet_time: Optional[datetime]
     last_upstream_packet_time: Optional[datetime]
+    # Time the fields above have been fetched from the panel at, by field
+    # name
+    fetched_at: Dict[str, datetime] = field(default_factory=dict)
 
 
 class GsAlarmCoordinator(DataUpdateCoordinator[GsAlarmData]):
@@ -57,6 +82,7 @@ class GsAlarmCoordinator(DataUpdateCoordinator[GsAlarmData]):
     :param g90_client: Instance of the G90Alarm client
     """
     # pylint: disable=too-many-arguments, too-many-positional-arguments
+    # pylint: disable=too-many-instance-attributes
     def __init__(
         self, hass: HomeAssistant, entry: GsAlarmConfigEntry,
         g90_client: G90Alarm
@@ -72,13 +98,198 @@ class GsAlarmCoordinator(DataUpdateCoordinator[GsAlarmData]):
             update_interval=SCAN_INTERVAL,
         )
         self.client = g90_client
+        # In-memory trace of hot-path events, always recorded
+        self.trace = GsAlarmTrace()
+        # Runtime performance metrics, always collected
+        self.performance = GsAlarmPerformanceMetrics(self.trace)
+        self.apply_slow_callback_threshold()
+        # Callbacks registered with `pyg90alarm`
+        self.callbacks = GsAlarmCallbacks(self.performance)
+        # Cache for unique/entity IDs and device info of the entities
+        self.id_cache = GsAlarmIDCache()
+        # Index of panel's sensors and relays, along with their entities
+        self.panel_index = GsAlarmPanelIndex()
+        self.callbacks.add(
+            self.client.sensor_list_change_callback,
+            self.panel_index.sensor_list_change_callback
+        )
+        self.callbacks.add(
+            self.client.device_list_change_callback,
+            self.panel_index.device_list_change_callback
+        )
+        self.callbacks.add(
+            self.client.alarm_callback, self.panel_index.alarm_callback
+        )
+        # Per-sensor entities created according to the entity profile
+        self.entity_profile = GsAlarmEntityProfile(self)
+        self.callbacks.add(
+            self.client.sensor_list_change_callback,
+            self.entity_profile.sensor_list_change_callback
+        )
+        # Shared state of the panel-level sensor editor
+        self.sensor_editor = GsAlarmSensorEditor(self)
+        # Last states of the entities prefetched at startup, by entity ID
+        self.last_states: Dict[str, Optional[State]] = {}
+        # Metrics of packets received over notifications protocol, sampled
+        # as notifications arrive
+        self.notification_metrics = GsAlarmNotificationMetrics()
+        self.callbacks.add(
+            self.client.sensor_callback, self.record_packet_times
+        )
+        self.callbacks.add(
+            self.client.armdisarm_callback, self.record_packet_times
+        )
+        self.callbacks.add(
+            self.client.alarm_callback, self.record_packet_times
+        )
+        # Panel history synchronized into the local store
+        self.history = GsAlarmHistory(self)
+        # Simulation of alerts from the history, for the setups with no
+        # notifications from the panel
+        self.simulation = GsAlarmAlertSimulation(self)
+        # Events fired on HASS event bus for the panel notifications
+        self.events = GsAlarmEvents(self)
+        self.callbacks.add(
+            self.client.alarm_callback, self.events.alarm_callback
+        )
+        self.callbacks.add(
+            self.client.armdisarm_callback, self.events.armdisarm_callback
+        )
+        self.callbacks.add(
+            self.client.sensor_callback, self.events.sensor_callback
+        )
+        self.performance.async_add_slow_callback_listener(
+            self.events.slow_callback
+        )
+
+    @callback
+    def apply_slow_callback_threshold(self) -> None:
+        """
+        Apply the threshold of slow callbacks detection from the options,
+        zero disables it.
+        """
+        if self.config_entry is None:
+            return
+        self.performance.slow_callback_threshold = timedelta(
+            milliseconds=self.config_entry.options.get(
+                CONF_SLOW_CALLBACK_THRESHOLD, 0
+            )
+        )
+
+    @callback
+    def record_packet_times(self, *_args: Any) -> None:
+        """
+        Record timestamps of last packets received into the notification
+        metrics.
+        """
+        self.notification_metrics.record(
+            self.client.last_device_packet_time,
+            self.client.last_upstream_packet_time
+        )
+
+    @callback
+    def prefetch_last_states(self) -> None:
+        """
+        Prefetch last recorded states for all entities of the config entry in
+        a single pass over the entity registry, so the entities restoring
+        their states don't need to look them up individually.
+
+        Nothing is prefetched if the state restoration at startup is disabled.
+        """
+        self.last_states = {}
+        if self.config_entry is None or not self.config_entry.options.get(
+            CONF_RESTORE_STATE_AT_STARTUP, True
+        ):
+            _LOGGER.debug(
+                'Restore state at startup is disabled, skipping prefetch'
+            )
+            return
+
+        stored_states = async_get_restore_state_data(self.hass).last_states
+        for entity_entry in er.async_entries_for_config_entry(
+            er.async_get(self.hass), self.config_entry.entry_id
+        ):
+            stored_state = stored_states.get(entity_entry.entity_id)
+            # Entities registered but having no recorded state are stored as
+            # well, so they don't attempt to look it up later
+            self.last_states[entity_entry.entity_id] = (
+                stored_state.state if stored_state else None
+            )
+
+        _LOGGER.debug(
+            'Prefetched last states for %s entities', len(self.last_states)
+        )
+
+    @callback
+    def remove_unavailable_entities(self, data: GsAlarmData) -> None:
+        """
+        Remove HASS devices, along with their entities, of the sensors and
+        relays no longer present on the panel (e.g. deleted using its
+        keyboard).
+
+        The `pyg90alarm` package doesn't invoke list change callbacks for
+        those, but marks them as unavailable instead.
+
+        :param data: The coordinator data to process.
+        """
+        device_registry = dr.async_get(self.hass)
+        entity_registry = er.async_get(self.hass)
+
+        panel_entities: List[G90Sensor | G90Device] = [
+            *data.sensors, *data.devices
+        ]
+        for panel_entity in panel_entities:
+            # Entity ID of the primary HASS entity is stored as extra data,
+            # which is reset once the entity is processed so it is done only
+            # once
+            if not panel_entity.is_unavailable or not panel_entity.extra_data:
+                continue
+
+            _LOGGER.debug(
+                "Removing entities of '%s' (idx %s) no longer on the panel",
+                panel_entity.name, panel_entity.index
+            )
+            entity_entry = entity_registry.async_get(panel_entity.extra_data)
+            panel_entity.extra_data = None
+            self.panel_index.remove(panel_entity)
+            self.id_cache.invalidate(panel_entity)
+            if isinstance(panel_entity, G90Sensor):
+                self.entity_profile.forget_sensor(panel_entity)
+
+            # The HASS device might have been removed already, e.g. when
+            # deleting the entity from Home Assistant, or by other node of
+            # multi-node relay
+            if entity_entry is None or entity_entry.device_id is None:
+                continue
+            if device_registry.async_get(entity_entry.device_id) is None:
+                continue
+            # Removing the device also removes all entities bound to it
+            device_registry.async_remove_device(entity_entry.device_id)
+
+    @callback
+    def replay_panel_entities(self) -> None:
+        """
+        Invoke list change callbacks for sensors and relays already known to
+        the client, as if those have just been added.
+
+        Used when the client is reused across reloads of the config entry, so
+        the entities of those get created by the platforms set up anew.
+        """
+        for sensor in self.data.sensors:
+            if not sensor.is_unavailable:
+                self.client.sensor_list_change_callback.invoke(sensor, True)
+        for device in self.data.devices:
+            if not device.is_unavailable:
+                self.client.device_list_change_callback.invoke(device, True)
 
     async def get_sia_config(self) -> Optional[G90SiaConfig]:
         """
         Get the SIA configuration.
         """
         try:
-            return await self.client.sia_config()
+            return await self.performance.async_timed_command(
+                'sia_config', self.client.sia_config()
+            )
         except ValueError:
             _LOGGER.debug("Panel does not support SIA configuration")
             return None
@@ -88,7 +299,9 @@ class GsAlarmCoordinator(DataUpdateCoordinator[GsAlarmData]):
         Get the CID configuration.
         """
         try:
-            return await self.client.cid_config()
+            return await self.performance.async_timed_command(
+                'cid_config', self.client.cid_config()
+            )
         except ValueError:
             _LOGGER.debug("Panel does not support CID configuration")
             return None
@@ -108,13 +321,17 @@ class GsAlarmCoordinator(DataUpdateCoordinator[GsAlarmData]):
         there will lead to complications, hence a separate method is used.
         """
         _LOGGER.info("Initializing coordinator with essential data")
-        host_info = await self.client.get_host_info()
-        host_status = await self.client.get_host_status()
-        host_config = await self.client.host_config()
-        net_config = await self.client.net_config()
-        alarm_phones = await self.client.alarm_phones()
+        timed = self.performance.async_timed_command
+        host_info = await timed('get_host_info', self.client.get_host_info())
+        host_status = await timed(
+            'get_host_status', self.client.get_host_status()
+        )
+        host_config = await timed('host_config', self.client.host_config())
+        net_config = await timed('net_config', self.client.net_config())
+        alarm_phones = await timed('alarm_phones', self.client.alarm_phones())
         sia_config = await self.get_sia_config()
         cid_config = await self.get_cid_config()
+        fetched_at = dt_util.utcnow()
         self.async_set_updated_data(
             GsAlarmData(
                 sensors=[],
@@ -129,33 +346,81 @@ class GsAlarmCoordinator(DataUpdateCoordinator[GsAlarmData]):
                 cid_config=cid_config,
                 last_device_packet_time=None,
                 last_upstream_packet_time=None,
+                # Sensors, relays and alert configuration aren't fetched yet
+                fetched_at=dict.fromkeys((
+                    'host_info', 'host_status', 'host_config', 'net_config',
+                    'alarm_phones', 'sia_config', 'cid_config',
+                ), fetched_at),
             )
         )
         _LOGGER.debug("Coordinator data: %s", self.data)
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update the listeners, recording the time spent in the event loop.
+        """
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.performance.record_loop_time(
+            'coordinator_listeners', time.perf_counter() - started
+        )
+
     async def update(self) -> GsAlarmData:
         """
-        Update the coordinator data.
+        Update the coordinator data, recording its duration.
+        """
+        started = time.monotonic()
+        success = False
+        try:
+            data = await self._update()
+            success = True
+            return data
+        finally:
+            self.performance.record_poll(time.monotonic() - started, success)
+
+    async def _update(self) -> GsAlarmData:
+        """
+        Fetch the coordinator data from the panel.
         """
         _LOGGER.debug("Updating coordinator")
+        timed = self.performance.async_timed_command
         try:
             data = GsAlarmData(
-                sensors=await self.client.get_sensors(),
-                devices=await self.client.get_devices(),
-                host_info=await self.client.get_host_info(),
-                host_status=await self.client.get_host_status(),
-                alert_config_flags=await self.client.get_alert_config(),
-                host_config=await self.client.host_config(),
-                net_config=await self.client.net_config(),
-                alarm_phones=await self.client.alarm_phones(),
+                sensors=await timed('get_sensors', self.client.get_sensors()),
+                devices=await timed('get_devices', self.client.get_devices()),
+                host_info=await timed(
+                    'get_host_info', self.client.get_host_info()
+                ),
+                host_status=await timed(
+                    'get_host_status', self.client.get_host_status()
+                ),
+                alert_config_flags=await timed(
+                    'get_alert_config', self.client.get_alert_config()
+                ),
+                host_config=await timed(
+                    'host_config', self.client.host_config()
+                ),
+                net_config=await timed('net_config', self.client.net_config()),
+                alarm_phones=await timed(
+                    'alarm_phones', self.client.alarm_phones()
+                ),
                 sia_config=await self.get_sia_config(),
                 cid_config=await self.get_cid_config(),
                 last_device_packet_time=self.client.last_device_packet_time,
                 last_upstream_packet_time=(
                     self.client.last_upstream_packet_time
                 ),
+                # Evaluated once all of the above have been fetched
+                fetched_at=dict.fromkeys((
+                    'sensors', 'devices', 'host_info', 'host_status',
+                    'alert_config_flags', 'host_config', 'net_config',
+                    'alarm_phones', 'sia_config', 'cid_config',
+                ), dt_util.utcnow()),
             )
             _LOGGER.debug("Coordinator data: %s", data)
+            self.record_packet_times()
+            self.remove_unavailable_entities(data)
             return data
         except G90TimeoutError as exc:
             raise UpdateFailed(
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Deduplication of panel events for `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.util import dt as dt_util
+
+from .const import EVENT_DEDUP_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GsAlarmEventDedup:
+    # pylint: disable=too-few-public-methods
+    """
+    Suppresses duplicate events, e.g. same notification delivered over both
+    local and cloud paths, or the state just notified re-applied by the
+    coordinator update.
+
+    The event is considered duplicate if the last one of the same type and
+    for the same sensor has had the same state, and has been received within
+    the window. Each consumer of the events is expected to use its own
+    instance, so the duplicates are tracked independently for those.
+
+    :param window: Duration of the deduplication window.
+    """
+    def __init__(self, window: timedelta = EVENT_DEDUP_WINDOW) -> None:
+        self._window = window
+        self._last_events: Dict[
+            Tuple[str, Optional[int]], Tuple[Any, datetime]
+        ] = {}
+
+    def is_duplicate(
+        self, event_type: str, sensor_idx: Optional[int], state: Any
+    ) -> bool:
+        """
+        Checks if the event is duplicate of the last one, recording it
+        otherwise.
+
+        :param event_type: Type of the event.
+        :param sensor_idx: Index of the sensor, `None` for panel-wide events.
+        :param state: State the event carries.
+        :return: `True` if the event is duplicate.
+        """
+        now = dt_util.utcnow()
+        key = (event_type, sensor_idx)
+        last_event = self._last_events.get(key)
+        if last_event is not None:
+            last_state, last_time = last_event
+            if last_state == state and now - last_time < self._window:
+                _LOGGER.debug(
+                    "Suppressing duplicate event '%s' (sensor idx %s,"
+                    " state %s)", event_type, sensor_idx, state
+                )
+                return True
+
+        # The window starts from the first event, so the duplicates don't
+        # extend it
+        self._last_events[key] = (state, now)
+        return False
+
+    def forget(self, event_type: str) -> None:
+        """
+        Forget the events of the type, so next ones aren't considered
+        duplicates - e.g. the alarms once the panel is armed or disarmed, since
+        the sensor could trigger the alarm again right after.
+
+        :param event_type: Type of the events.
+        """
+        for key in [key for key in self._last_events if key[0] == event_type]:
+            del self._last_events[key]
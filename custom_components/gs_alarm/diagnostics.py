@@ -4,17 +4,30 @@
 Diagnostics support for the `gs-alarm` integration.
 """
 from __future__ import annotations
-from typing import Any, cast, TYPE_CHECKING
+from typing import (
+    Any, Awaitable, Callable, Dict, Optional, Tuple, cast, TYPE_CHECKING,
+)
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
 import logging
+import time
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers import entity_registry as er
 from homeassistant.components.diagnostics.util import async_redact_data
+from homeassistant.util import dt as dt_util
 
 from pyg90alarm import G90Error, G90TimeoutError
 
+from .const import (
+    CONF_LIVE_DIAGNOSTICS, DIAGNOSTICS_LIVE_MAX_AGE, DIAGNOSTICS_CONCURRENCY,
+    DIAGNOSTICS_SECTION_TIMEOUT, DIAGNOSTICS_HISTORY_ENTRIES,
+)
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
+    from .coordinator import GsAlarmCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 # Redact the properties could contain sensitive information
@@ -29,6 +42,212 @@ TO_REDACT = [
 ]
 
 
+def _as_dict(value: Any) -> Any:
+    """
+    Dictionary representation of the section data.
+    """
+    return value._asdict() if value is not None else None
+
+
+def _as_dict_list(value: Any) -> Any:
+    """
+    Dictionary representations of the section data items.
+    """
+    return [x._asdict() for x in value]
+
+
+@dataclass(frozen=True)
+class DiagnosticsSection:
+    """
+    Section of the panel data in diagnostics.
+
+    :param cached: Provides the data the integration holds.
+    :param fetched_at: Provides the time the data held has been fetched at
+     from the panel, `None` if it hasn't been.
+    :param fetch: Fetches the data from the panel.
+    :param serialize: Converts the data for diagnostics, `None` result
+     indicates the panel doesn't support the section.
+    """
+    cached: Callable[[GsAlarmCoordinator], Any]
+    fetched_at: Callable[[GsAlarmCoordinator], Optional[datetime]]
+    fetch: Callable[[GsAlarmCoordinator], Awaitable[Any]]
+    serialize: Callable[[Any], Any] = _as_dict
+
+
+def _data_section(
+    field: str, fetch: Callable[[GsAlarmCoordinator], Awaitable[Any]],
+    serialize: Callable[[Any], Any] = _as_dict
+) -> DiagnosticsSection:
+    """
+    Section of diagnostics held by the coordinator data.
+
+    :param field: Field of the coordinator data.
+    :param fetch: Fetches the data from the panel.
+    :param serialize: Converts the data for diagnostics.
+    :return: The section.
+    """
+    return DiagnosticsSection(
+        cached=lambda coordinator: getattr(coordinator.data, field),
+        fetched_at=lambda coordinator: coordinator.data.fetched_at.get(field),
+        fetch=fetch,
+        serialize=serialize,
+    )
+
+
+async def _fetch_history(coordinator: GsAlarmCoordinator) -> Any:
+    """
+    Synchronize the history from the panel, only the entries not yet in the
+    local store are fetched.
+    """
+    await coordinator.history.async_sync()
+    return coordinator.history.entries[:DIAGNOSTICS_HISTORY_ENTRIES]
+
+
+# Sections of the panel data in diagnostics
+SECTIONS: Dict[str, DiagnosticsSection] = {
+    'history': DiagnosticsSection(
+        cached=lambda coordinator: (
+            coordinator.history.entries[:DIAGNOSTICS_HISTORY_ENTRIES]
+        ),
+        fetched_at=lambda coordinator: coordinator.history.synced_at,
+        fetch=_fetch_history,
+        serialize=_as_dict_list,
+    ),
+    'sensors': _data_section(
+        'sensors', lambda coordinator: coordinator.client.get_sensors(),
+        _as_dict_list
+    ),
+    'devices': _data_section(
+        'devices', lambda coordinator: coordinator.client.get_devices(),
+        _as_dict_list
+    ),
+    'host_info': _data_section(
+        'host_info', lambda coordinator: coordinator.client.get_host_info()
+    ),
+    'host_status': _data_section(
+        'host_status',
+        lambda coordinator: coordinator.client.get_host_status()
+    ),
+    'alert_config': _data_section(
+        'alert_config_flags',
+        lambda coordinator: coordinator.client.get_alert_config(), repr
+    ),
+    'host_config': _data_section(
+        'host_config', lambda coordinator: coordinator.client.host_config()
+    ),
+    'net_config': _data_section(
+        'net_config', lambda coordinator: coordinator.client.net_config()
+    ),
+    'alarm_phones': _data_section(
+        'alarm_phones', lambda coordinator: coordinator.client.alarm_phones()
+    ),
+    'sia_config': _data_section(
+        'sia_config', lambda coordinator: coordinator.get_sia_config()
+    ),
+    'cid_config': _data_section(
+        'cid_config', lambda coordinator: coordinator.get_cid_config()
+    ),
+}
+
+
+async def _async_collect_section(
+    coordinator: GsAlarmCoordinator, name: str, live: bool,
+    semaphore: asyncio.Semaphore
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Collect the section of diagnostics.
+
+    The data the integration holds is used, unless in live mode and it is
+    older than the maximum age - then it is fetched from the panel, limited
+    by the timeout. The data held is used if fetching fails.
+
+    :param coordinator: The coordinator to use.
+    :param name: Name of the section.
+    :param live: Whether the live mode is enabled.
+    :param semaphore: Semaphore limiting the sections fetched concurrently.
+    :return: The section data (`None` if unavailable), and its collection
+     status.
+    """
+    section = SECTIONS[name]
+    fetched_at = section.fetched_at(coordinator)
+    status = 'ok'
+    source = 'cache'
+    duration = None
+    error: Optional[str] = None
+    data = None
+
+    if live and (
+        fetched_at is None
+        or dt_util.utcnow() - fetched_at > DIAGNOSTICS_LIVE_MAX_AGE
+    ):
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                async with asyncio.timeout(
+                    DIAGNOSTICS_SECTION_TIMEOUT.total_seconds()
+                ):
+                    data = section.serialize(await section.fetch(coordinator))
+                source = 'live'
+                fetched_at = dt_util.utcnow()
+            except (G90Error, G90TimeoutError) as exc:
+                status = 'error'
+                error = repr(exc)
+            except TimeoutError:
+                status = 'timeout'
+            duration = round(time.monotonic() - started, 3)
+
+        if source != 'live':
+            _LOGGER.warning(
+                "Unable to gather '%s' in diagnostics, using data held"
+                " instead: %s", name, error or status
+            )
+
+    if source == 'cache':
+        data = section.serialize(section.cached(coordinator))
+
+    if data is None and status == 'ok':
+        status = 'unsupported'
+    return data, {
+        'status': status,
+        'source': source,
+        'fetched_at': fetched_at.isoformat() if fetched_at else None,
+        'duration': duration,
+        'error': error,
+    }
+
+
+def _performance(
+    hass: HomeAssistant, entry: GsAlarmConfigEntry
+) -> Dict[str, Any]:
+    """
+    Runtime performance metrics of the integration.
+
+    :param hass: Home Assistant instance.
+    :param entry: The config entry.
+    :return: The metrics.
+    """
+    coordinator = entry.runtime_data
+    notification_metrics = coordinator.notification_metrics
+    entities: Dict[str, int] = {}
+    for entity_entry in er.async_entries_for_config_entry(
+        er.async_get(hass), entry.entry_id
+    ):
+        domain = entity_entry.domain
+        entities[domain] = entities.get(domain, 0) + 1
+
+    return {
+        **coordinator.performance.as_dict(),
+        'entities': dict(sorted(entities.items())),
+        'callbacks': len(coordinator.callbacks),
+        'device_notifications_per_minute': (
+            notification_metrics.device_notifications_per_minute
+        ),
+        'upstream_notifications_per_minute': (
+            notification_metrics.upstream_notifications_per_minute
+        ),
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: GsAlarmConfigEntry
 ) -> dict[str, Any]:
@@ -41,76 +260,45 @@ async def async_get_config_entry_diagnostics(
 
 
 async def async_get_device_diagnostics(
-    _hass: HomeAssistant, entry: GsAlarmConfigEntry, device: DeviceEntry
+    hass: HomeAssistant, entry: GsAlarmConfigEntry, device: DeviceEntry
 ) -> dict[str, Any]:
     """
     Returns diagnostics for the device entry.
+
+    The panel data is served from the one the integration holds, so
+    diagnostics don't add load to the panel. In live mode the sections not
+    recent enough are fetched from the panel concurrently, the failure or
+    timeout of any of those doesn't affect others. Source, fetch time and
+    status of each section are recorded.
     """
+    coordinator = entry.runtime_data
+    live = entry.options.get(CONF_LIVE_DIAGNOSTICS, False)
+    semaphore = asyncio.Semaphore(DIAGNOSTICS_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _async_collect_section(coordinator, name, live, semaphore)
+        for name in SECTIONS
+    ))
 
-    try:
-        g90_client = entry.runtime_data.client
-
-        alarm_panel_data = {
-            'history': [
-                x._asdict()
-                # 50 history records should be the maximum for most of the
-                # panels
-                for x in await g90_client.history(count=50)
-            ],
-            'sensors': [
-                x._asdict()
-                for x in await g90_client.get_sensors()
-            ],
-            'devices': [
-                x._asdict()
-                for x in await g90_client.get_devices()
-            ],
-            'host_info': (await g90_client.get_host_info())._asdict(),
-            'host_status': (await g90_client.get_host_status())._asdict(),
-            'alert_config': repr(await g90_client.get_alert_config()),
-            'host_config': (await g90_client.host_config())._asdict(),
-            'net_config': (await g90_client.net_config())._asdict(),
-            'alarm_phones': (await g90_client.alarm_phones())._asdict(),
-
-        }
-
-        try:
-            sia_config = await g90_client.sia_config()
-            if sia_config:
-                alarm_panel_data['sia_config'] = sia_config._asdict()
-        except ValueError:
-            _LOGGER.debug("Panel does not support SIA configuration")
-        except (G90Error, G90TimeoutError) as exc:
-            _LOGGER.warning(
-                "Unable to gather sia_config in diagnostics: %s",
-                repr(exc)
-            )
+    alarm_panel_data = {}
+    sections = {}
+    for name, (data, section) in zip(SECTIONS, results):
+        sections[name] = section
+        if data is not None:
+            alarm_panel_data[name] = data
 
-        try:
-            cid_config = await g90_client.cid_config()
-            if cid_config:
-                alarm_panel_data['cid_config'] = cid_config._asdict()
-        except ValueError:
-            _LOGGER.debug("Panel does not support CID configuration")
-        except (G90Error, G90TimeoutError) as exc:
-            _LOGGER.warning(
-                "Unable to gather cid_config in diagnostics: %s",
-                repr(exc)
-            )
+    result = {
+        'config_entry': entry.as_dict(),
+        'device_entry': device.dict_repr if device else None,
+        'alarm_panel': alarm_panel_data,
+        'sections': sections,
+        # Number of callbacks registered with `pyg90alarm`, expected to
+        # stay flat across reloads
+        'live_callbacks': len(coordinator.callbacks),
+        'notification_metrics': coordinator.notification_metrics.as_dict(),
+        'panel_index': coordinator.panel_index.as_dict(),
+        'alert_simulation': coordinator.simulation.as_dict(),
+        'performance': _performance(hass, entry),
+        'trace': coordinator.trace.as_list(),
+    }
 
-        result = {
-            'config_entry': entry.as_dict(),
-            'device_entry': device.dict_repr if device else None,
-            'alarm_panel': alarm_panel_data,
-        }
-
-        return cast(dict[str, Any], async_redact_data(result, TO_REDACT))
-    # Errors raised by `pyg90alarm` are treated as non-terminating, just
-    # resulting in error response
-    except (G90Error, G90TimeoutError) as exc:
-        msg = (
-            "Unable to gather diagnostics data for"
-            f" panel '{entry.title}': {repr(exc)}"
-        )
-        _LOGGER.error(msg)
-        return {'error': msg}
+    return cast(dict[str, Any], async_redact_data(result, TO_REDACT))
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Discovery of alarm panels for `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional
+from ipaddress import IPv4Address, IPv4Network
+import asyncio
+import logging
+
+from pyg90alarm import G90Alarm, G90Error
+from pyg90alarm.const import REMOTE_PORT
+from pyg90alarm.local.discovery import G90Discovery, G90DiscoveredDevice
+
+from .const import DISCOVERY_SWEEP_CONCURRENCY, DISCOVERY_SWEEP_HOST_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_discover_host(
+    host: IPv4Address, semaphore: asyncio.Semaphore
+) -> List[G90DiscoveredDevice]:
+    """
+    Discover the panel at the host, with the request sent to it directly.
+
+    :param host: Address of the host.
+    :param semaphore: Semaphore limiting the hosts queried concurrently.
+    :return: The panel discovered at the host, if any.
+    """
+    async with semaphore:
+        try:
+            cmd = await G90Discovery(
+                port=REMOTE_PORT, host=str(host),
+                timeout=DISCOVERY_SWEEP_HOST_TIMEOUT.total_seconds()
+            ).process()
+        except (OSError, G90Error) as exc:
+            # Unreachable hosts are expected while sweeping the network
+            _LOGGER.debug('Unable to query %s: %s', host, exc)
+            return []
+    return cmd.devices
+
+
+async def async_sweep_network(
+    network: IPv4Network
+) -> List[G90DiscoveredDevice]:
+    """
+    Discover the panels in the network by querying each of its hosts
+    directly, so that panels behind routers or on networks filtering
+    broadcasts are found as well.
+
+    :param network: The network to sweep.
+    :return: List of discovered devices.
+    """
+    _LOGGER.debug('Sweeping %s for devices', network)
+    semaphore = asyncio.Semaphore(DISCOVERY_SWEEP_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _async_discover_host(host, semaphore) for host in network.hosts()
+    ))
+    return [device for devices in results for device in devices]
+
+
+async def async_discover(
+    network: Optional[IPv4Network] = None
+) -> List[G90DiscoveredDevice]:
+    """
+    Discover the panels with the broadcast, and sweeping the network
+    concurrently if specified.
+
+    :param network: The network to sweep, if any.
+    :return: List of discovered devices, each panel listed once.
+    """
+    discoveries = [G90Alarm.discover()]
+    if network is not None:
+        discoveries.append(async_sweep_network(network))
+    results = await asyncio.gather(*discoveries)
+
+    # Panels responding to both the broadcast and the sweep are merged by
+    # their GUID
+    devices: Dict[str, G90DiscoveredDevice] = {}
+    for device in (device for found in results for device in found):
+        devices.setdefault(device.guid, device)
+    return list(devices.values())
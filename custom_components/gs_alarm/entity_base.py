@@ -99,6 +99,57 @@ class GsAlarmSwitchRestoreEntityBase(
         self.async_write_ha_state()
 
 
+class G90SensorEditorEntityBase(
+    CoordinatorEntity[GsAlarmCoordinator],
+    GSAlarmGenerateIDsCommonMixin
+):
+    """
+    Base class for entities of the panel-level sensor editor, which reflect
+    and change the configuration of the sensor selected in the editor.
+
+    :param coordinator: The coordinator to use.
+    :param id_name: The name to use in unique and entity IDs.
+    """
+    UNIQUE_ID_FMT = "{guid}_sensor_editor_{id_name}"
+    ENTITY_ID_FMT = "{guid}_sensor_editor_{id_name}"
+
+    def __init__(
+        self, coordinator: GsAlarmCoordinator, id_name: str
+    ) -> None:
+        super().__init__(coordinator)
+        # The entity is bound to the HASS device for the alarm panel itself
+        self._attr_device_info = self.generate_parent_device_info(coordinator)
+        self._attr_unique_id = self.generate_unique_id_with_placeholders(
+            coordinator, {'id_name': id_name}
+        )
+        self.entity_id = self.generate_entity_id_with_placeholders(
+            coordinator, {'id_name': id_name}
+        )
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_has_entity_name = True
+
+    async def async_added_to_hass(self) -> None:
+        """
+        Subscribe to target sensor changes of the editor.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.sensor_editor.async_add_listener(
+                self.async_write_ha_state
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """
+        The entity is available only if a sensor is selected in the editor.
+        """
+        return (
+            super().available
+            and self.coordinator.sensor_editor.target is not None
+        )
+
+
 class G90ConfigFieldBase(
     CoordinatorEntity[GsAlarmCoordinator],
     GSAlarmGenerateIDsCommonMixin
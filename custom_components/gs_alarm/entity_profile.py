@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Entity profile support for `gs-alarm` integration, controlling which
+families of per-sensor entities are created.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, List, Tuple
+import logging
+
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from pyg90alarm import G90Sensor
+
+from .const import (
+    CONF_ENTITY_PROFILE,
+    CONF_OPT_ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_SENSOR_FAMILIES,
+)
+if TYPE_CHECKING:
+    from .coordinator import GsAlarmCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SensorEntitiesFactory = Callable[[G90Sensor], List[Entity]]
+PanelEntitiesFactory = Callable[[], List[Entity]]
+
+
+class GsAlarmEntityProfile:
+    """
+    Tracks per-sensor entities by family, and creates/removes them according
+    to the entity profile selected in the config entry options.
+
+    Platforms register a factory for each family of per-sensor entities they
+    provide, the entities are then created for sensors added to the panel,
+    but only if the family is enabled by the current profile. Families of
+    panel-level entities (not tied to specific sensor) are supported
+    similarly. Changing the profile adds or removes the entities in place,
+    without reloading the config entry.
+
+    :param coordinator: The coordinator to use.
+    """
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        self._coordinator = coordinator
+        self._factories: Dict[
+            str, Tuple[SensorEntitiesFactory, AddEntitiesCallback]
+        ] = {}
+        # Entities created, by family and then by sensor index
+        self._entities: Dict[str, Dict[int, List[Entity]]] = {}
+        # Panel-level families could span multiple platforms, hence multiple
+        # factories per family
+        self._panel_factories: Dict[
+            str, List[Tuple[PanelEntitiesFactory, AddEntitiesCallback]]
+        ] = {}
+        self._panel_entities: Dict[str, List[Entity]] = {}
+        self._families = self._families_for_options()
+
+    @property
+    def profile(self) -> str:
+        """
+        Entity profile selected in the config entry options.
+        """
+        if self._coordinator.config_entry is None:
+            return CONF_OPT_ENTITY_PROFILE_FULL
+
+        profile = self._coordinator.config_entry.options.get(
+            CONF_ENTITY_PROFILE, CONF_OPT_ENTITY_PROFILE_FULL
+        )
+        if profile not in ENTITY_PROFILE_SENSOR_FAMILIES:
+            _LOGGER.warning(
+                "Unknown entity profile '%s', using '%s'",
+                profile, CONF_OPT_ENTITY_PROFILE_FULL
+            )
+            return CONF_OPT_ENTITY_PROFILE_FULL
+
+        return str(profile)
+
+    def _families_for_options(self) -> FrozenSet[str]:
+        """
+        Families of per-sensor entities enabled by the current profile.
+        """
+        return ENTITY_PROFILE_SENSOR_FAMILIES[self.profile]
+
+    def family_enabled(self, family: str) -> bool:
+        """
+        Whether the family of per-sensor entities is enabled.
+
+        :param family: The family to check.
+        :return: True if enabled, False otherwise.
+        """
+        return family in self._families
+
+    def register_family(
+        self, family: str, factory: SensorEntitiesFactory,
+        async_add_entities: AddEntitiesCallback
+    ) -> None:
+        """
+        Register the factory for the family of per-sensor entities.
+
+        :param family: The family the factory creates entities for.
+        :param factory: Callable returning entities for the sensor, could
+         return empty list if the sensor doesn't support those.
+        :param async_add_entities: Callback of the platform to add the
+         entities to.
+        """
+        self._factories[family] = (factory, async_add_entities)
+
+    def register_panel_family(
+        self, family: str, factory: PanelEntitiesFactory,
+        async_add_entities: AddEntitiesCallback
+    ) -> None:
+        """
+        Register the factory for the family of panel-level entities, those
+        are created immediately if the family is enabled.
+
+        :param family: The family the factory creates entities for.
+        :param factory: Callable returning the entities.
+        :param async_add_entities: Callback of the platform to add the
+         entities to.
+        """
+        self._panel_factories.setdefault(family, []).append(
+            (factory, async_add_entities)
+        )
+        if self.family_enabled(family):
+            self._add_panel_entities(family, factory, async_add_entities)
+
+    def _add_panel_entities(
+        self, family: str, factory: PanelEntitiesFactory,
+        async_add_entities: AddEntitiesCallback
+    ) -> None:
+        """
+        Create and add panel-level entities of the family.
+        """
+        entities = factory()
+        self._panel_entities.setdefault(family, []).extend(entities)
+        async_add_entities(entities)
+
+    async def _remove_entities(self, entities: List[Entity]) -> None:
+        """
+        Remove the entities from Home Assistant, keeping their entity registry
+        entries so the customizations made to them are retained if the entities
+        are created again.
+        """
+        for entity in entities:
+            if entity.hass is not None:
+                await entity.async_remove()
+
+    def _add_entities(self, family: str, sensor: G90Sensor) -> None:
+        """
+        Create and add entities of the family for the sensor.
+        """
+        family_entities = self._entities.setdefault(family, {})
+        # Entities have been already created for the sensor
+        if sensor.index in family_entities:
+            return
+
+        factory, async_add_entities = self._factories[family]
+        entities = factory(sensor)
+        if not entities:
+            return
+
+        family_entities[sensor.index] = entities
+        async_add_entities(entities)
+
+    def forget_sensor(self, sensor: G90Sensor) -> None:
+        """
+        Stop tracking entities created for the sensor removed from the panel,
+        so they could be created again if a sensor is added with same index.
+
+        :param sensor: The sensor removed.
+        """
+        for family_entities in self._entities.values():
+            family_entities.pop(sensor.index, None)
+
+    def sensor_list_change_callback(
+        self, sensor: G90Sensor, added: bool
+    ) -> None:
+        """
+        Create entities of enabled families for the sensor added to the panel.
+
+        :param sensor: The sensor added or removed.
+        :param added: Flag indicating if the sensor is added or removed.
+        """
+        if not added:
+            return
+
+        for family in self._factories:
+            if self.family_enabled(family):
+                self._add_entities(family, sensor)
+
+    async def async_apply_profile(self) -> None:
+        """
+        Apply the entity profile from the config entry options, adding or
+        removing per-sensor entities for families got enabled or disabled,
+        respectively.
+        """
+        families = self._families_for_options()
+        if families == self._families:
+            return
+
+        added = families - self._families
+        removed = self._families - families
+        self._families = families
+        _LOGGER.debug(
+            "Applying entity profile '%s': families added %s, removed %s",
+            self.profile, sorted(added), sorted(removed)
+        )
+
+        for family in removed:
+            for entities in self._entities.pop(family, {}).values():
+                await self._remove_entities(entities)
+            await self._remove_entities(self._panel_entities.pop(family, []))
+
+        for family in added:
+            for factory, async_add_entities in self._panel_factories.get(
+                family, []
+            ):
+                self._add_panel_entities(family, factory, async_add_entities)
+            if family not in self._factories:
+                continue
+            for sensor in self._coordinator.data.sensors:
+                self._add_entities(family, sensor)
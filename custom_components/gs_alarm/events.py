@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Events fired on Home Assistant event bus by `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import logging
+
+from homeassistant.core import callback
+
+from pyg90alarm import G90ArmDisarmTypes
+
+from .dedup import GsAlarmEventDedup
+from .const import (
+    EVENT_ALARM, EVENT_ARMDISARM, EVENT_SENSOR, EVENT_SLOW_CALLBACK,
+    EVENT_ATTR_GUID, EVENT_ATTR_SENSOR_IDX, EVENT_ATTR_SENSOR_NAME,
+    EVENT_ATTR_ENTITY_ID, EVENT_ATTR_STATE, EVENT_ATTR_ENTITY_CLASS,
+    EVENT_ATTR_CALLBACK, EVENT_ATTR_DURATION,
+)
+if TYPE_CHECKING:
+    from .coordinator import GsAlarmCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GsAlarmEvents:
+    """
+    Fires compact events for alarms, arming/disarming and sensor activity
+    reported by the panel, so automations could subscribe to those by event
+    type instead of listening to state changes of the entities.
+
+    :param coordinator: The coordinator to use.
+    """
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        self._coordinator = coordinator
+        self._dedup = GsAlarmEventDedup()
+
+    @property
+    def _guid(self) -> Optional[str]:
+        """
+        GUID of the panel the events are fired for.
+        """
+        if self._coordinator.data is None:
+            return None
+        return self._coordinator.data.host_info.host_guid
+
+    @callback
+    def _fire(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        """
+        Fire the event on Home Assistant event bus.
+
+        :param event_type: Type of the event.
+        :param event_data: Data of the event, GUID of the panel is added to it.
+        """
+        event_data = {EVENT_ATTR_GUID: self._guid, **event_data}
+        _LOGGER.debug("Firing event '%s': %s", event_type, event_data)
+        self._coordinator.hass.bus.async_fire(event_type, event_data)
+
+    @callback
+    def _fire_sensor_event(
+        self, event_type: str, sensor_idx: int, sensor_name: str,
+        extra_data: Dict[str, Any]
+    ) -> None:
+        """
+        Fire the event for panel sensor, along with ID of its primary entity.
+
+        :param event_type: Type of the event.
+        :param sensor_idx: Index of the sensor.
+        :param sensor_name: Name of the sensor.
+        :param extra_data: Additional data of the event.
+        """
+        self._fire(event_type, {
+            EVENT_ATTR_SENSOR_IDX: sensor_idx,
+            EVENT_ATTR_SENSOR_NAME: sensor_name,
+            EVENT_ATTR_ENTITY_ID: (
+                self._coordinator.panel_index.primary_sensor_entity_id(
+                    sensor_idx
+                )
+            ),
+            **extra_data
+        })
+
+    @callback
+    def alarm_callback(
+        self, sensor_idx: int, sensor_name: str, _extra_data: Any
+    ) -> None:
+        """
+        Invoked by `pyg90alarm` when alarm is triggered.
+
+        :param sensor_idx: Index of the sensor triggered the alarm.
+        :param sensor_name: Name of the sensor triggered the alarm.
+        :param _extra_data: Extra data of the sensor, unused.
+        """
+        if self._dedup.is_duplicate(EVENT_ALARM, sensor_idx, None):
+            return
+        self._fire_sensor_event(EVENT_ALARM, sensor_idx, sensor_name, {})
+
+    @callback
+    def armdisarm_callback(self, state: G90ArmDisarmTypes) -> None:
+        """
+        Invoked by `pyg90alarm` when the panel is armed or disarmed.
+
+        :param state: The new state of the panel.
+        """
+        if self._dedup.is_duplicate(EVENT_ARMDISARM, None, state):
+            return
+        # Alarms following the panel armed or disarmed are new ones
+        self._dedup.forget(EVENT_ALARM)
+        self._fire(EVENT_ARMDISARM, {
+            EVENT_ATTR_STATE: state.name.lower(),
+        })
+
+    @callback
+    def sensor_callback(
+        self, sensor_idx: int, sensor_name: str, occupancy: bool
+    ) -> None:
+        """
+        Invoked by `pyg90alarm` on sensor activity.
+
+        :param sensor_idx: Index of the sensor.
+        :param sensor_name: Name of the sensor.
+        :param occupancy: The sensor state.
+        """
+        if self._dedup.is_duplicate(EVENT_SENSOR, sensor_idx, occupancy):
+            return
+        self._fire_sensor_event(EVENT_SENSOR, sensor_idx, sensor_name, {
+            EVENT_ATTR_STATE: occupancy,
+        })
+
+    @callback
+    def slow_callback(
+        self, entity_class: str, callback_name: str, entity_id: Optional[str],
+        duration: float
+    ) -> None:
+        """
+        Invoked by the performance metrics when a callback ran longer than the
+        threshold.
+
+        :param entity_class: Class of the entity the callback belongs to.
+        :param callback_name: Name of the callback.
+        :param entity_id: ID of the entity, if any.
+        :param duration: The time spent in the callback, in seconds.
+        """
+        self._fire(EVENT_SLOW_CALLBACK, {
+            EVENT_ATTR_ENTITY_CLASS: entity_class,
+            EVENT_ATTR_CALLBACK: callback_name,
+            EVENT_ATTR_ENTITY_ID: entity_id,
+            EVENT_ATTR_DURATION: round(duration, 3),
+        })
@@ -0,0 +1,341 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Local store of panel history for `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime
+import asyncio
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from pyg90alarm import G90History, G90Error, G90TimeoutError, G90AlertTypes
+
+from .const import (
+    DOMAIN, HISTORY_STORE_VERSION, HISTORY_SAVE_DELAY, HISTORY_SYNC_PAGE_SIZE,
+    HISTORY_SYNC_MAX_RECORDS, HISTORY_MAX_RECORDS, HISTORY_MAX_AGE,
+)
+if TYPE_CHECKING:
+    from .coordinator import GsAlarmCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Compact representation of the history entry, the arguments to construct
+# `G90History` from
+HistoryRecordT = List[Any]
+# Listener for new history entries, invoked with those from older to newer
+HistoryListenerT = Callable[[List[G90History]], None]
+
+
+def history_store(hass: HomeAssistant, entry_id: str) -> Store[Dict[str, Any]]:
+    """
+    Store to persist panel history of the config entry in.
+
+    :param hass: Home Assistant instance.
+    :param entry_id: ID of the config entry.
+    :return: The store.
+    """
+    return Store(
+        hass, HISTORY_STORE_VERSION, f'{DOMAIN}.history.{entry_id}'
+    )
+
+
+class GsAlarmHistory:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Panel history synchronized incrementally into the local store.
+
+    The cursor (time stamp of the most recent history entry synchronized,
+    along with the entries having it) is kept, so only the entries newer than
+    it are fetched from the panel. The entries are persisted in the store,
+    limited by their number and age, so consumers of the history read it
+    from there instead of querying the panel.
+
+    :param coordinator: The coordinator to use.
+    """
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        self._coordinator = coordinator
+        self._store: Optional[Store[Dict[str, Any]]] = None
+        # History records, from older to newer
+        self._records: List[HistoryRecordT] = []
+        # Sequence number of the oldest record, the numbers of the rest follow
+        # it. Those are stable across the records added or dropped, so could
+        # be used as pagination cursor
+        self._first_seq = 0
+        self._cursor_time: Optional[int] = None
+        self._cursor_records: List[HistoryRecordT] = []
+        self._lock = asyncio.Lock()
+        # Indicates the changes not persisted yet
+        self._unsaved = False
+        self._listeners: List[HistoryListenerT] = []
+        # Time of the last successful synchronization
+        self.synced_at: Optional[datetime] = None
+        # Number of requests for history entries sent to the panel
+        self.requests_sent = 0
+
+    @staticmethod
+    def _record(entry: G90History) -> HistoryRecordT:
+        """
+        Compact representation of the history entry.
+
+        :param entry: The history entry.
+        :return: The record.
+        """
+        alert = entry.as_device_alert()
+        return [
+            alert.type, alert.event_id, alert.source, alert.state,
+            alert.zone_name, alert.unix_time, alert.other,
+        ]
+
+    @staticmethod
+    def _record_time(record: HistoryRecordT) -> int:
+        """
+        Time stamp of the history record.
+
+        :param record: The record.
+        :return: The time stamp (seconds since epoch).
+        """
+        return int(record[5])
+
+    @callback
+    def async_add_listener(self, listener: HistoryListenerT) -> CALLBACK_TYPE:
+        """
+        Add the listener for new history entries, invoked each time the
+        synchronization finds those.
+
+        :param listener: The listener.
+        :return: Callable to remove the listener.
+        """
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    async def async_load(self) -> None:
+        """
+        Load the history and the cursor from the store.
+        """
+        config_entry = self._coordinator.config_entry
+        if config_entry is None:
+            return
+
+        self._store = history_store(
+            self._coordinator.hass, config_entry.entry_id
+        )
+        data = await self._store.async_load()
+        if not data:
+            return
+
+        self._records = data.get('records', [])
+        self._first_seq = data.get('first_seq', 0)
+        cursor = data.get('cursor') or {}
+        self._cursor_time = cursor.get('unix_time')
+        self._cursor_records = cursor.get('records', [])
+        _LOGGER.debug(
+            'Loaded %s history records, cursor %s',
+            len(self._records), self._cursor_time
+        )
+
+    async def async_save(self) -> None:
+        """
+        Persist the changes pending the delayed save (if any) immediately,
+        e.g. when the config entry is unloaded.
+        """
+        if self._store is None or not self._unsaved:
+            return
+
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """
+        Data to persist in the store.
+        """
+        self._unsaved = False
+        return {
+            'cursor': {
+                'unix_time': self._cursor_time,
+                'records': self._cursor_records,
+            } if self._cursor_time is not None else None,
+            'first_seq': self._first_seq,
+            'records': self._records,
+        }
+
+    def _is_synced(self, record: HistoryRecordT) -> bool:
+        """
+        Checks if the record has been synchronized already, i.e. it isn't
+        newer than the cursor.
+
+        :param record: The record.
+        :return: `True` if the record has been synchronized.
+        """
+        if self._cursor_time is None:
+            return False
+
+        record_time = self._record_time(record)
+        return record_time < self._cursor_time or (
+            record_time == self._cursor_time
+            and record in self._cursor_records
+        )
+
+    async def async_sync(self) -> int:
+        """
+        Fetch the history entries newer than the cursor from the panel, and
+        persist those.
+
+        :return: Number of new history entries.
+        """
+        async with self._lock:
+            new_records: List[HistoryRecordT] = []
+            start = 1
+            while start <= HISTORY_SYNC_MAX_RECORDS:
+                # Counted before sending, so the requests failed are
+                # accounted for as well
+                self.requests_sent += 1
+                # The panel provides history entries from newer to older
+                page = await (
+                    self._coordinator.performance.async_timed_command(
+                        'history', self._coordinator.client.history(
+                            start=start, count=HISTORY_SYNC_PAGE_SIZE
+                        )
+                    )
+                )
+                cursor_reached = False
+                for entry in page:
+                    record = self._record(entry)
+                    if self._is_synced(record):
+                        cursor_reached = True
+                        continue
+                    if record not in new_records:
+                        new_records.append(record)
+
+                if cursor_reached or len(page) < HISTORY_SYNC_PAGE_SIZE:
+                    break
+                start += HISTORY_SYNC_PAGE_SIZE
+
+            if new_records:
+                self._add_records(new_records)
+            self.synced_at = dt_util.utcnow()
+
+            _LOGGER.debug(
+                'Synchronized %s new history records, cursor %s',
+                len(new_records), self._cursor_time
+            )
+            return len(new_records)
+
+    async def async_periodic_sync(self, _now: datetime) -> None:
+        """
+        Synchronize the history periodically, errors are logged only since
+        the next synchronization will pick up the entries missed.
+        """
+        try:
+            await self.async_sync()
+        except (G90Error, G90TimeoutError) as exc:
+            _LOGGER.debug('Error synchronizing history: %s', repr(exc))
+
+    def _add_records(self, new_records: List[HistoryRecordT]) -> None:
+        """
+        Add the new records to the history, notifying the listeners,
+        advancing the cursor and applying the retention limits.
+
+        :param new_records: The records, in any order.
+        """
+        new_records.sort(key=self._record_time)
+        self._records.extend(new_records)
+        if self._listeners:
+            new_entries = [G90History(*record) for record in new_records]
+            for listener in list(self._listeners):
+                listener(new_entries)
+
+        cursor_time = self._record_time(new_records[-1])
+        if cursor_time != self._cursor_time:
+            self._cursor_records = []
+        self._cursor_time = cursor_time
+        self._cursor_records.extend(
+            record for record in new_records
+            if self._record_time(record) == cursor_time
+        )
+
+        oldest_time = (dt_util.utcnow() - HISTORY_MAX_AGE).timestamp()
+        retained = [
+            record for record in self._records
+            if self._record_time(record) >= oldest_time
+        ][-HISTORY_MAX_RECORDS:]
+        # Records are dropped from the older end only
+        self._first_seq += len(self._records) - len(retained)
+        self._records = retained
+
+        if self._store is not None:
+            self._unsaved = True
+            self._store.async_delay_save(
+                self._data_to_save, HISTORY_SAVE_DELAY.total_seconds()
+            )
+
+    @property
+    def entries(self) -> List[G90History]:
+        """
+        History entries stored, from newer to older.
+        """
+        return [G90History(*record) for record in reversed(self._records)]
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def query(
+        self, *, start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        event_type: Optional[G90AlertTypes] = None,
+        sensor_idx: Optional[int] = None,
+        limit: int, before_seq: Optional[int] = None
+    ) -> Tuple[List[G90History], Optional[int]]:
+        """
+        Query the history entries stored, from newer to older.
+
+        :param start_time: Only entries occurred at or after the time.
+        :param end_time: Only entries occurred at or before the time.
+        :param event_type: Only entries of the type.
+        :param sensor_idx: Only entries of the sensor.
+        :param limit: Maximum number of entries.
+        :param before_seq: Only entries older than the one with the sequence
+         number, the cursor returned by the previous query.
+        :return: The entries, and the cursor to query next ones with if there
+         are more entries matching.
+        """
+        entries: List[G90History] = []
+        last_seq: Optional[int] = None
+        start_ts = start_time.timestamp() if start_time else None
+        end_ts = end_time.timestamp() if end_time else None
+
+        for pos in range(len(self._records) - 1, -1, -1):
+            seq = self._first_seq + pos
+            if before_seq is not None and seq >= before_seq:
+                continue
+
+            record = self._records[pos]
+            record_time = self._record_time(record)
+            # Records are ordered by time, so none of the rest could match
+            if start_ts is not None and record_time < start_ts:
+                break
+            if end_ts is not None and record_time > end_ts:
+                continue
+
+            entry = G90History(*record)
+            if event_type is not None and entry.type != event_type:
+                continue
+            if sensor_idx is not None and entry.sensor_idx != sensor_idx:
+                continue
+
+            # One more entry matches past the limit, so there are more ones
+            # to query using the cursor
+            if len(entries) == limit:
+                return entries, last_seq
+
+            entries.append(entry)
+            last_seq = seq
+
+        return entries, None
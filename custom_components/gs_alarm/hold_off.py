@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Hold-off of state writes for noisy sensors of `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Callable, Optional
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GsAlarmStateHoldOff:
+    """
+    Suppresses chatter of sensors reporting many times a minute (e.g. motion
+    or vibration ones).
+
+    The first state change is passed through immediately, starting the
+    hold-off period. Changes received during the period are coalesced into
+    single one passed through at its end, which starts next period.
+
+    :param hass: Home Assistant instance.
+    :param hold_off: Callable returning duration of the hold-off period, zero
+     disables it. Invoked on every change, so the duration could change
+     without recreating the instance.
+    :param write_state: Callable to pass the state change through.
+    """
+    def __init__(
+        self, hass: HomeAssistant, hold_off: Callable[[], timedelta],
+        write_state: Callable[[], None]
+    ) -> None:
+        self._hass = hass
+        self._hold_off = hold_off
+        self._write_state = write_state
+        self._unsub: Optional[CALLBACK_TYPE] = None
+        self._pending = False
+
+    @property
+    def is_holding_off(self) -> bool:
+        """
+        Indicates if the hold-off period is active.
+        """
+        return self._unsub is not None
+
+    @callback
+    def state_changed(self) -> None:
+        """
+        Handles the state change, passing it through or holding off.
+        """
+        if self.is_holding_off:
+            _LOGGER.debug('Holding off state change')
+            self._pending = True
+            return
+
+        self._pass_through()
+
+    @callback
+    def flush(self) -> None:
+        """
+        Passes the state through immediately, ending the hold-off period (if
+        any). Intended for changes that must not be delayed.
+        """
+        self.cancel()
+        self._pass_through()
+
+    @callback
+    def cancel(self) -> None:
+        """
+        Ends the hold-off period, discarding the pending change (if any).
+        """
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._pending = False
+
+    @callback
+    def _pass_through(self) -> None:
+        """
+        Passes the state through, starting the hold-off period if enabled.
+        """
+        self._pending = False
+        self._write_state()
+
+        hold_off = self._hold_off()
+        if hold_off.total_seconds() > 0:
+            self._unsub = async_call_later(
+                self._hass, hold_off, self._hold_off_ended
+            )
+
+    @callback
+    def _hold_off_ended(self, _now: datetime) -> None:
+        """
+        Invoked when the hold-off period ends.
+        """
+        self._unsub = None
+        if self._pending:
+            _LOGGER.debug('Passing through state changes held off')
+            self._pass_through()
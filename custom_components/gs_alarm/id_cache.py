@@ -0,0 +1,173 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Cache for generated entity IDs and device info of `gs-alarm` integration
+entities.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
+from collections.abc import Hashable
+import logging
+
+from pyg90alarm import G90Sensor, G90Device
+
+_LOGGER = logging.getLogger(__name__)
+T = TypeVar('T')
+
+
+class GsAlarmIDCache:
+    """
+    Per-coordinator cache of generated identifiers and device metadata.
+
+    Each panel sensor or device results in multiple entities (flags, selects,
+    buttons etc.), all of which format and slugify the same entity IDs and
+    build identical `DeviceInfo`. The cache computes those once per
+    (class, kind, GUID, placeholders) and shares the result.
+
+    Placeholders referencing `G90Sensor`/`G90Device` objects are keyed by the
+    object index, name and type rather than object itself, so entries survive
+    the list refresh from panel that creates new objects, while renaming the
+    object (including from the keypad or vendor application) or another
+    object taking over the index results in new entries. The entries
+    superseded that way are evicted when the new ones are created, or dropped
+    with :meth:`invalidate` once the object is removed from the panel.
+    """
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Any] = {}
+        # Current cache key per (class, kind, GUID, placeholders identity),
+        # where placeholder objects are identified by their reference only -
+        # to evict the entry superseded by renaming the object
+        self._by_slot: Dict[Hashable, Hashable] = {}
+        # Secondary index from panel object reference to cache keys
+        # referencing it, to support invalidation
+        self._by_object: Dict[Tuple[str, int], Set[Hashable]] = {}
+
+    @staticmethod
+    def _object_ref(obj: Any) -> Optional[Tuple[str, int]]:
+        """
+        Reference for the panel object, used for invalidation.
+
+        :param obj: The object to get reference for.
+        :return: The reference or None if object isn't sensor or device.
+        """
+        # `G90Device` is a subclass of `G90Sensor`, so it has to be checked
+        # first
+        if isinstance(obj, G90Device):
+            return ('device', obj.index)
+        if isinstance(obj, G90Sensor):
+            return ('sensor', obj.index)
+        return None
+
+    @classmethod
+    def _placeholder_slot(cls, value: Any) -> Hashable:
+        """
+        Hashable identity of the placeholder value, not changing upon the
+        panel object is renamed.
+
+        :param value: The placeholder value.
+        :return: The identity.
+        """
+        ref = cls._object_ref(value)
+        if ref is None:
+            return value  # type: ignore[no-any-return]
+        if isinstance(value, G90Device):
+            # Nodes of multi-node relays share the index
+            return (ref, value.subindex)
+        return ref
+
+    @classmethod
+    def _placeholder_key(cls, value: Any) -> Hashable:
+        """
+        Hashable key for the placeholder value.
+
+        :param value: The placeholder value.
+        :return: The key.
+        """
+        slot = cls._placeholder_slot(value)
+        if cls._object_ref(value) is None:
+            return slot
+        # Entity ID and device info depend on the name and type of the object
+        return (slot, value.name, value.type, value.subtype)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def get_or_create(
+        self, owner: type, kind: str, guid: str,
+        placeholders: Dict[str, Any], factory: Callable[[], T]
+    ) -> T:
+        """
+        Get the cached value or create it using the factory.
+
+        :param owner: The class generating the value.
+        :param kind: Kind of the value (e.g. `unique_id`).
+        :param guid: GUID of the panel.
+        :param placeholders: Placeholders used to generate the value.
+        :param factory: Callable to generate the value on cache miss.
+        :return: The cached or generated value.
+        """
+        items = sorted(placeholders.items())
+        key = (
+            owner, kind, guid,
+            tuple(
+                (name, self._placeholder_key(value)) for name, value in items
+            )
+        )
+        try:
+            return self._entries[key]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+
+        # Evict the entry for the same objects generated before those have
+        # been renamed, otherwise it would stay around forever
+        slot = (
+            owner, kind, guid,
+            tuple(
+                (name, self._placeholder_slot(value)) for name, value in items
+            )
+        )
+        stale_key = self._by_slot.get(slot)
+        if stale_key is not None:
+            self._entries.pop(stale_key, None)
+
+        value = factory()
+        self._entries[key] = value
+        self._by_slot[slot] = key
+        for placeholder in placeholders.values():
+            ref = self._object_ref(placeholder)
+            if ref is not None:
+                keys = self._by_object.setdefault(ref, set())
+                keys.discard(stale_key)
+                keys.add(key)
+
+        return value
+
+    def invalidate(self, obj: G90Sensor) -> None:
+        """
+        Drop cached values referencing the given panel sensor or device.
+
+        :param obj: The sensor or device to invalidate entries for.
+        """
+        ref = self._object_ref(obj)
+        if ref is None:
+            return
+
+        keys = self._by_object.pop(ref, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        self._by_slot = {
+            slot: key for slot, key in self._by_slot.items()
+            if key not in keys
+        }
+        _LOGGER.debug(
+            'Invalidated %s cached ID entries for %s', len(keys), ref
+        )
+
+    def clear(self) -> None:
+        """
+        Drop all cached values.
+        """
+        self._entries.clear()
+        self._by_slot.clear()
+        self._by_object.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
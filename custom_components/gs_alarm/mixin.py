@@ -8,9 +8,13 @@ from typing import Optional, Any, Dict, Generic, TypeVar
 from abc import ABC, abstractmethod
 import logging
 
+from homeassistant.core import callback
 from homeassistant.util import slugify
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.const import STATE_ON, STATE_OFF
 from homeassistant.config_entries import ConfigEntry
 
@@ -108,15 +112,19 @@ class GSAlarmGenerateIDsMixinBase(ABC):
 
         if not cls.ENTITY_DOMAIN:
             raise NotImplementedError("ENTITY_DOMAIN is not defined")
+        fmt = cls.ENTITY_ID_FMT
+        domain = cls.ENTITY_DOMAIN
+        guid = coordinator.data.host_info.host_guid
 
         # Entity ID must use the Home Assistant entity platform domain
         # (e.g. switch, binary_sensor) as the first segment, not the
         # integration domain.
-        return f'{cls.ENTITY_DOMAIN}.{slugify(
-            cls.ENTITY_ID_FMT.format(
-                guid=coordinator.data.host_info.host_guid, **placeholders
-            )
-        )}'
+        return coordinator.id_cache.get_or_create(
+            cls, 'entity_id', guid, placeholders,
+            lambda: f'{domain}.{slugify(
+                fmt.format(guid=guid, **placeholders)
+            )}'
+        )
 
     @classmethod
     def generate_parent_device_info(
@@ -132,6 +140,20 @@ class GSAlarmGenerateIDsMixinBase(ABC):
         if not coordinator.data.host_info:
             raise ValueError("Coordinator host info is not set")
 
+        return coordinator.id_cache.get_or_create(
+            GSAlarmGenerateIDsMixinBase, 'device_info',
+            coordinator.data.host_info.host_guid, {},
+            lambda: cls._build_parent_device_info(coordinator)
+        )
+
+    @staticmethod
+    def _build_parent_device_info(
+        coordinator: GsAlarmCoordinator
+    ) -> DeviceInfo:
+        """
+        Build DeviceInfo for the parent HASS device, see
+        :meth:`generate_parent_device_info`.
+        """
         return DeviceInfo(
             identifiers={
                 (DOMAIN, coordinator.data.host_info.host_guid)
@@ -236,6 +258,21 @@ class GSAlarmGenerateIDsSensorMixin(GSAlarmGenerateIDsMixinBase):
         if not coordinator.data.host_info:
             raise ValueError("Coordinator host info is not set")
 
+        # Device info is shared by all entities of the sensor, so is computed
+        # once
+        return coordinator.id_cache.get_or_create(
+            cls, 'device_info', coordinator.data.host_info.host_guid,
+            {'sensor': obj},
+            lambda: cls._build_device_info(coordinator, obj)
+        )
+
+    @classmethod
+    def _build_device_info(
+        cls, coordinator: GsAlarmCoordinator, obj: G90Sensor
+    ) -> DeviceInfo:
+        """
+        Build DeviceInfo for the sensor, see :meth:`generate_device_info`.
+        """
         return DeviceInfo(
             manufacturer=MANUFACTURER,
             model=obj.type_name or '',
@@ -307,6 +344,21 @@ class GSAlarmGenerateIDsDeviceMixin(GSAlarmGenerateIDsMixinBase):
         if not coordinator.data.host_info:
             raise ValueError("Coordinator host info is not set")
 
+        # Device info is shared by all entities of the device, so is computed
+        # once
+        return coordinator.id_cache.get_or_create(
+            cls, 'device_info', coordinator.data.host_info.host_guid,
+            {'device': obj},
+            lambda: cls._build_device_info(coordinator, obj)
+        )
+
+    @classmethod
+    def _build_device_info(
+        cls, coordinator: GsAlarmCoordinator, obj: G90Device
+    ) -> DeviceInfo:
+        """
+        Build DeviceInfo for the device, see :meth:`generate_device_info`.
+        """
         return DeviceInfo(
             manufacturer=MANUFACTURER,
             model=obj.type_name or '',
@@ -327,6 +379,76 @@ class GSAlarmGenerateIDsDeviceMixin(GSAlarmGenerateIDsMixinBase):
         )
 
 
+class GsAlarmPanelNameMixinBase(Entity, ABC):
+    """
+    Base mixin for entities deriving their names from the name of panel's
+    sensor or relay, allowing those to be updated in place once the sensor or
+    relay gets renamed.
+    """
+    @abstractmethod
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        """
+        Translation placeholders derived from the current name of the sensor
+        or relay. Subclasses must implement this method.
+
+        :return: The translation placeholders.
+        """
+
+    @callback
+    def update_panel_name(self) -> None:
+        """
+        Reflect the current name of the sensor or relay in the entity.
+        """
+        self._attr_translation_placeholders = self.panel_name_placeholders()
+        if self.hass is None:
+            return
+        # Update the original name in entity registry explicitly, so the UI
+        # reflects the new name rather than the one entity has been registered
+        # with
+        if self.registry_entry is not None:
+            name = self.name
+            er.async_get(self.hass).async_update_entity(
+                self.entity_id,
+                original_name=None if name is UNDEFINED else name
+            )
+        self.async_write_ha_state()
+
+
+class GsAlarmPanelIndexMixinBase(Entity, ABC):
+    """
+    Base mixin for entities of panel's sensor or relay, registering those in
+    the panel index of the coordinator while added to HASS, so they could be
+    looked up by panel index of the sensor or relay.
+    """
+    # Whether the entity represents the state of the sensor or relay
+    INDEX_PRIMARY = False
+    coordinator: GsAlarmCoordinator
+
+    @property
+    @abstractmethod
+    def indexed_panel_entity(self) -> G90Sensor | G90Device:
+        """
+        The sensor or relay the entity belongs to. Subclasses must implement
+        this property.
+        """
+
+    async def async_added_to_hass(self) -> None:
+        """
+        Invoked by HASS when entity is added.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.panel_index.add_entity(
+            self.indexed_panel_entity, self, self.INDEX_PRIMARY
+        ))
+
+    @callback
+    def alarm_triggered(self) -> None:
+        """
+        Invoked by the panel index when the sensor triggers the alarm, for
+        the primary entity only. Does nothing by default.
+        """
+
+
 class GsAlarmRestoreStateMixinBase(RestoreEntity, Generic[T], ABC):
     """
     Base mixin for state restoration.
@@ -367,7 +489,17 @@ class GsAlarmRestoreStateMixinBase(RestoreEntity, Generic[T], ABC):
             )
             return None
 
-        state = await self.async_get_last_state()
+        # Use the last state prefetched by the coordinator if available,
+        # falling back to looking it up for the entity otherwise (e.g. the
+        # entity hasn't been registered yet)
+        coordinator = getattr(config_entry, 'runtime_data', None)
+        if (
+            isinstance(coordinator, GsAlarmCoordinator)
+            and self.entity_id in coordinator.last_states
+        ):
+            state = coordinator.last_states.pop(self.entity_id)
+        else:
+            state = await self.async_get_last_state()
         # No state could be restored
         if state is None:
             return None
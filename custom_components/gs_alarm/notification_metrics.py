@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Metrics of notifications observed over notifications protocol for `gs-alarm`
+integration.
+"""
+from __future__ import annotations
+from typing import Any, Deque, Dict, Optional
+from collections import deque
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    NOTIFICATION_METRICS_WINDOW, NOTIFICATION_METRICS_MAX_SAMPLES,
+)
+
+
+class GsAlarmNotificationMetrics:
+    """
+    Rolling window metrics of notifications observed from the panel (device)
+    and the cloud server (upstream) over notifications protocol.
+
+    The metrics are fed by the timestamps of last packets the client
+    provides, sampled as notifications arrive and upon coordinator updates.
+    Packets received in between the samples are observed as single
+    notification, hence the rates are the lower bound of the actual packet
+    rates, while the gaps are the upper bound.
+
+    :param window: Duration of the rolling window.
+    """
+    def __init__(
+        self, window: timedelta = NOTIFICATION_METRICS_WINDOW
+    ) -> None:
+        self._window = window
+        self._device_notifications: Deque[datetime] = deque(
+            maxlen=NOTIFICATION_METRICS_MAX_SAMPLES
+        )
+        self._upstream_notifications: Deque[datetime] = deque(
+            maxlen=NOTIFICATION_METRICS_MAX_SAMPLES
+        )
+
+    def record(
+        self, device_packet_time: Optional[datetime],
+        upstream_packet_time: Optional[datetime]
+    ) -> None:
+        """
+        Record the timestamps of last packets received.
+
+        Timestamps already recorded are ignored.
+
+        :param device_packet_time: Timestamp of last packet from the device.
+        :param upstream_packet_time: Timestamp of last packet from the
+         upstream.
+        """
+        for notifications, packet_time in (
+            (self._device_notifications, device_packet_time),
+            (self._upstream_notifications, upstream_packet_time),
+        ):
+            if packet_time is None:
+                continue
+            if notifications and packet_time <= notifications[-1]:
+                continue
+            notifications.append(packet_time)
+
+        self._expire(dt_util.utcnow())
+
+    def _expire(self, now: datetime) -> None:
+        """
+        Remove the notifications out of the window.
+
+        :param now: Current time.
+        """
+        for notifications in (
+            self._device_notifications, self._upstream_notifications
+        ):
+            while notifications and notifications[0] < now - self._window:
+                notifications.popleft()
+
+    def _per_minute(self, notifications: Deque[datetime]) -> float:
+        """
+        Rate of the notifications within the window.
+
+        :param notifications: The notifications to compute the rate for.
+        :return: Number of notifications per minute.
+        """
+        self._expire(dt_util.utcnow())
+        return round(
+            len(notifications) / (self._window.total_seconds() / 60), 2
+        )
+
+    @property
+    def device_notifications_per_minute(self) -> float:
+        """
+        Rate of the notifications from the device within the window.
+        """
+        return self._per_minute(self._device_notifications)
+
+    @property
+    def upstream_notifications_per_minute(self) -> float:
+        """
+        Rate of the notifications from the upstream within the window.
+        """
+        return self._per_minute(self._upstream_notifications)
+
+    @property
+    def max_device_notification_gap(self) -> Optional[float]:
+        """
+        Maximum gap between notifications from the device within the window,
+        in seconds.
+
+        The time passed since the last notification is accounted as well, so
+        the gap grows while no notifications are observed.
+        """
+        now = dt_util.utcnow()
+        self._expire(now)
+        if not self._device_notifications:
+            return None
+
+        notifications = list(self._device_notifications)
+        gaps = [
+            (later - earlier).total_seconds()
+            for earlier, later in zip(notifications, notifications[1:])
+        ]
+        gaps.append((now - notifications[-1]).total_seconds())
+        return round(max(gaps), 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Metrics suitable for diagnostics.
+        """
+        return {
+            'window_seconds': self._window.total_seconds(),
+            'device_notifications': len(self._device_notifications),
+            'upstream_notifications': len(self._upstream_notifications),
+            'device_notifications_per_minute': (
+                self.device_notifications_per_minute
+            ),
+            'upstream_notifications_per_minute': (
+                self.upstream_notifications_per_minute
+            ),
+            'max_device_notification_gap': self.max_device_notification_gap,
+        }
@@ -0,0 +1,225 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Index of panel's sensors and relays, along with HASS entities of those, for
+`gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.entity import Entity
+
+from pyg90alarm import G90Sensor, G90Device
+if TYPE_CHECKING:
+    from .mixin import GsAlarmPanelIndexMixinBase
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key of the index entry: kind of panel entity ('sensor' or 'device') and its
+# index on the panel
+IndexKeyT = Tuple[str, int]
+
+
+class GsAlarmPanelIndex:
+    """
+    Maps panel index of sensors and relays to `pyg90alarm` objects and HASS
+    entities of those, so the lookups don't need to scan the lists of
+    sensors, relays or entities.
+
+    The objects are indexed as list change callbacks are invoked, while the
+    entities register themselves once added to HASS.
+
+    Alarms are dispatched to the primary entity of the sensor triggered
+    those, so the entities don't need to register an alarm callback each.
+    """
+    def __init__(self) -> None:
+        self._sensors: Dict[int, G90Sensor] = {}
+        # Nodes of multi-node relays share the panel index
+        self._devices: Dict[int, Dict[int, G90Device]] = {}
+        self._entities: Dict[IndexKeyT, Set[Entity]] = {}
+        self._primary_entities: Dict[
+            IndexKeyT, GsAlarmPanelIndexMixinBase
+        ] = {}
+
+    @staticmethod
+    def _key(panel_entity: G90Sensor | G90Device) -> IndexKeyT:
+        """
+        Index key for the sensor or relay.
+        """
+        # Relays are checked first, since `G90Device` is derived from
+        # `G90Sensor`
+        if isinstance(panel_entity, G90Device):
+            return ('device', panel_entity.index)
+        return ('sensor', panel_entity.index)
+
+    @callback
+    def sensor_list_change_callback(
+        self, sensor: G90Sensor, added: bool
+    ) -> None:
+        """
+        Index the sensor added or updated on the panel.
+
+        :param sensor: The sensor.
+        :param added: Flag indicating if the sensor is added or updated.
+        """
+        _LOGGER.debug(
+            "Indexing sensor '%s' (idx %s, added %s)",
+            sensor.name, sensor.index, added
+        )
+        self._sensors[sensor.index] = sensor
+
+    @callback
+    def device_list_change_callback(
+        self, device: G90Device, added: bool
+    ) -> None:
+        """
+        Index the relay added or updated on the panel.
+
+        :param device: The relay.
+        :param added: Flag indicating if the relay is added or updated.
+        """
+        _LOGGER.debug(
+            "Indexing relay '%s' (idx %s, subidx %s, added %s)",
+            device.name, device.index, device.subindex, added
+        )
+        self._devices.setdefault(device.index, {})[device.subindex] = device
+
+    @callback
+    def remove(self, panel_entity: G90Sensor | G90Device) -> None:
+        """
+        Remove the sensor or relay no longer on the panel from the index.
+
+        :param panel_entity: The sensor or relay.
+        """
+        # The index might refer to another sensor or relay with same panel
+        # index already, e.g. added in place of the removed one
+        if isinstance(panel_entity, G90Device):
+            nodes = self._devices.get(panel_entity.index, {})
+            if nodes.get(panel_entity.subindex) is not panel_entity:
+                return
+            nodes.pop(panel_entity.subindex)
+            if nodes:
+                return
+            self._devices.pop(panel_entity.index)
+        else:
+            if self._sensors.get(panel_entity.index) is not panel_entity:
+                return
+            self._sensors.pop(panel_entity.index)
+
+        key = self._key(panel_entity)
+        self._entities.pop(key, None)
+        self._primary_entities.pop(key, None)
+
+    @callback
+    def add_entity(
+        self, panel_entity: G90Sensor | G90Device,
+        entity: GsAlarmPanelIndexMixinBase, primary: bool = False
+    ) -> CALLBACK_TYPE:
+        """
+        Index the HASS entity of the sensor or relay.
+
+        :param panel_entity: The sensor or relay.
+        :param entity: The HASS entity.
+        :param primary: Whether the entity is the primary one for the sensor
+         or relay, i.e. representing its state.
+        :return: Callable to remove the entity from the index, suitable for
+         `async_on_remove`.
+        """
+        key = self._key(panel_entity)
+        self._entities.setdefault(key, set()).add(entity)
+        if primary:
+            self._primary_entities[key] = entity
+
+        @callback
+        def remove_entity() -> None:
+            self._entities.get(key, set()).discard(entity)
+            if self._primary_entities.get(key) is entity:
+                self._primary_entities.pop(key)
+
+        return remove_entity
+
+    @callback
+    def alarm_callback(
+        self, sensor_idx: int, _sensor_name: str, _extra_data: str
+    ) -> None:
+        """
+        Dispatch the alarm to the primary entity of the sensor triggered it.
+
+        :param sensor_idx: Index of the sensor triggered the alarm.
+        :param _sensor_name: Name of the sensor triggered the alarm.
+        :param _extra_data: Extra data of the sensor, the entity ID.
+        """
+        entity = self._primary_entities.get(('sensor', sensor_idx))
+        if entity is None:
+            _LOGGER.debug(
+                'No entity to dispatch alarm of sensor (idx %s) to',
+                sensor_idx
+            )
+            return
+        entity.alarm_triggered()
+
+    def sensor(self, index: int) -> Optional[G90Sensor]:
+        """
+        Get the sensor by its panel index.
+
+        :param index: The panel index of the sensor.
+        :return: The sensor, or `None` if not found.
+        """
+        return self._sensors.get(index)
+
+    def device(self, index: int, subindex: int = 0) -> Optional[G90Device]:
+        """
+        Get the relay (or its node) by its panel index.
+
+        :param index: The panel index of the relay.
+        :param subindex: The index of the relay node.
+        :return: The relay, or `None` if not found.
+        """
+        return self._devices.get(index, {}).get(subindex)
+
+    def entities(self, panel_entity: G90Sensor | G90Device) -> List[Entity]:
+        """
+        Get HASS entities of the sensor or relay.
+
+        :param panel_entity: The sensor or relay.
+        :return: The entities.
+        """
+        return list(self._entities.get(self._key(panel_entity), set()))
+
+    def entity_ids(self, panel_entity: G90Sensor | G90Device) -> List[str]:
+        """
+        Get IDs of HASS entities of the sensor or relay.
+
+        :param panel_entity: The sensor or relay.
+        :return: The entity IDs.
+        """
+        return sorted(
+            entity.entity_id for entity in self.entities(panel_entity)
+        )
+
+    def primary_sensor_entity_id(self, index: int) -> Optional[str]:
+        """
+        Get ID of the primary HASS entity of the sensor by its panel index.
+
+        :param index: The panel index of the sensor.
+        :return: The entity ID, or `None` if not found.
+        """
+        entity = self._primary_entities.get(('sensor', index))
+        return entity.entity_id if entity else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Summary of the index suitable for diagnostics.
+        """
+        return {
+            'sensors': {
+                index: len(self._entities.get(('sensor', index), set()))
+                for index in sorted(self._sensors)
+            },
+            'devices': {
+                index: len(self._entities.get(('device', index), set()))
+                for index in sorted(self._devices)
+            },
+        }
@@ -0,0 +1,383 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Runtime performance metrics of `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple,
+    TypeVar,
+)
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import Enum
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, callback, split_entity_id
+from homeassistant.helpers.entity import Entity
+
+from pyg90alarm import G90Error, G90TimeoutError, G90Sensor
+
+from .const import PERFORMANCE_MAX_SAMPLES
+from .trace import GsAlarmTrace
+
+_LOGGER = logging.getLogger(__name__)
+T = TypeVar('T')
+# Listener for slow callbacks, invoked with the entity class, name of the
+# callback, ID of the entity (if any) and the time spent in the callback
+SlowCallbackListenerT = Callable[[str, str, Optional[str], float], None]
+
+
+def _distribution(samples: Iterable[float]) -> Dict[str, Any]:
+    """
+    Distribution of the samples.
+
+    :param samples: The samples, in seconds.
+    :return: Number of the samples, along with their minimum, median, 95th
+     percentile and maximum.
+    """
+    values = sorted(samples)
+    if not values:
+        return {'count': 0}
+
+    def percentile(value: float) -> float:
+        return round(values[int((len(values) - 1) * value)], 3)
+
+    return {
+        'count': len(values),
+        'min': round(values[0], 3),
+        'median': percentile(0.5),
+        'p95': percentile(0.95),
+        'max': round(values[-1], 3),
+    }
+
+
+def _traced_args(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """
+    Arguments of the callback to record into the trace.
+
+    Names and objects are left out, as those contain sensor names and entity
+    IDs (comprising the panel GUID) redacted from diagnostics - sensors and
+    relays are recorded by their index instead.
+
+    :param args: Arguments of the callback.
+    :return: The arguments to record.
+    """
+    traced: List[Any] = []
+    for arg in args:
+        if isinstance(arg, G90Sensor):
+            traced.append(arg.index)
+        elif arg is None or isinstance(arg, (bool, int, float, Enum)):
+            traced.append(arg)
+    return tuple(traced)
+
+
+@dataclass
+class _CommandStats:
+    """
+    Statistics of the command sent to the panel.
+    """
+    latencies: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=PERFORMANCE_MAX_SAMPLES)
+    )
+    errors: int = 0
+    timeouts: int = 0
+
+
+@dataclass
+class _LoopTimeStats:
+    """
+    Statistics of the time spent in the event loop.
+    """
+    invocations: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+@dataclass
+class _SlowCallbackStats:
+    """
+    Statistics of the slow callbacks of the entity class.
+    """
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    # Name of the callback took the maximum time
+    worst_callback: Optional[str] = None
+
+
+@dataclass
+class _StateWriteStats:
+    """
+    Statistics of the state writes of the entities.
+    """
+    emitted: int = 0
+    suppressed: int = 0
+
+
+class GsAlarmPerformanceMetrics:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Runtime performance metrics of the integration, collected by counters
+    cheap enough to be always on.
+
+    Durations are kept for the most recent samples only, while the counters
+    accumulate since the config entry has been set up. The individual events
+    are recorded into the trace.
+
+    Detection of slow callbacks is opt-in, with the threshold set - the
+    callbacks running longer than it stall the event loop, so those are
+    logged, reported to the listeners and aggregated by entity class.
+
+    :param trace: The trace to record the events into.
+    """
+    def __init__(self, trace: GsAlarmTrace) -> None:
+        self._trace = trace
+        # Zero disables detection of slow callbacks
+        self.slow_callback_threshold = timedelta()
+        self._slow_callbacks: Dict[str, _SlowCallbackStats] = defaultdict(
+            _SlowCallbackStats
+        )
+        self._slow_callback_listeners: List[SlowCallbackListenerT] = []
+        self._polls: Deque[float] = deque(maxlen=PERFORMANCE_MAX_SAMPLES)
+        self._failed_polls = 0
+        self._commands: Dict[str, _CommandStats] = defaultdict(_CommandStats)
+        self._loop_time: Dict[str, _LoopTimeStats] = defaultdict(
+            _LoopTimeStats
+        )
+        self._state_writes: Dict[str, _StateWriteStats] = defaultdict(
+            _StateWriteStats
+        )
+        # Latencies of coroutine callbacks, by callback name
+        self._coroutine_callbacks: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=PERFORMANCE_MAX_SAMPLES)
+        )
+
+    def record_poll(self, duration: float, success: bool) -> None:
+        """
+        Record the coordinator update.
+
+        :param duration: Duration of the update, in seconds.
+        :param success: Whether the update succeeded.
+        """
+        self._polls.append(duration)
+        self._trace.record('poll', value=success, latency=duration)
+        if not success:
+            self._failed_polls += 1
+
+    async def async_timed_command(
+        self, command: str, awaitable: Awaitable[T]
+    ) -> T:
+        """
+        Await the command sent to the panel, recording its latency or the
+        failure.
+
+        :param command: Name of the command.
+        :param awaitable: The command invocation.
+        :return: Result of the command.
+        """
+        stats = self._commands[command]
+        started = time.monotonic()
+        try:
+            result = await awaitable
+        except G90TimeoutError:
+            stats.timeouts += 1
+            self._trace.record(
+                'command_timeout', value=command,
+                latency=time.monotonic() - started
+            )
+            raise
+        except G90Error:
+            stats.errors += 1
+            self._trace.record(
+                'command_error', value=command,
+                latency=time.monotonic() - started
+            )
+            raise
+        latency = time.monotonic() - started
+        stats.latencies.append(latency)
+        self._trace.record('command', value=command, latency=latency)
+        return result
+
+    @callback
+    def async_add_slow_callback_listener(
+        self, listener: SlowCallbackListenerT
+    ) -> CALLBACK_TYPE:
+        """
+        Add the listener for slow callbacks.
+
+        :param listener: The listener.
+        :return: Callable to remove the listener.
+        """
+        self._slow_callback_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._slow_callback_listeners:
+                self._slow_callback_listeners.remove(listener)
+
+        return remove_listener
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def record_callback(
+        self, name: str, owner: Any, index: Optional[int],
+        args: Tuple[Any, ...], duration: float
+    ) -> None:
+        """
+        Record the callback from the panel.
+
+        :param name: Name of the callback.
+        :param owner: Object the callback is bound to (e.g. the entity),
+         `None` for plain functions.
+        :param index: Index of the sensor the callback relates to, if any.
+        :param args: Arguments the callback has been invoked with.
+        :param duration: The time spent in the callback, in seconds.
+        """
+        self.record_loop_time('panel_callbacks', duration)
+        threshold = self.slow_callback_threshold.total_seconds()
+        if threshold and duration > threshold:
+            self._record_slow_callback(name, owner, duration)
+        self._trace.record(name, index, _traced_args(args), duration)
+
+    def record_coroutine_callback(
+        self, name: str, index: Optional[int], args: Tuple[Any, ...],
+        latency: float
+    ) -> None:
+        """
+        Record the coroutine callback from the panel.
+
+        The latency spans the time the callback has been suspended, so it
+        isn't accounted as time spent in the event loop nor checked against
+        the threshold of slow callbacks.
+
+        :param name: Name of the callback.
+        :param index: Index of the sensor the callback relates to, if any.
+        :param args: Arguments the callback has been invoked with.
+        :param latency: The time the callback took to complete, in seconds.
+        """
+        self._coroutine_callbacks[name].append(latency)
+        self._trace.record(name, index, _traced_args(args), latency)
+
+    def _record_slow_callback(
+        self, name: str, owner: Any, duration: float
+    ) -> None:
+        """
+        Record the callback ran longer than the threshold.
+
+        :param name: Name of the callback.
+        :param owner: Object the callback is bound to, if any.
+        :param duration: The time spent in the callback, in seconds.
+        """
+        entity_class = (
+            type(owner).__name__ if owner is not None else 'function'
+        )
+        entity_id = getattr(owner, 'entity_id', None)
+        _LOGGER.warning(
+            "Callback '%s' of %s (%s) blocked the event loop for %.3f s",
+            name, entity_class, entity_id, duration
+        )
+
+        stats = self._slow_callbacks[entity_class]
+        stats.count += 1
+        stats.total += duration
+        if duration > stats.max:
+            stats.max = duration
+            stats.worst_callback = name
+
+        for listener in list(self._slow_callback_listeners):
+            listener(entity_class, name, entity_id, duration)
+
+    def record_loop_time(self, kind: str, duration: float) -> None:
+        """
+        Record the time spent in the event loop.
+
+        :param kind: Kind of the code run, e.g. the callbacks from the panel.
+        :param duration: The time spent, in seconds.
+        """
+        stats = self._loop_time[kind]
+        stats.invocations += 1
+        stats.total += duration
+        stats.max = max(stats.max, duration)
+
+    def record_state_write(
+        self, entity: Entity, emitted: bool, index: Optional[int] = None
+    ) -> None:
+        """
+        Record the state write of the entity handling panel notifications, or
+        the one skipped (e.g. duplicate notification, state change held off
+        or not changing the state).
+
+        :param entity: The entity.
+        :param emitted: Whether the state has been written.
+        :param index: Index of the sensor the entity relates to, if any.
+        """
+        platform = split_entity_id(entity.entity_id)[0]
+        stats = self._state_writes[platform]
+        if emitted:
+            stats.emitted += 1
+        else:
+            stats.suppressed += 1
+        # Entity IDs are left out of the trace, as those contain the panel
+        # GUID and sensor names redacted from diagnostics
+        self._trace.record(
+            'state_write' if emitted else 'state_write_suppressed', index,
+            platform
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Metrics suitable for diagnostics.
+        """
+        return {
+            'polls': {
+                **_distribution(self._polls),
+                'failed': self._failed_polls,
+            },
+            'commands': {
+                command: {
+                    **_distribution(stats.latencies),
+                    'errors': stats.errors,
+                    'timeouts': stats.timeouts,
+                }
+                for command, stats in sorted(self._commands.items())
+            },
+            'event_loop_time': {
+                kind: {
+                    'invocations': stats.invocations,
+                    'total': round(stats.total, 3),
+                    'max': round(stats.max, 3),
+                }
+                for kind, stats in sorted(self._loop_time.items())
+            },
+            'slow_callbacks': {
+                'threshold': self.slow_callback_threshold.total_seconds(),
+                # Worst offenders first
+                'by_entity_class': {
+                    entity_class: {
+                        'count': stats.count,
+                        'total': round(stats.total, 3),
+                        'max': round(stats.max, 3),
+                        'worst_callback': stats.worst_callback,
+                    }
+                    for entity_class, stats in sorted(
+                        self._slow_callbacks.items(),
+                        key=lambda item: item[1].max, reverse=True
+                    )
+                },
+            },
+            'coroutine_callbacks': {
+                name: _distribution(latencies)
+                for name, latencies in sorted(
+                    self._coroutine_callbacks.items()
+                )
+            },
+            'state_writes': {
+                platform: {
+                    'emitted': stats.emitted,
+                    'suppressed': stats.suppressed,
+                }
+                for platform, stats in sorted(self._state_writes.items())
+            },
+        }
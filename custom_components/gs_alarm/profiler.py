@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+On-demand profiling of `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, NamedTuple, Tuple
+from datetime import timedelta
+import asyncio
+import cProfile
+import logging
+import os
+import pstats
+import time
+
+import pyg90alarm
+
+from homeassistant.components.persistent_notification import (
+    DOMAIN as NOTIFICATION_DOMAIN, ATTR_MESSAGE, ATTR_TITLE,
+    ATTR_NOTIFICATION_ID,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, PROFILE_HOTSPOTS
+from .utils import translate
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROFILER: HassKey[GsAlarmProfiler] = HassKey(f'{DOMAIN}_profiler')
+
+# Directories of the code the profile is scoped to - the integration itself
+# and `pyg90alarm` package
+PROFILE_SCOPE = (
+    os.path.dirname(__file__) + os.sep,
+    os.path.dirname(pyg90alarm.__file__) + os.sep,
+)
+
+
+class ProfileHotspot(NamedTuple):
+    """
+    Function taking most of the time while profiling.
+    """
+    function: str
+    calls: int
+    own_time: float
+    cumulative_time: float
+
+
+def _scoped_stats(
+    profiler: cProfile.Profile, path: str
+) -> List[ProfileHotspot]:
+    """
+    Write the profile stats of the code in scope into the file.
+
+    Runs in the executor, as both processing the stats and writing those are
+    blocking.
+
+    :param profiler: The profiler, disabled already.
+    :param path: Path to the file to write the stats to.
+    :return: The hotspots, sorted by the time spent in the function itself.
+    """
+    stats = pstats.Stats(profiler)
+    # Raw stats aren't part of typed interface of `pstats.Stats`, those are
+    # keyed by file name, line number and function name
+    raw_stats: Dict[Tuple[str, int, str], Any] = (
+        stats.stats  # type: ignore[attr-defined]
+    )
+    scoped = {
+        key: value for key, value in raw_stats.items()
+        if key[0].startswith(PROFILE_SCOPE)
+    }
+    stats.stats = scoped  # type: ignore[attr-defined]
+    stats.dump_stats(path)
+
+    hotspots = [
+        ProfileHotspot(
+            function=(
+                f'{func} ({os.path.basename(file_name)}:{line_number})'
+            ),
+            calls=calls, own_time=own_time, cumulative_time=cumulative_time,
+        )
+        for (file_name, line_number, func), (
+            _, calls, own_time, cumulative_time, _
+        ) in scoped.items()
+    ]
+    hotspots.sort(key=lambda hotspot: hotspot.own_time, reverse=True)
+    return hotspots[:PROFILE_HOTSPOTS]
+
+
+class GsAlarmProfiler:
+    # pylint: disable=too-few-public-methods
+    """
+    Profiles the integration on demand, with the deterministic profiler.
+
+    The profiler covers the event loop the integration runs in - the
+    coordinator updates, callbacks of the entities and setting platforms up
+    included, while the stats are scoped to the code of the integration and
+    `pyg90alarm` package. Those are written to the standard stats file under
+    the config directory, while the hotspots are summarized in the persistent
+    notification.
+
+    :param hass: Home Assistant instance.
+    """
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._running = False
+
+    async def async_profile(
+        self, duration: timedelta
+    ) -> Tuple[str, List[ProfileHotspot]]:
+        """
+        Profile the integration for the duration.
+
+        :param duration: The duration.
+        :return: Path to the stats file, and the hotspots.
+        :raises ServiceValidationError: If the profiling is in progress
+         already.
+        :raises HomeAssistantError: If other profiler is active.
+        """
+        if self._running:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key='profile_running',
+            )
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as exc:
+            # Only one profiler could be active at a time, e.g. the one of
+            # `profiler` integration
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key='profiler_unavailable',
+            ) from exc
+
+        self._running = True
+        _LOGGER.info('Profiling for %s', duration)
+        try:
+            await asyncio.sleep(duration.total_seconds())
+        finally:
+            profiler.disable()
+            self._running = False
+
+        path = self._hass.config.path(
+            f'{DOMAIN}_profile_{int(time.time())}.prof'
+        )
+        hotspots = await self._hass.async_add_executor_job(
+            _scoped_stats, profiler, path
+        )
+        _LOGGER.info('Profile stats written to %s', path)
+        await self._async_notify(duration, path, hotspots)
+        return path, hotspots
+
+    async def _async_notify(
+        self, duration: timedelta, path: str, hotspots: List[ProfileHotspot]
+    ) -> None:
+        """
+        Summarize the hotspots in the persistent notification.
+
+        :param duration: Duration of the profiling.
+        :param path: Path to the stats file.
+        :param hotspots: The hotspots.
+        """
+        lines = '\n'.join(
+            f'* `{hotspot.function}`: {hotspot.calls},'
+            f' {hotspot.own_time:.3f}s / {hotspot.cumulative_time:.3f}s'
+            for hotspot in hotspots
+        )
+        await self._hass.services.async_call(
+            NOTIFICATION_DOMAIN,
+            'create',
+            {
+                ATTR_MESSAGE: translate(
+                    self._hass, 'entity',
+                    'notifications.profile_finished.name',
+                    {
+                        'duration': int(duration.total_seconds()),
+                        'path': path,
+                        'hotspots': lines,
+                    }
+                ),
+                ATTR_TITLE: DOMAIN,
+                ATTR_NOTIFICATION_ID: f'{DOMAIN}_profile',
+            },
+            blocking=True,
+        )
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> GsAlarmProfiler:
+    """
+    Get the profiler, creating it if needed.
+
+    :param hass: Home Assistant instance.
+    :return: The profiler.
+    """
+    if DATA_PROFILER not in hass.data:
+        hass.data[DATA_PROFILER] = GsAlarmProfiler(hass)
+    return hass.data[DATA_PROFILER]
@@ -4,7 +4,7 @@
 Select entities for `gs_alarm` integration.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 import logging
 
 from homeassistant.core import HomeAssistant
@@ -13,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.select import (
     SelectEntity, DOMAIN as SELECT_DOMAIN,
 )
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.core import Event
 
@@ -22,10 +23,16 @@ from pyg90alarm import (
     G90SpeechLanguage, G90APNAuth,
 )
 
-from .const import DOMAIN
-from .mixin import GSAlarmGenerateIDsSensorMixin
+from .const import (
+    DOMAIN, SENSOR_ENTITY_FAMILY_ALERT_MODE, SENSOR_ENTITY_FAMILY_EDITOR,
+)
+from .mixin import (
+    GSAlarmGenerateIDsSensorMixin, GsAlarmPanelNameMixinBase,
+    GsAlarmPanelIndexMixinBase,
+)
 from .entity_base import (
-    GSAlarmEntityBase, G90HostConfigSelectField, G90NetConfigSelectField
+    GSAlarmEntityBase, G90HostConfigSelectField, G90NetConfigSelectField,
+    G90SensorEditorEntityBase,
 )
 from .coordinator import GsAlarmCoordinator
 from .binary_sensor import G90BinarySensor
@@ -50,16 +57,26 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up a config entry."""
-    def sensor_list_change_callback(sensor: G90Sensor, added: bool) -> None:
-        # Add select entity for alert mode if a new sensor is added
-        if added:
-            async_add_entities(
-                [G90SensorAlertMode(sensor, entry.runtime_data)]
-            )
+    def sensor_alert_mode_entities(sensor: G90Sensor) -> list[Entity]:
+        # Select entity for alert mode of the sensor
+        return [G90SensorAlertMode(sensor, entry.runtime_data)]
+
+    # Register the select entity to be created for panel's sensors
+    entry.runtime_data.entity_profile.register_family(
+        SENSOR_ENTITY_FAMILY_ALERT_MODE, sensor_alert_mode_entities,
+        async_add_entities
+    )
+
+    def sensor_editor_entities() -> list[Entity]:
+        # Select entities of the panel-level sensor editor
+        return [
+            G90SensorEditorTarget(entry.runtime_data),
+            G90SensorEditorAlertMode(entry.runtime_data),
+        ]
 
-    # Register the callback for sensor list changes
-    entry.runtime_data.client.sensor_list_change_callback.add(
-        sensor_list_change_callback
+    entry.runtime_data.entity_profile.register_panel_family(
+        SENSOR_ENTITY_FAMILY_EDITOR, sensor_editor_entities,
+        async_add_entities
     )
 
     entities = [
@@ -143,7 +160,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class G90SensorAlertMode(G90SelectSensorEntityBase):
+class G90SensorAlertMode(
+    G90SelectSensorEntityBase, GsAlarmPanelNameMixinBase,
+    GsAlarmPanelIndexMixinBase,
+):
     """
     Select entity for alert mode of the sensor.
 
@@ -184,9 +204,7 @@ class G90SensorAlertMode(G90SelectSensorEntityBase):
         self._attr_icon = 'mdi:shield-alert'
         self._attr_has_entity_name = True
         self._attr_translation_key = 'sensor_alert_mode'
-        self._attr_translation_placeholders = {
-            'sensor': sensor.name,
-        }
+        self._attr_translation_placeholders = self.panel_name_placeholders()
         self._attr_options = list(self.states_map.values())
 
     @property
@@ -198,6 +216,15 @@ class G90SensorAlertMode(G90SelectSensorEntityBase):
         """
         return self.states_map.get(self._sensor.alert_mode, None)
 
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        return {
+            'sensor': self._sensor.name,
+        }
+
+    @property
+    def indexed_panel_entity(self) -> G90Sensor:
+        return self._sensor
+
     async def async_select_option(self, option: str) -> None:
         """
         Set the mode of the sensor.
@@ -216,6 +243,107 @@ class G90SensorAlertMode(G90SelectSensorEntityBase):
             )
 
 
+class G90SensorEditorTarget(SelectEntity, GSAlarmEntityBase):
+    """
+    Select entity for the sensor to edit with the panel-level sensor editor.
+
+    :param coordinator: The coordinator to use.
+    """
+    # pylint: disable=abstract-method,too-many-instance-attributes
+    # pylint: disable=too-many-ancestors
+    ENTITY_DOMAIN = SELECT_DOMAIN
+    UNIQUE_ID_FMT = "{guid}_sensor_editor_target"
+    ENTITY_ID_FMT = "{guid}_sensor_editor_target"
+
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_icon = 'mdi:list-box'
+        self._attr_has_entity_name = True
+        self._attr_translation_key = 'sensor_editor_target'
+
+    @property
+    def options(self) -> list[str]:
+        """
+        Return the sensors available for editing.
+
+        :return: The options.
+        """
+        return self.coordinator.sensor_editor.options
+
+    @property
+    def current_option(self) -> str | None:
+        """
+        Return the sensor currently selected for editing.
+
+        :return: The option.
+        """
+        return self.coordinator.sensor_editor.target_option
+
+    async def async_select_option(self, option: str) -> None:
+        """
+        Select the sensor to edit.
+
+        :param option: The option to set.
+        """
+        self.coordinator.sensor_editor.select_target(option)
+        self.async_write_ha_state()
+
+
+class G90SensorEditorAlertMode(SelectEntity, G90SensorEditorEntityBase):
+    """
+    Select entity for alert mode of the sensor selected in the panel-level
+    sensor editor.
+
+    :param coordinator: The coordinator to use.
+    """
+    # pylint: disable=abstract-method,too-many-instance-attributes
+    # pylint: disable=too-many-ancestors
+    ENTITY_DOMAIN = SELECT_DOMAIN
+
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        super().__init__(coordinator, 'alert_mode')
+        self._attr_icon = 'mdi:shield-alert'
+        self._attr_translation_key = 'sensor_editor_alert_mode'
+        self._attr_options = list(G90SensorAlertMode.states_map.values())
+
+    @property
+    def current_option(self) -> str | None:
+        """
+        Return the alert mode of the selected sensor.
+
+        :return: The option.
+        """
+        sensor = self.coordinator.sensor_editor.target
+        if sensor is None:
+            return None
+
+        return G90SensorAlertMode.states_map.get(sensor.alert_mode, None)
+
+    async def async_select_option(self, option: str) -> None:
+        """
+        Set the alert mode of the selected sensor.
+
+        :param option: The option to set.
+        """
+        sensor = self.coordinator.sensor_editor.target
+        if sensor is None:
+            return
+
+        try:
+            await sensor.set_alert_mode(
+                G90SensorAlertMode.reverse_states_map[option]
+            )
+        except (G90Error, G90TimeoutError) as exc:
+            _LOGGER.error(
+                "Error setting alert mode for sensor '%s': %s",
+                sensor.name,
+                repr(exc)
+            )
+
+        await self.coordinator.async_request_refresh()
+
+
 class G90NewEntitySelectBase(
     SelectEntity, GSAlarmEntityBase,
 ):
@@ -227,6 +355,7 @@ class G90NewEntitySelectBase(
     # pylint: disable=abstract-method,too-many-instance-attributes
     # pylint: disable=too-many-ancestors
     ENTITY_DOMAIN = SELECT_DOMAIN
+    REGISTRATION_EVENT: str
 
     def __init__(
         self, coordinator: GsAlarmCoordinator
@@ -247,6 +376,19 @@ class G90NewEntitySelectBase(
         self._attr_current_option = option
         self.async_write_ha_state()
 
+    async def async_added_to_hass(self) -> None:
+        """
+        Invoked by HASS when entity is added.
+        """
+        await super().async_added_to_hass()
+        # The entity listens for registration events to reset its value,
+        # until it is removed
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                self.REGISTRATION_EVENT, self.handle_registration_event
+            )
+        )
+
     async def handle_registration_event(self, event: Event) -> None:
         """
         Handle custom HASS event to reset the selection.
@@ -273,6 +415,7 @@ class G90NewSensorType(G90NewEntitySelectBase):
 
     UNIQUE_ID_FMT = "{guid}_new_sensor_type"
     ENTITY_ID_FMT = "{guid}_new_sensor_type"
+    REGISTRATION_EVENT = f"{DOMAIN}_new_sensor_registration"
 
     def __init__(
         self, coordinator: GsAlarmCoordinator
@@ -282,10 +425,6 @@ class G90NewSensorType(G90NewEntitySelectBase):
         self._attr_options = [
             x.name for x in G90SensorDefinitions.definitions()
         ]
-        # The select entity listens for registration events to reset its value
-        self.coordinator.hass.bus.async_listen(
-            f"{DOMAIN}_new_sensor_registration", self.handle_registration_event
-        )
 
 
 class G90NewDeviceType(G90NewEntitySelectBase):
@@ -299,6 +438,7 @@ class G90NewDeviceType(G90NewEntitySelectBase):
 
     UNIQUE_ID_FMT = "{guid}_new_device_type"
     ENTITY_ID_FMT = "{guid}_new_device_type"
+    REGISTRATION_EVENT = f"{DOMAIN}_new_device_registration"
 
     def __init__(
         self, coordinator: GsAlarmCoordinator
@@ -308,7 +448,3 @@ class G90NewDeviceType(G90NewEntitySelectBase):
         self._attr_options = [
             x.name for x in G90DeviceDefinitions.definitions()
         ]
-        # The select entity listens for registration events to reset its value
-        self.coordinator.hass.bus.async_listen(
-            f"{DOMAIN}_new_device_registration", self.handle_registration_event
-        )
@@ -14,12 +14,13 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.components.sensor.const import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import (
-    EntityCategory, PERCENTAGE, UnitOfElectricPotential,
+    EntityCategory, PERCENTAGE, UnitOfElectricPotential, UnitOfTime,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity_base import GSAlarmEntityBase
 from .coordinator import GsAlarmCoordinator
+from .const import NOTIFICATIONS_PER_MINUTE
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
 
@@ -34,6 +35,9 @@ async def async_setup_entry(_hass: HomeAssistant, entry: GsAlarmConfigEntry,
         G90GsmSignal(entry.runtime_data),
         G90CellularOperator(entry.runtime_data),
         G90BatteryVoltage(entry.runtime_data),
+        G90DeviceNotificationRate(entry.runtime_data),
+        G90UpstreamNotificationRate(entry.runtime_data),
+        G90MaxDeviceNotificationGap(entry.runtime_data),
     ]
 
     async_add_entities(g90sensors)
@@ -187,3 +191,99 @@ class G90BatteryVoltage(G90BaseSensor):
         except ValueError:
             self._attr_native_value = None
         self.async_write_ha_state()
+
+
+class G90DeviceNotificationRate(G90BaseSensor):
+    """
+    Sensor for rate of notifications observed from the panel over
+    notifications protocol.
+
+    :param coordinator: The coordinator to use.
+    """
+    # pylint: disable=too-many-ancestors
+
+    UNIQUE_ID_FMT = "{guid}_sensor_device_notification_rate"
+    ENTITY_ID_FMT = "{guid}_device_notification_rate"
+
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_translation_key = 'device_notification_rate'
+        self._attr_icon = 'mdi:lan-pending'
+        self._attr_native_unit_of_measurement = NOTIFICATIONS_PER_MINUTE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Invoked when HomeAssistant needs to update the sensor state.
+        """
+        notification_metrics = self.coordinator.notification_metrics
+        self._attr_native_value = (
+            notification_metrics.device_notifications_per_minute
+        )
+        self.async_write_ha_state()
+
+
+class G90UpstreamNotificationRate(G90BaseSensor):
+    """
+    Sensor for rate of notifications observed from the cloud server over
+    notifications protocol.
+
+    :param coordinator: The coordinator to use.
+    """
+    # pylint: disable=too-many-ancestors
+
+    UNIQUE_ID_FMT = "{guid}_sensor_upstream_notification_rate"
+    ENTITY_ID_FMT = "{guid}_upstream_notification_rate"
+
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_translation_key = 'upstream_notification_rate'
+        self._attr_icon = 'mdi:cloud-sync'
+        self._attr_native_unit_of_measurement = NOTIFICATIONS_PER_MINUTE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Invoked when HomeAssistant needs to update the sensor state.
+        """
+        notification_metrics = self.coordinator.notification_metrics
+        self._attr_native_value = (
+            notification_metrics.upstream_notifications_per_minute
+        )
+        self.async_write_ha_state()
+
+
+class G90MaxDeviceNotificationGap(G90BaseSensor):
+    """
+    Sensor for maximum gap between notifications observed from the panel
+    over notifications protocol.
+
+    :param coordinator: The coordinator to use.
+    """
+    # pylint: disable=too-many-ancestors
+
+    UNIQUE_ID_FMT = "{guid}_sensor_max_device_notification_gap"
+    ENTITY_ID_FMT = "{guid}_max_device_notification_gap"
+
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_translation_key = 'max_device_notification_gap'
+        self._attr_icon = 'mdi:timer-sand'
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Invoked when HomeAssistant needs to update the sensor state.
+        """
+        self._attr_native_value = (
+            self.coordinator.notification_metrics.max_device_notification_gap
+        )
+        self.async_write_ha_state()
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Panel-level sensor configuration editor for `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, List, Optional
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from pyg90alarm import G90Sensor
+if TYPE_CHECKING:
+    from .coordinator import GsAlarmCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GsAlarmSensorEditor:
+    """
+    Shared state of the panel-level sensor editor.
+
+    The editor consists of a select entity to choose the target sensor, and a
+    single set of flag/alert mode/name entities that load and save the
+    configuration of whichever sensor is selected. That keeps the number of
+    configuration entities independent of the number of panel sensors.
+
+    :param coordinator: The coordinator to use.
+    """
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        self._coordinator = coordinator
+        self._target_index: Optional[int] = None
+        self._listeners: List[Callable[[], None]] = []
+
+    @staticmethod
+    def sensor_option(sensor: G90Sensor) -> str:
+        """
+        Option of the target select entity for the sensor, includes the index
+        since sensor names aren't necessarily unique.
+
+        :param sensor: The sensor.
+        :return: The option.
+        """
+        return f'{sensor.name} (#{sensor.index})'
+
+    @property
+    def sensors(self) -> List[G90Sensor]:
+        """
+        Sensors could be edited, i.e. supporting updates and still present on
+        the panel.
+        """
+        if self._coordinator.data is None:
+            return []
+
+        return [
+            sensor for sensor in self._coordinator.data.sensors
+            if sensor.supports_updates and not sensor.is_unavailable
+        ]
+
+    @property
+    def options(self) -> List[str]:
+        """
+        Options for the target select entity.
+        """
+        return [self.sensor_option(sensor) for sensor in self.sensors]
+
+    @property
+    def target(self) -> Optional[G90Sensor]:
+        """
+        Sensor currently selected for editing, if any.
+        """
+        if self._target_index is None:
+            return None
+
+        sensor = self._coordinator.panel_index.sensor(self._target_index)
+        if (
+            sensor is None or not sensor.supports_updates
+            or sensor.is_unavailable
+        ):
+            return None
+
+        return sensor
+
+    @property
+    def target_option(self) -> Optional[str]:
+        """
+        Option of the target select entity for the selected sensor.
+        """
+        target = self.target
+        if target is None:
+            return None
+
+        return self.sensor_option(target)
+
+    @callback
+    def select_target(self, option: str) -> None:
+        """
+        Select the sensor to edit, and notify the editor entities so they
+        reflect the configuration of newly selected sensor.
+
+        :param option: Option of the target select entity.
+        """
+        for sensor in self.sensors:
+            if self.sensor_option(sensor) == option:
+                self._target_index = sensor.index
+                break
+        else:
+            _LOGGER.warning("Unknown sensor '%s' for the editor", option)
+            self._target_index = None
+
+        _LOGGER.debug(
+            'Sensor editor target is set to %s', self._target_index
+        )
+        self.async_update_listeners()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Listen for target sensor changes.
+
+        :param update_callback: Callback to invoke when target changes.
+        :return: Callable to remove the listener.
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Notify listeners on the target sensor change.
+        """
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Services provided by `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from datetime import datetime, timedelta
+from enum import Enum
+import logging
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import JsonValueType
+
+from pyg90alarm import G90History, G90Error, G90TimeoutError, G90AlertTypes
+
+from .const import (
+    DOMAIN, HISTORY_MAX_RECORDS, HISTORY_SERVICE_MAX_AGE, SERVICE_GET_HISTORY,
+    SERVICE_GET_TRACE, SERVICE_PROFILE, ATTR_CONFIG_ENTRY_ID, ATTR_START_TIME,
+    ATTR_END_TIME, ATTR_EVENT_TYPE, ATTR_SENSOR_IDX, ATTR_LIMIT, ATTR_CURSOR,
+    ATTR_DURATION,
+)
+from .profiler import async_get_profiler
+if TYPE_CHECKING:
+    from . import GsAlarmConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Event types as accepted by the service, in lower case
+HISTORY_EVENT_TYPES = {
+    alert_type.name.lower(): alert_type for alert_type in G90AlertTypes
+}
+
+GET_HISTORY_SCHEMA = vol.Schema({
+    vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_START_TIME): cv.datetime,
+    vol.Optional(ATTR_END_TIME): cv.datetime,
+    vol.Optional(ATTR_EVENT_TYPE): vol.In(HISTORY_EVENT_TYPES),
+    vol.Optional(ATTR_SENSOR_IDX): vol.All(
+        vol.Coerce(int), vol.Range(min=0)
+    ),
+    vol.Optional(ATTR_LIMIT, default=50): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=HISTORY_MAX_RECORDS)
+    ),
+    vol.Optional(ATTR_CURSOR): cv.string,
+})
+
+GET_TRACE_SCHEMA = vol.Schema({
+    vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+})
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DURATION, default=30): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=600)
+    ),
+})
+
+
+def _get_loaded_entry(
+    hass: HomeAssistant, entry_id: str
+) -> GsAlarmConfigEntry:
+    """
+    Get the loaded config entry of the integration.
+
+    :param hass: Home Assistant instance.
+    :param entry_id: ID of the config entry.
+    :return: The config entry.
+    """
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key='config_entry_not_loaded',
+            translation_placeholders={'entry_id': entry_id},
+        )
+    return cast('GsAlarmConfigEntry', entry)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Convert the date/time provided to the service to UTC, the one without
+    time zone is considered to be in the local one.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.get_default_time_zone())
+    return dt_util.as_utc(value)
+
+
+def _enum_name(value: Optional[Enum]) -> Optional[str]:
+    """
+    Name of the enum member in lower case, as used in the service response.
+    """
+    return value.name.lower() if value is not None else None
+
+
+def _history_entry_as_dict(entry: G90History) -> Dict[str, Any]:
+    """
+    Representation of the history entry in the service response.
+    """
+    return {
+        'datetime': entry.datetime.isoformat(),
+        'type': _enum_name(entry.type),
+        'source': _enum_name(entry.source),
+        'state': _enum_name(entry.state),
+        'sensor_name': entry.sensor_name,
+        'sensor_idx': entry.sensor_idx,
+    }
+
+
+async def _async_get_history(call: ServiceCall) -> ServiceResponse:
+    """
+    Handle the service call to get the panel history.
+    """
+    entry = _get_loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    history = entry.runtime_data.history
+
+    before_seq = None
+    if (cursor := call.data.get(ATTR_CURSOR)) is not None:
+        try:
+            before_seq = int(cursor)
+        except ValueError as exc:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key='invalid_history_cursor',
+                translation_placeholders={'cursor': cursor},
+            ) from exc
+    elif (
+        history.synced_at is None
+        or dt_util.utcnow() - history.synced_at > HISTORY_SERVICE_MAX_AGE
+    ):
+        # Only the first page picks up the entries not yet stored, so the
+        # pages are consistent with each other. The stored history is served
+        # as is if synchronized recently, so frequent calls don't query the
+        # panel each
+        try:
+            await history.async_sync()
+        except (G90Error, G90TimeoutError) as exc:
+            _LOGGER.warning(
+                'Error synchronizing history, providing the stored one: %s',
+                repr(exc)
+            )
+
+    event_type = call.data.get(ATTR_EVENT_TYPE)
+    entries, next_seq = history.query(
+        start_time=_as_utc(call.data.get(ATTR_START_TIME)),
+        end_time=_as_utc(call.data.get(ATTR_END_TIME)),
+        event_type=HISTORY_EVENT_TYPES[event_type] if event_type else None,
+        sensor_idx=call.data.get(ATTR_SENSOR_IDX),
+        limit=call.data[ATTR_LIMIT],
+        before_seq=before_seq,
+    )
+
+    return {
+        'entries': [_history_entry_as_dict(entry) for entry in entries],
+        'next_cursor': str(next_seq) if next_seq is not None else None,
+    }
+
+
+async def _async_get_trace(call: ServiceCall) -> ServiceResponse:
+    """
+    Handle the service call to get the trace of hot-path events.
+    """
+    entry = _get_loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    return {
+        'records': cast(
+            List[JsonValueType], entry.runtime_data.trace.as_list()
+        ),
+    }
+
+
+async def _async_profile(call: ServiceCall) -> ServiceResponse:
+    """
+    Handle the service call to profile the integration.
+    """
+    path, hotspots = await async_get_profiler(call.hass).async_profile(
+        timedelta(seconds=call.data[ATTR_DURATION])
+    )
+    return {
+        'path': path,
+        'hotspots': [
+            {
+                'function': hotspot.function,
+                'calls': hotspot.calls,
+                'own_time': round(hotspot.own_time, 6),
+                'cumulative_time': round(hotspot.cumulative_time, 6),
+            }
+            for hotspot in hotspots
+        ],
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """
+    Register the services of the integration.
+
+    :param hass: Home Assistant instance.
+    """
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET_HISTORY, _async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET_TRACE, _async_get_trace,
+        schema=GET_TRACE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
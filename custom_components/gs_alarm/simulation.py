@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Simulation of panel alerts from its history for `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+from collections import deque
+from datetime import datetime
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from pyg90alarm import G90History, G90Error, G90TimeoutError
+from pyg90alarm.notifications.base import G90NotificationsBase
+
+from .const import (
+    SIMULATION_INTERVAL_MIN, SIMULATION_INTERVAL_MAX,
+    SIMULATION_INTERVAL_FACTOR, SIMULATION_PACKET_BUDGET,
+    SIMULATION_PACKET_BUDGET_WINDOW,
+)
+if TYPE_CHECKING:
+    from .coordinator import GsAlarmCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GsAlarmAlertSimulation:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Simulates panel alerts from its history entries, for the setups the
+    panel notifications can't be received with.
+
+    New history entries are picked up by synchronizing the local store of
+    the history (see :class:`.GsAlarmHistory`), so only the entries newer
+    than its cursor are fetched from the panel and none are simulated twice.
+    The history is polled often after new entries have been found, and less
+    often the longer there are none. Number of requests to the panel is
+    limited by the budget, polling is delayed once it is exhausted.
+
+    The simulation stops automatically once a packet from the panel is
+    received, since the alerts are delivered by the notifications then.
+
+    :param coordinator: The coordinator to use.
+    """
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        self._coordinator = coordinator
+        # Handles the alerts as if those were received from the panel,
+        # invoking the corresponding callbacks of the client
+        self._notifications = G90NotificationsBase(
+            protocol_factory=lambda: coordinator.client
+        )
+        self._interval = SIMULATION_INTERVAL_MIN
+        self._started_at: Optional[datetime] = None
+        self._cancel_poll: Optional[CALLBACK_TYPE] = None
+        self._remove_history_listener: Optional[CALLBACK_TYPE] = None
+        self._requests: Deque[datetime] = deque()
+        self._stop_listeners: List[Callable[[], None]] = []
+        self._poll_job = HassJob(self._async_poll, cancel_on_shutdown=True)
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Indicates if the simulation is running.
+        """
+        return self._started_at is not None
+
+    @callback
+    def async_add_stop_listener(
+        self, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Add the listener invoked when the simulation stops automatically.
+
+        :param listener: The listener.
+        :return: Callable to remove the listener.
+        """
+        self._stop_listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._stop_listeners:
+                self._stop_listeners.remove(listener)
+
+        return remove_listener
+
+    async def async_start(self) -> None:
+        """
+        Start the simulation.
+
+        The history is synchronized first, so the entries occurred before the
+        simulation is started aren't simulated.
+
+        :raises G90Error: If synchronizing the history fails.
+        :raises G90TimeoutError: If synchronizing the history times out.
+        """
+        if self.is_running:
+            return
+
+        await self._coordinator.history.async_sync()
+        self._remove_history_listener = (
+            self._coordinator.history.async_add_listener(self._simulate)
+        )
+        self._started_at = dt_util.utcnow()
+        self._interval = SIMULATION_INTERVAL_MIN
+        _LOGGER.debug('Started simulating alerts from history')
+        self._schedule_poll()
+
+    @callback
+    def async_stop(self) -> None:
+        """
+        Stop the simulation.
+        """
+        if not self.is_running:
+            return
+
+        if self._cancel_poll is not None:
+            self._cancel_poll()
+            self._cancel_poll = None
+        if self._remove_history_listener is not None:
+            self._remove_history_listener()
+            self._remove_history_listener = None
+        self._started_at = None
+        _LOGGER.debug('Stopped simulating alerts from history')
+
+    @callback
+    def _simulate(self, entries: List[G90History]) -> None:
+        """
+        Simulate the alerts from new history entries.
+
+        :param entries: The entries, from older to newer.
+        """
+        for entry in entries:
+            _LOGGER.debug('Simulating alert from history entry: %s', entry)
+            # History entries don't have the panel GUID, hence skipping its
+            # verification
+            self._notifications.handle_alert(
+                entry.as_device_alert(), verify_device_id=False
+            )
+
+    def _expire_requests(self, now: datetime) -> None:
+        """
+        Forget the requests to the panel out of the budget window.
+
+        :param now: Current time.
+        """
+        while (
+            self._requests
+            and self._requests[0] <= now - SIMULATION_PACKET_BUDGET_WINDOW
+        ):
+            self._requests.popleft()
+
+    @callback
+    def _schedule_poll(self) -> None:
+        """
+        Schedule next poll of the history, delaying it past the current
+        interval if the budget of requests to the panel is exhausted.
+        """
+        now = dt_util.utcnow()
+        self._expire_requests(now)
+        delay = self._interval
+        if len(self._requests) >= SIMULATION_PACKET_BUDGET:
+            budget_delay = (
+                self._requests[0] + SIMULATION_PACKET_BUDGET_WINDOW - now
+            )
+            _LOGGER.debug(
+                'Budget of %s requests per %s exhausted, delaying simulation'
+                ' for %s', SIMULATION_PACKET_BUDGET,
+                SIMULATION_PACKET_BUDGET_WINDOW, budget_delay
+            )
+            delay = max(delay, budget_delay)
+
+        self._cancel_poll = async_call_later(
+            self._coordinator.hass, delay, self._poll_job
+        )
+
+    @property
+    def _push_received(self) -> bool:
+        """
+        Indicates if a packet from the panel has been received since the
+        simulation started.
+        """
+        packet_time = self._coordinator.client.last_device_packet_time
+        return (
+            self._started_at is not None and packet_time is not None
+            and packet_time > self._started_at
+        )
+
+    async def _async_poll(self, _now: datetime) -> None:
+        """
+        Poll the history for new entries, adapting the interval of next
+        poll.
+        """
+        self._cancel_poll = None
+        if self._push_received:
+            _LOGGER.info(
+                'Packets from panel are received, stopping simulation of'
+                ' alerts from history'
+            )
+            self.async_stop()
+            for listener in list(self._stop_listeners):
+                listener()
+            return
+
+        history = self._coordinator.history
+        requests_sent = history.requests_sent
+        try:
+            new_entries = await history.async_sync()
+        except (G90Error, G90TimeoutError) as exc:
+            _LOGGER.debug('Error polling history: %s', repr(exc))
+            new_entries = 0
+        # Synchronization sends as many requests as pages of new history
+        # entries there are, each is charged to the budget. Ones sent by the
+        # periodic synchronization in the meantime are charged too, erring on
+        # the side of the budget
+        now = dt_util.utcnow()
+        self._requests.extend(
+            now for _ in range(history.requests_sent - requests_sent)
+        )
+
+        # Stopped while polling
+        if not self.is_running:
+            return
+
+        if new_entries:
+            self._interval = SIMULATION_INTERVAL_MIN
+        else:
+            self._interval = min(
+                self._interval * SIMULATION_INTERVAL_FACTOR,
+                SIMULATION_INTERVAL_MAX
+            )
+        self._schedule_poll()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        State of the simulation suitable for diagnostics.
+        """
+        self._expire_requests(dt_util.utcnow())
+        return {
+            'running': self.is_running,
+            'interval_seconds': self._interval.total_seconds(),
+            'requests_in_budget_window': len(self._requests),
+        }
@@ -4,13 +4,14 @@
 Switch entities for `gs_alarm` integration.
 """
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 import logging
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EntityCategory
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -21,19 +22,30 @@ from pyg90alarm import (
 
 from .entity_base import (
     G90NetConfigSwitchField, G90SiaConfigSwitchField, G90CidConfigSwitchField,
-    GsAlarmSwitchRestoreEntityBase,
+    GsAlarmSwitchRestoreEntityBase, G90SensorEditorEntityBase,
 )
 from .mixin import (
     GSAlarmGenerateIDsDeviceMixin, GSAlarmGenerateIDsSensorMixin,
-    GSAlarmGenerateIDsCommonMixin
+    GSAlarmGenerateIDsCommonMixin, GsAlarmPanelNameMixinBase,
+    GsAlarmPanelIndexMixinBase,
 )
 from .coordinator import GsAlarmCoordinator
 from .binary_sensor import G90BinarySensor
+from .const import SENSOR_ENTITY_FAMILY_FLAGS, SENSOR_ENTITY_FAMILY_EDITOR
 if TYPE_CHECKING:
     from . import GsAlarmConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor user flags exposed as switches, along with their icons
+SENSOR_FLAG_ICONS = {
+    G90SensorUserFlags.ENABLED: 'mdi:check-circle',
+    G90SensorUserFlags.ARM_DELAY: 'mdi:timer-sand',
+    G90SensorUserFlags.DETECT_DOOR: 'mdi:door',
+    G90SensorUserFlags.DOOR_CHIME: 'mdi:bell',
+    G90SensorUserFlags.INDEPENDENT_ZONE: 'mdi:lock',
+}
+
 
 async def async_setup_entry(
     _hass: HomeAssistant, entry: GsAlarmConfigEntry,
@@ -47,46 +59,37 @@ async def async_setup_entry(
                 [G90Switch(device, entry.runtime_data)]
             )
 
-    def sensor_list_change_callback(sensor: G90Sensor, added: bool) -> None:
-        # Add sensor configuration switches if sensor was added and it
-        # supports updates
-        if added and sensor.supports_updates:
-            switches = [
-                G90SensorFlag(
-                    sensor, entry.runtime_data,
-                    G90SensorUserFlags.ENABLED,
-                    'mdi:check-circle',
-                ),
-                G90SensorFlag(
-                    sensor, entry.runtime_data,
-                    G90SensorUserFlags.ARM_DELAY,
-                    'mdi:timer-sand',
-                ),
-                G90SensorFlag(
-                    sensor, entry.runtime_data,
-                    G90SensorUserFlags.DETECT_DOOR,
-                    'mdi:door',
-                ),
-                G90SensorFlag(
-                    sensor, entry.runtime_data,
-                    G90SensorUserFlags.DOOR_CHIME,
-                    'mdi:bell',
-                ),
-                G90SensorFlag(
-                    sensor, entry.runtime_data,
-                    G90SensorUserFlags.INDEPENDENT_ZONE,
-                    'mdi:lock',
-                ),
-            ]
-            async_add_entities(switches)
+    def sensor_flag_entities(sensor: G90Sensor) -> list[Entity]:
+        # Add sensor configuration switches if sensor supports updates
+        if not sensor.supports_updates:
+            return []
+
+        return [
+            G90SensorFlag(sensor, entry.runtime_data, flag, icon)
+            for flag, icon in SENSOR_FLAG_ICONS.items()
+        ]
+
+    def sensor_editor_entities() -> list[Entity]:
+        # Flag switches of the panel-level sensor editor
+        return [
+            G90SensorEditorFlag(entry.runtime_data, flag, icon)
+            for flag, icon in SENSOR_FLAG_ICONS.items()
+        ]
 
     # Register callbacks for sensor/device list changes
-    entry.runtime_data.client.device_list_change_callback.add(
-        device_list_change_callback
+    entry.async_on_unload(
+        entry.runtime_data.callbacks.add(
+            entry.runtime_data.client.device_list_change_callback,
+            device_list_change_callback
+        )
     )
 
-    entry.runtime_data.client.sensor_list_change_callback.add(
-        sensor_list_change_callback
+    entry.runtime_data.entity_profile.register_family(
+        SENSOR_ENTITY_FAMILY_FLAGS, sensor_flag_entities, async_add_entities
+    )
+    entry.runtime_data.entity_profile.register_panel_family(
+        SENSOR_ENTITY_FAMILY_EDITOR, sensor_editor_entities,
+        async_add_entities
     )
 
     # Alert configuration switches for the panel
@@ -216,7 +219,10 @@ class GsAlarmSwitchStandaloneEntity(
     ENTITY_DOMAIN = SWITCH_DOMAIN
 
 
-class G90Switch(GsAlarmSwitchDeviceEntity):
+class G90Switch(
+    GsAlarmSwitchDeviceEntity, GsAlarmPanelNameMixinBase,
+    GsAlarmPanelIndexMixinBase,
+):
     """
     Switch for the alarm panel's relay.
 
@@ -228,6 +234,7 @@ class G90Switch(GsAlarmSwitchDeviceEntity):
 
     UNIQUE_ID_FMT = "{guid}_switch_{device.index}_{device_subindex}"
     ENTITY_ID_FMT = "{guid}_{device.name}"
+    INDEX_PRIMARY = True
 
     def __init__(
         self, device: G90Device, coordinator: GsAlarmCoordinator
@@ -252,9 +259,7 @@ class G90Switch(GsAlarmSwitchDeviceEntity):
         self._attr_device_info = self.generate_device_info(coordinator, device)
 
         self._attr_translation_key = 'relay'
-        self._attr_translation_placeholders = {
-            'relay': device.name,
-        }
+        self._attr_translation_placeholders = self.panel_name_placeholders()
 
     async def async_added_to_hass(self) -> None:
         """
@@ -269,6 +274,22 @@ class G90Switch(GsAlarmSwitchDeviceEntity):
         )
         self._device.extra_data = self.entity_id
 
+    def panel_name_placeholders(self) -> Dict[str, str]:
+        return {
+            'relay': self._device.name,
+        }
+
+    @property
+    def indexed_panel_entity(self) -> G90Device:
+        return self._device
+
+    @callback
+    def update_panel_name(self) -> None:
+        # Name of multi-node relays includes the name of the node
+        if self._device.node_count > 1:
+            self._attr_name = self._device.name
+        super().update_panel_name()
+
     @property
     def is_on(self) -> bool:
         """
@@ -319,7 +340,9 @@ class G90Switch(GsAlarmSwitchDeviceEntity):
             self.async_write_ha_state()
 
 
-class G90SensorFlag(GsAlarmSwitchSensorConfigEntity):
+class G90SensorFlag(
+    GsAlarmSwitchSensorConfigEntity, GsAlarmPanelIndexMixinBase
+):
     """
     Switch entity for configuration option of the sensor.
 
@@ -364,6 +387,10 @@ class G90SensorFlag(GsAlarmSwitchSensorConfigEntity):
         self._attr_has_entity_name = True
         self._attr_translation_key = f'sensor_flag_{str(flag.name).lower()}'
 
+    @property
+    def indexed_panel_entity(self) -> G90Sensor:
+        return self._sensor
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """
@@ -581,9 +608,14 @@ class G90SimulateAlertsFromHistory(GsAlarmSwitchRestoreEntityBase):
     async def async_added_to_hass(self) -> None:
         """
         Restores the last state on startup and applies it to the
-        coordinator client.
+        simulation.
         """
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.simulation.async_add_stop_listener(
+                self._simulation_stopped
+            )
+        )
         # If the simulation was enabled before restart, re-enable it
         if self._attr_is_on:
             try:
@@ -592,10 +624,7 @@ class G90SimulateAlertsFromHistory(GsAlarmSwitchRestoreEntityBase):
                     ' panel %s',
                     self.coordinator.data.host_info.host_guid
                 )
-                await (
-                    self.coordinator.client
-                    .start_simulating_alerts_from_history()
-                )
+                await self.coordinator.simulation.async_start()
             except (G90Error, G90TimeoutError) as exc:
                 _LOGGER.error(
                     "Error restoring simulation of alerts from history"
@@ -606,15 +635,22 @@ class G90SimulateAlertsFromHistory(GsAlarmSwitchRestoreEntityBase):
                 # Reset the state if restoration failed
                 self._attr_is_on = False
 
+    @callback
+    def _simulation_stopped(self) -> None:
+        """
+        Invoked when the simulation stops automatically, e.g. once the
+        notifications from the panel are received.
+        """
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """
         Turn on the switch.
         """
         try:
             _LOGGER.debug('Starting to simulate device alerts from history')
-            await (
-                self.coordinator.client.start_simulating_alerts_from_history()
-            )
+            await self.coordinator.simulation.async_start()
         except (G90Error, G90TimeoutError) as exc:
             _LOGGER.error(
                 "Error enabling simulation of alerts from history"
@@ -630,19 +666,9 @@ class G90SimulateAlertsFromHistory(GsAlarmSwitchRestoreEntityBase):
         """
         Turn off the switch.
         """
-        try:
-            _LOGGER.debug('Stopping to simulate device alerts from history')
-            await self.coordinator.client.stop_simulating_alerts_from_history()
-        except (G90Error, G90TimeoutError) as exc:
-            _LOGGER.error(
-                "Error disabling simulation of alerts from history"
-                " for panel '%s': %s",
-                self.coordinator.data.host_info.host_guid,
-                repr(exc)
-            )
-        else:
-            # Store the state only if disabling simulation succeeded
-            await super().async_turn_off()
+        _LOGGER.debug('Stopping to simulate device alerts from history')
+        self.coordinator.simulation.async_stop()
+        await super().async_turn_off()
 
 
 class G90SmsAlertWhenArmed(GsAlarmSwitchRestoreEntityBase):
@@ -702,3 +728,77 @@ class G90SmsAlertWhenArmed(GsAlarmSwitchRestoreEntityBase):
         # See comment above
         self.coordinator.client.sms_alert_when_armed = False
         await super().async_turn_off()
+
+
+class G90SensorEditorFlag(SwitchEntity, G90SensorEditorEntityBase):
+    """
+    Switch entity for configuration option of the sensor selected in the
+    panel-level sensor editor.
+
+    :param coordinator: The coordinator to use.
+    :param flag: The sensor user flag this switch controls.
+    :param icon: The icon to use for the switch entity.
+    """
+    # pylint: disable=abstract-method,too-many-instance-attributes
+    # pylint: disable=too-many-ancestors
+    ENTITY_DOMAIN = SWITCH_DOMAIN
+
+    def __init__(
+        self, coordinator: GsAlarmCoordinator,
+        flag: G90SensorUserFlags, icon: str
+    ) -> None:
+        super().__init__(coordinator, f'flag_{str(flag.name).lower()}')
+        self._flag = flag
+        self._attr_icon = icon
+        self._attr_translation_key = (
+            f'sensor_editor_flag_{str(flag.name).lower()}'
+        )
+
+    @property
+    def is_on(self) -> bool | None:
+        """
+        Return the flag value of the selected sensor.
+        """
+        sensor = self.coordinator.sensor_editor.target
+        if sensor is None:
+            return None
+
+        return sensor.get_flag(self._flag)
+
+    async def _set_flag(self, value: bool) -> None:
+        """
+        Set the flag of the selected sensor.
+
+        :param value: The value to set.
+        """
+        sensor = self.coordinator.sensor_editor.target
+        if sensor is None:
+            return
+
+        try:
+            _LOGGER.debug(
+                "%s: Setting the flag '%s' of sensor '%s' to %s",
+                self.unique_id, self._flag.name, sensor.name, value
+            )
+            await sensor.set_flag(self._flag, value)
+        except (G90Error, G90TimeoutError) as exc:
+            _LOGGER.error(
+                "Error setting the flag '%s' of sensor '%s': %s",
+                self._flag.name,
+                sensor.name,
+                repr(exc)
+            )
+
+        await self.coordinator.async_request_refresh()
+
+    async def async_turn_on(self, **_kwargs: Any) -> None:
+        """
+        Turn on the flag of the selected sensor.
+        """
+        await self._set_flag(True)
+
+    async def async_turn_off(self, **_kwargs: Any) -> None:
+        """
+        Turn off the flag of the selected sensor.
+        """
+        await self._set_flag(False)
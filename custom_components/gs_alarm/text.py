@@ -8,10 +8,11 @@ from typing import TYPE_CHECKING, Any, Optional
 import logging
 from abc import ABC, abstractmethod
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EntityCategory
 from homeassistant.components.text import TextEntity
 from homeassistant.components.text.const import DOMAIN as TEXT_DOMAIN
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.core import Event
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -19,13 +20,18 @@ from homeassistant.helpers import device_registry as dr
 
 from pyg90alarm import G90Device, G90Sensor, G90Error, G90TimeoutError
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN, SENSOR_ENTITY_FAMILY_RENAME, SENSOR_ENTITY_FAMILY_EDITOR,
+)
 from .entity_base import (
     GSAlarmEntityBase, G90NetConfigTextField, G90AlarmPhonesTextField,
-    G90SiaConfigTextField, G90CidConfigTextField,
+    G90SiaConfigTextField, G90CidConfigTextField, G90SensorEditorEntityBase,
 )
 from .coordinator import GsAlarmCoordinator
-from .mixin import GSAlarmGenerateIDsSensorMixin, GSAlarmGenerateIDsDeviceMixin
+from .mixin import (
+    GSAlarmGenerateIDsSensorMixin, GSAlarmGenerateIDsDeviceMixin,
+    GsAlarmPanelNameMixinBase, GsAlarmPanelIndexMixinBase,
+)
 from .binary_sensor import G90BinarySensor
 from .switch import G90Switch
 if TYPE_CHECKING:
@@ -44,18 +50,32 @@ async def async_setup_entry(
         if added and device.subindex == 0:
             async_add_entities([G90DeviceName(device, coordinator)])
 
-    def sensor_list_change_callback(sensor: G90Sensor, added: bool) -> None:
+    def sensor_rename_entities(sensor: G90Sensor) -> list[Entity]:
         # Similarly, but for sensors
-        if added and sensor.supports_updates:
-            async_add_entities([G90SensorName(sensor, coordinator)])
+        if not sensor.supports_updates:
+            return []
+        return [G90SensorName(sensor, coordinator)]
 
     coordinator = entry.runtime_data
     # Register callback to add rename text entities for new sensors/devices
-    entry.runtime_data.client.device_list_change_callback.add(
-        device_list_change_callback
+    entry.async_on_unload(
+        entry.runtime_data.callbacks.add(
+            entry.runtime_data.client.device_list_change_callback,
+            device_list_change_callback
+        )
+    )
+    entry.runtime_data.entity_profile.register_family(
+        SENSOR_ENTITY_FAMILY_RENAME, sensor_rename_entities,
+        async_add_entities
     )
-    entry.runtime_data.client.sensor_list_change_callback.add(
-        sensor_list_change_callback
+
+    def sensor_editor_entities() -> list[Entity]:
+        # Name text entity of the panel-level sensor editor
+        return [G90SensorEditorName(coordinator)]
+
+    entry.runtime_data.entity_profile.register_panel_family(
+        SENSOR_ENTITY_FAMILY_EDITOR, sensor_editor_entities,
+        async_add_entities
     )
 
     entities: list[Any] = [
@@ -166,6 +186,7 @@ class G90NewEntityTextBase(
     # pylint: disable=abstract-method,too-many-instance-attributes
     # pylint: disable=too-many-ancestors
     ENTITY_DOMAIN = TEXT_DOMAIN
+    REGISTRATION_EVENT: str
 
     def __init__(
         self, coordinator: GsAlarmCoordinator
@@ -181,6 +202,19 @@ class G90NewEntityTextBase(
         self._attr_native_value = value
         self.async_write_ha_state()
 
+    async def async_added_to_hass(self) -> None:
+        """
+        Invoked by HASS when entity is added.
+        """
+        await super().async_added_to_hass()
+        # The entity listens for registration events to reset its value,
+        # until it is removed
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                self.REGISTRATION_EVENT, self.handle_registration_event
+            )
+        )
+
     async def handle_registration_event(self, event: Event) -> None:
         """
         Handle custom event to reset the text value.
@@ -203,6 +237,7 @@ class G90NewSensorName(G90NewEntityTextBase):
 
     UNIQUE_ID_FMT = "{guid}_new_sensor_name"
     ENTITY_ID_FMT = "{guid}_new_sensor_name"
+    REGISTRATION_EVENT = f"{DOMAIN}_new_sensor_registration"
 
     def __init__(
         self, coordinator: GsAlarmCoordinator
@@ -210,11 +245,6 @@ class G90NewSensorName(G90NewEntityTextBase):
         super().__init__(coordinator)
         self._attr_translation_key = 'new_sensor_name'
 
-        # The text entity listens for registration events to reset its value
-        self.coordinator.hass.bus.async_listen(
-            f"{DOMAIN}_new_sensor_registration", self.handle_registration_event
-        )
-
 
 class G90NewDeviceName(G90NewEntityTextBase):
     """
@@ -227,6 +257,7 @@ class G90NewDeviceName(G90NewEntityTextBase):
 
     UNIQUE_ID_FMT = "{guid}_new_device_name"
     ENTITY_ID_FMT = "{guid}_new_device_name"
+    REGISTRATION_EVENT = f"{DOMAIN}_new_device_registration"
 
     def __init__(
         self, coordinator: GsAlarmCoordinator
@@ -234,11 +265,6 @@ class G90NewDeviceName(G90NewEntityTextBase):
         super().__init__(coordinator)
         self._attr_translation_key = 'new_device_name'
 
-        # The text entity listens for registration events to reset its value
-        self.coordinator.hass.bus.async_listen(
-            f"{DOMAIN}_new_device_registration", self.handle_registration_event
-        )
-
 
 class G90RenameTextEntityBase(
     TextEntity,
@@ -277,6 +303,22 @@ class G90RenameTextEntityBase(
         Rename entity on alarm panel.
         """
 
+    @property
+    @abstractmethod
+    def renamed_panel_entity(self) -> Optional[G90Sensor | G90Device]:
+        """
+        The sensor or relay being renamed.
+        """
+
+    @property
+    def renamed_device_id(self) -> Optional[str]:
+        """
+        ID of HASS device to be renamed along with the panel entity.
+        """
+        if self.registry_entry:
+            return self.registry_entry.device_id
+        return None
+
     async def async_set_value(self, value: str) -> None:
         """
         Set value and apply rename on panel immediately.
@@ -308,32 +350,35 @@ class G90RenameTextEntityBase(
 
         self._attr_native_value = value
 
-        if self.registry_entry and self.registry_entry.device_id:
-            # Update device name immediately in device registry.
-            # This should be updated during config entry reload below,
-            # but we do it here for immediate visibility.
+        if device_id := self.renamed_device_id:
+            # Update device name in device registry, HASS will update names
+            # of the entities bound to the device
             dr.async_get(self.hass).async_update_device(
-                self.registry_entry.device_id,
+                device_id,
                 name=value
             )
+        if panel_entity := self.renamed_panel_entity:
+            self._async_update_renamed_entities(panel_entity)
 
         # Request data update from panel to reflect the new name
         await self.coordinator.async_request_refresh()
 
-        # Ideally, this should only reload entities for the renamed
-        # sensor/device, but the entity registry caches original_name
-        # when entities are first registered. The only reliable way to
-        # update this cache is to reload the integration, which removes
-        # and re-adds all entities with fresh naming metadata.
-        # This causes brief unavailability of all integration
-        # entities, but ensures the name change is reflected.
-        if self.coordinator.config_entry:
-            self.coordinator.hass.config_entries.async_schedule_reload(
-                self.coordinator.config_entry.entry_id
-            )
-
         self.async_write_ha_state()
 
+    @callback
+    def _async_update_renamed_entities(
+        self, panel_entity: G90Sensor | G90Device
+    ) -> None:
+        """
+        Update entities of renamed sensor/relay in place, so that only those
+        reflect the new name instead of reloading all entities of the panel.
+
+        :param panel_entity: The sensor or relay renamed.
+        """
+        for entity in self.coordinator.panel_index.entities(panel_entity):
+            if isinstance(entity, GsAlarmPanelNameMixinBase):
+                entity.update_panel_name()
+
     @property
     def native_value(self) -> str:
         return self.panel_name
@@ -341,7 +386,7 @@ class G90RenameTextEntityBase(
 
 class G90SensorName(
     G90RenameTextEntityBase,
-    GSAlarmGenerateIDsSensorMixin
+    GSAlarmGenerateIDsSensorMixin, GsAlarmPanelIndexMixinBase,
 ):
     """
     Text entity to rename panel sensor.
@@ -373,13 +418,23 @@ class G90SensorName(
     def panel_name(self) -> str:
         return self._sensor.name
 
+    @property
+    def renamed_panel_entity(self) -> G90Sensor:
+        return self._sensor
+
+    @property
+    def indexed_panel_entity(self) -> G90Sensor:
+        return self._sensor
+
     async def set_panel_name(self, value: str) -> None:
         await self._sensor.set_name(value)
+        # Entity IDs and device info depend on the name
+        self.coordinator.id_cache.invalidate(self._sensor)
 
 
 class G90DeviceName(
     G90RenameTextEntityBase,
-    GSAlarmGenerateIDsDeviceMixin
+    GSAlarmGenerateIDsDeviceMixin, GsAlarmPanelIndexMixinBase,
 ):
     """
     Text entity to rename panel relay.
@@ -411,5 +466,68 @@ class G90DeviceName(
     def panel_name(self) -> str:
         return self._device.name
 
+    @property
+    def renamed_panel_entity(self) -> G90Device:
+        return self._device
+
+    @property
+    def indexed_panel_entity(self) -> G90Device:
+        return self._device
+
     async def set_panel_name(self, value: str) -> None:
         await self._device.set_name(value)
+        # Entity IDs and device info depend on the name
+        self.coordinator.id_cache.invalidate(self._device)
+
+
+class G90SensorEditorName(G90SensorEditorEntityBase, G90RenameTextEntityBase):
+    """
+    Text entity to rename the sensor selected in the panel-level sensor
+    editor.
+
+    :param coordinator: The coordinator to use.
+    """
+    # pylint: disable=too-many-ancestors,abstract-method
+    ENTITY_DOMAIN = TEXT_DOMAIN
+
+    def __init__(self, coordinator: GsAlarmCoordinator) -> None:
+        super().__init__(coordinator, 'name')
+        self._attr_translation_key = 'sensor_editor_name'
+
+    @property
+    def entity_kind(self) -> str:
+        return 'sensor'
+
+    @property
+    def panel_name(self) -> str:
+        sensor = self.coordinator.sensor_editor.target
+        return sensor.name if sensor else ''
+
+    @property
+    def renamed_panel_entity(self) -> Optional[G90Sensor]:
+        return self.coordinator.sensor_editor.target
+
+    @property
+    def renamed_device_id(self) -> Optional[str]:
+        sensor = self.coordinator.sensor_editor.target
+        if sensor is None:
+            return None
+
+        # HASS device representing the sensor, not the panel the editor
+        # entity is bound to
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(
+                DOMAIN,
+                G90BinarySensor.generate_unique_id(self.coordinator, sensor)
+            )}
+        )
+        return device.id if device else None
+
+    async def set_panel_name(self, value: str) -> None:
+        sensor = self.coordinator.sensor_editor.target
+        if sensor is None:
+            raise G90Error('No sensor is selected in the editor')
+
+        await sensor.set_name(value)
+        # Entity IDs and device info depend on the name
+        self.coordinator.id_cache.invalidate(sensor)
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+In-memory trace of hot-path events for `gs-alarm` integration.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from enum import Enum
+import time
+
+from .const import TRACE_BUFFER_SIZE
+
+# Trace record: time stamp (seconds since epoch), event kind, sensor index,
+# value and latency (seconds)
+TraceRecordT = Tuple[float, str, Optional[int], Any, Optional[float]]
+
+
+def _dump_value(value: Any) -> Any:
+    """
+    Representation of the record value suitable for JSON.
+
+    :param value: The value.
+    :return: The representation.
+    """
+    if isinstance(value, Enum):
+        return value.name
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return [_dump_value(item) for item in value]
+    return repr(value)
+
+
+class GsAlarmTrace:
+    """
+    Fixed-size ring buffer of hot-path events - panel callbacks, commands
+    sent to the panel and state writes of the entities.
+
+    Records are compact tuples stored into the buffer preallocated upfront,
+    with the oldest ones overwritten, and nothing is formatted until the
+    trace is dumped. That makes it cheap enough to be always on, so races
+    could be investigated after the fact without enabling debug logging.
+
+    :param size: Number of records the buffer holds.
+    """
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> None:
+        self._buffer: List[Optional[TraceRecordT]] = [None] * size
+        self._next = 0
+
+    def record(
+        self, kind: str, index: Optional[int] = None, value: Any = None,
+        latency: Optional[float] = None
+    ) -> None:
+        """
+        Record the event.
+
+        :param kind: Kind of the event.
+        :param index: Index of the sensor the event relates to, if any.
+        :param value: Value of the event, formatted only when dumped.
+        :param latency: Time the event took, in seconds.
+        """
+        self._buffer[self._next] = (time.time(), kind, index, value, latency)
+        self._next = (self._next + 1) % len(self._buffer)
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """
+        Records of the trace suitable for diagnostics and services, from
+        older to newer.
+        """
+        records = self._buffer[self._next:] + self._buffer[:self._next]
+        return [
+            {
+                'time': datetime.fromtimestamp(
+                    timestamp, timezone.utc
+                ).isoformat(),
+                'kind': kind,
+                'index': index,
+                'value': _dump_value(value),
+                'latency': round(latency, 6) if latency is not None else None,
+            }
+            for timestamp, kind, index, value, latency in filter(None, records)
+        ]
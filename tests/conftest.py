@@ -263,7 +263,10 @@ def mock_g90alarm(request: pytest.FixtureRequest) -> Iterator[AlarmMockT]:
             ) -> None:
                 """ Simulates setting the device name on the panel. """
                 device_names[device.index] = name
-                device.protocol_data.parent_name = name
+                # The name is shared by all nodes of multi-node device
+                for node in mock_devices:
+                    if node.index == device.index:
+                        node.protocol_data.parent_name = name
 
             mock_device.turn_on = AsyncMock()  # type: ignore[method-assign]
             mock_device.turn_off = AsyncMock()  # type: ignore[method-assign]
@@ -310,7 +313,7 @@ def mock_g90alarm(request: pytest.FixtureRequest) -> Iterator[AlarmMockT]:
     with (
         # Mock the discover class method for config flow
         patch(
-            'custom_components.gs_alarm.config_flow.G90Alarm.discover',
+            'custom_components.gs_alarm.discovery.G90Alarm.discover',
             return_value=discovery_results
         ),
         # Main G90Alarm mock — fresh client per constructor call
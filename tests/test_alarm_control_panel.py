@@ -3,13 +3,20 @@
 """
 Tests for the alarm control panel entity.
 """
+from datetime import timedelta
 from unittest.mock import AsyncMock
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
+    async_capture_events,
+)
+from homeassistant.core import HomeAssistant, State
+from homeassistant.components.alarm_control_panel.const import (
+    AlarmControlPanelState,
 )
-from homeassistant.core import HomeAssistant
 from homeassistant.const import (
+    EVENT_STATE_CHANGED,
     SERVICE_ALARM_ARM_AWAY,
     SERVICE_ALARM_ARM_HOME,
     SERVICE_ALARM_DISARM,
@@ -82,3 +89,68 @@ async def test_alarm_panel_requests_refresh_on_service_calls(
 
     # Verify that coordinator refresh was requested for each service call
     assert coordinator.async_request_refresh.call_count == 3
+
+
+@pytest.mark.g90host_status(
+    result=G90ArmDisarmTypes.DISARM
+)
+async def test_alarm_panel_leaves_triggered_state(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Tests the alarm panel leaves triggered state upon the notification or
+    the update, even if those carry the state already seen within the
+    deduplication window, while the update re-reading the current state
+    isn't written.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test-leave-triggered"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    coordinator = config_entry.runtime_data
+    g90_client = mock_g90alarm.return_value
+
+    def panel_state() -> State:
+        return hass_get_state_by_unique_id(
+            hass, 'alarm_control_panel', 'dummy_guid'
+        )
+
+    # Panel returning to armed state after the alarm isn't suppressed as
+    # duplicate of the arming notification
+    await g90_client.on_armdisarm(G90ArmDisarmTypes.ARM_AWAY)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_alarm(0, 'Dummy sensor', is_tampered=False)
+    await allow_callbacks_to_complete(hass)
+    assert panel_state().state == AlarmControlPanelState.TRIGGERED
+    await g90_client.on_armdisarm(G90ArmDisarmTypes.ARM_AWAY)
+    await allow_callbacks_to_complete(hass)
+    assert panel_state().state == AlarmControlPanelState.ARMED_AWAY
+
+    # Update reading the panel disarmed leaves triggered state
+    freezer.tick(timedelta(seconds=10))
+    await g90_client.on_alarm(0, 'Dummy sensor', is_tampered=False)
+    await allow_callbacks_to_complete(hass)
+    assert panel_state().state == AlarmControlPanelState.TRIGGERED
+    await coordinator.async_refresh()
+    await allow_callbacks_to_complete(hass)
+    assert panel_state().state == AlarmControlPanelState.DISARMED
+
+    # Update reading the same state again isn't written
+    entity_id = panel_state().entity_id
+    last_reported = panel_state().last_reported
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    freezer.tick(timedelta(seconds=1))
+    await coordinator.async_refresh()
+    await allow_callbacks_to_complete(hass)
+    assert not [
+        event for event in state_changes
+        if event.data['entity_id'] == entity_id
+    ]
+    assert panel_state().last_reported == last_reported
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for hold-off of binary sensor state changes.
+"""
+from datetime import timedelta
+from unittest.mock import patch
+from freezegun.api import FrozenDateTimeFactory
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED
+
+from pyg90alarm import G90PeripheralTypes
+
+from custom_components.gs_alarm.const import (
+    DOMAIN,
+    CONF_MOTION_SENSOR_HOLD_OFF,
+)
+from .conftest import (
+    AlarmMockT, hass_get_entity_id_by_unique_id, allow_callbacks_to_complete,
+)
+
+
+# The mocked sensor is of door type, treat it as motion one
+@patch.dict(
+    'custom_components.gs_alarm.binary_sensor.SENSOR_HOLD_OFF_OPTIONS',
+    {G90PeripheralTypes.DOOR: CONF_MOTION_SENSOR_HOLD_OFF}
+)
+async def test_binary_sensor_hold_off(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verifies the first state change is written immediately, subsequent ones
+    are coalesced until the hold-off period ends, and the alarm isn't held
+    off.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={CONF_MOTION_SENSOR_HOLD_OFF: 10},
+        entry_id='test_hold_off',
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    entity_id = hass_get_entity_id_by_unique_id(
+        hass, 'binary_sensor', 'dummy_guid_sensor_0'
+    )
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    def written_states() -> list[str]:
+        return [
+            event.data['new_state'].state for event in state_changes
+            if event.data['entity_id'] == entity_id
+        ]
+
+    g90_client = mock_g90alarm.return_value
+    # First change is written immediately, rapid subsequent ones are held off
+    await g90_client.on_door_open_close(0, 'Dummy sensor', True)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_door_open_close(0, 'Dummy sensor', False)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_door_open_close(0, 'Dummy sensor', True)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_door_open_close(0, 'Dummy sensor', False)
+    await allow_callbacks_to_complete(hass)
+    assert written_states() == ['on']
+    # The changes held off are recorded as skipped writes
+    assert len([
+        record for record in config_entry.runtime_data.trace.as_list()
+        if record['kind'] == 'state_write_suppressed'
+        and record['index'] == 0
+    ]) == 3
+
+    # The changes held off are written once the period ends
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await allow_callbacks_to_complete(hass)
+    assert written_states() == ['on', 'off']
+
+    # Alarm triggered by the sensor is written immediately, despite new
+    # hold-off period has started
+    await g90_client.on_alarm(0, 'Dummy sensor', False)
+    await allow_callbacks_to_complete(hass)
+    assert written_states() == ['on', 'off', 'on']
@@ -11,6 +11,7 @@ from pytest_homeassistant_custom_component.common import (
 )
 
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
 
 from custom_components.gs_alarm.const import (
     DOMAIN,
@@ -219,3 +220,57 @@ async def test_binary_sensor_restore_state_independent_across_entities(
     assert hass_get_state_by_unique_id(
         hass, 'binary_sensor', LOW_BATTERY_SENSOR_UNIQUE_ID
     ).state == 'off'
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+@pytest.mark.parametrize(
+    'options,expected_prefetched',
+    [
+        pytest.param(
+            {}, {MAIN_SENSOR_ENTITY_ID: 'on'}, id='enabled',
+        ),
+        pytest.param(
+            {CONF_RESTORE_STATE_AT_STARTUP: False}, {}, id='disabled',
+        ),
+    ],
+)
+async def test_binary_sensor_restore_state_prefetch(
+    hass: HomeAssistant, options: dict[str, bool],
+    expected_prefetched: dict[str, str],
+) -> None:
+    """
+    Verifies last states of registered entities are prefetched in bulk, and
+    the prefetch is skipped when restore_state_at_startup is off.
+    """
+    mock_restore_cache(hass, [State(MAIN_SENSOR_ENTITY_ID, 'on')])
+
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options=options,
+        entry_id='test_binary_sensor_restore_prefetch',
+    )
+    config_entry.add_to_hass(hass)
+    # Simulate the entity has been registered during previous run
+    er.async_get(hass).async_get_or_create(
+        'binary_sensor', DOMAIN, MAIN_SENSOR_UNIQUE_ID,
+        config_entry=config_entry,
+        suggested_object_id='dummy_guid_dummy_sensor',
+    )
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    coordinator = config_entry.runtime_data
+    # Re-run the prefetch to inspect its results, since those are consumed
+    # by the entities during setup
+    coordinator.prefetch_last_states()
+    assert {
+        entity_id: state.state
+        for entity_id, state in coordinator.last_states.items()
+        if state is not None
+    } == expected_prefetched
+    await allow_callbacks_to_complete(hass)
+
+    sensor_state = hass_get_state_by_unique_id(
+        hass, 'binary_sensor', MAIN_SENSOR_UNIQUE_ID
+    )
+    assert sensor_state.state == ('on' if expected_prefetched else 'off')
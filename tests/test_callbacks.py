@@ -3,18 +3,25 @@
 """
 Tests callbacks for the custom component.
 """
+from datetime import timedelta
 import pytest
+from pytest_unordered import unordered
+from freezegun.api import FrozenDateTimeFactory
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
+    async_capture_events,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.components.alarm_control_panel.const import (
     AlarmControlPanelState,
 )
 
 from pyg90alarm import G90ArmDisarmTypes
 
-from custom_components.gs_alarm.const import DOMAIN
+from custom_components.gs_alarm.const import (
+    DOMAIN, EVENT_ALARM, EVENT_ARMDISARM, EVENT_SENSOR,
+)
 from .conftest import (
     AlarmMockT, hass_get_state_by_unique_id, allow_callbacks_to_complete,
 )
@@ -237,3 +244,142 @@ async def test_door_open_when_arming_callback(
 
     assert sensor_state.attributes != {}
     assert sensor_state.attributes.get('door_open_when_arming') is True
+
+
+async def test_bus_events(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Tests alarm, arm/disarm and sensor events are fired on HASS event bus.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test-bus-events"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    alarm_events = async_capture_events(hass, EVENT_ALARM)
+    armdisarm_events = async_capture_events(hass, EVENT_ARMDISARM)
+    sensor_events = async_capture_events(hass, EVENT_SENSOR)
+
+    g90_client = mock_g90alarm.return_value
+    # Alarm also results in sensor activity, since the sensor isn't active
+    await g90_client.on_alarm(0, 'Dummy sensor', is_tampered=False)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_door_open_close(0, 'Dummy sensor', False)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_armdisarm(G90ArmDisarmTypes.ARM_AWAY)
+    await allow_callbacks_to_complete(hass)
+
+    assert [event.data for event in alarm_events] == [{
+        'guid': 'Dummy GUID',
+        'sensor_idx': 0,
+        'sensor_name': 'Dummy sensor',
+        'entity_id': 'binary_sensor.dummy_guid_dummy_sensor',
+    }]
+    assert [event.data for event in sensor_events] == [{
+        'guid': 'Dummy GUID',
+        'sensor_idx': 0,
+        'sensor_name': 'Dummy sensor',
+        'entity_id': 'binary_sensor.dummy_guid_dummy_sensor',
+        'state': True,
+    }, {
+        'guid': 'Dummy GUID',
+        'sensor_idx': 0,
+        'sensor_name': 'Dummy sensor',
+        'entity_id': 'binary_sensor.dummy_guid_dummy_sensor',
+        'state': False,
+    }]
+    assert [event.data for event in armdisarm_events] == [{
+        'guid': 'Dummy GUID',
+        'state': 'arm_away',
+    }]
+
+
+@pytest.mark.g90host_status(
+    result=G90ArmDisarmTypes.DISARM
+)
+async def test_duplicate_events_suppressed(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Tests same notifications received within the deduplication window (e.g.
+    over local and cloud paths) result in single event and state change.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test-duplicate-events"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    armdisarm_events = async_capture_events(hass, EVENT_ARMDISARM)
+    sensor_events = async_capture_events(hass, EVENT_SENSOR)
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    g90_client = mock_g90alarm.return_value
+    for _ in range(2):
+        await g90_client.on_armdisarm(G90ArmDisarmTypes.ARM_AWAY)
+        await allow_callbacks_to_complete(hass)
+        await g90_client.on_door_open_close(0, 'Dummy sensor', True)
+        await allow_callbacks_to_complete(hass)
+
+    assert len(armdisarm_events) == 1
+    assert len(sensor_events) == 1
+    assert [
+        event.data['entity_id'] for event in state_changes
+    ] == unordered([
+        'alarm_control_panel.dummy_guid',
+        'binary_sensor.dummy_guid_dummy_sensor',
+    ])
+
+    # Same notification received past the window isn't a duplicate
+    freezer.tick(timedelta(seconds=10))
+    await g90_client.on_armdisarm(G90ArmDisarmTypes.ARM_AWAY)
+    await allow_callbacks_to_complete(hass)
+    assert len(armdisarm_events) == 2
+
+
+@pytest.mark.g90host_status(
+    result=G90ArmDisarmTypes.DISARM
+)
+async def test_alarm_after_disarm_not_suppressed(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Tests the alarm from the same sensor following the panel disarmed within
+    the deduplication window (e.g. 24h zone) results in new event and
+    triggered state.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test-alarm-after-disarm"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    alarm_events = async_capture_events(hass, EVENT_ALARM)
+
+    g90_client = mock_g90alarm.return_value
+    await g90_client.on_alarm(0, 'Dummy sensor', is_tampered=False)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_armdisarm(G90ArmDisarmTypes.DISARM)
+    await allow_callbacks_to_complete(hass)
+    await g90_client.on_alarm(0, 'Dummy sensor', is_tampered=False)
+    await allow_callbacks_to_complete(hass)
+
+    assert len(alarm_events) == 2
+    assert hass_get_state_by_unique_id(
+        hass, 'alarm_control_panel', 'dummy_guid'
+    ).state == AlarmControlPanelState.TRIGGERED
@@ -3,7 +3,8 @@
 """
 Tests config flow for the custom component.
 """
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from homeassistant.core import HomeAssistant
@@ -132,6 +133,94 @@ async def test_config_flow_manual_device_no_ip_addr(
     assert result['errors']
 
 
+def mock_sweep_discovery(**kwargs: Any) -> Mock:
+    """
+    Mocks discovery of the host while sweeping the network, only
+    `10.0.0.5` host has the panel.
+    """
+    devices = []
+    if kwargs['host'] == '10.0.0.5':
+        devices = [Mock(guid='Dummy guid', host=kwargs['host'], port=4321)]
+    return Mock(process=AsyncMock(return_value=Mock(devices=devices)))
+
+
+# Same panel is discovered by the broadcast, while on the same network segment
+@pytest.mark.parametrize('broadcast_devices', [
+    pytest.param([], id='broadcast_filtered'),
+    pytest.param([
+        Mock(guid='Dummy guid', host='10.0.0.5', port=4321)
+    ], id='broadcast_merged'),
+])
+async def test_config_flow_network_sweep(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    broadcast_devices: list[Mock]
+) -> None:
+    """
+    Tests config flow discovering the device by sweeping the network, merging
+    the results with the broadcast discovery.
+    """
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": "user"},
+    )
+    assert result['step_id'] == 'confirm'
+
+    with (
+        patch(
+            'custom_components.gs_alarm.discovery.G90Discovery',
+            side_effect=mock_sweep_discovery
+        ) as discovery_mock,
+        patch(
+            'custom_components.gs_alarm.discovery.G90Alarm.discover',
+            return_value=broadcast_devices
+        ),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            flow_id=result['flow_id'],
+            user_input={'discovery_network': '10.0.0.1/29'},
+        )
+
+    # Each host of the network has been queried directly
+    assert sorted(
+        call.kwargs['host'] for call in discovery_mock.call_args_list
+    ) == [f'10.0.0.{host}' for host in range(1, 7)]
+    assert result['type'] == FlowResultType.CREATE_ENTRY
+    assert result['result'].data == {'ip_addr': '10.0.0.5'}
+    mock_g90alarm.assert_called_with(host='10.0.0.5')
+
+
+@pytest.mark.parametrize('network,error', [
+    pytest.param('dummy-network', 'invalid_network', id='invalid'),
+    pytest.param('fe80::/64', 'invalid_network', id='ipv6'),
+    pytest.param('10.0.0.0/16', 'network_too_large', id='too_large'),
+])
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_config_flow_network_sweep_invalid(
+    hass: HomeAssistant, network: str, error: str
+) -> None:
+    """
+    Tests config flow rejecting the network to sweep being invalid or too
+    large.
+    """
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": "user"},
+    )
+
+    with patch(
+        'custom_components.gs_alarm.discovery.G90Discovery'
+    ) as discovery_mock:
+        result = await hass.config_entries.flow.async_configure(
+            flow_id=result['flow_id'],
+            user_input={'discovery_network': network},
+        )
+
+    discovery_mock.assert_not_called()
+    assert result['type'] == FlowResultType.FORM
+    assert result['step_id'] == 'confirm'
+    assert result['errors'] == {'discovery_network': error}
+
+
 @pytest.mark.usefixtures('mock_g90alarm')
 async def test_options_flow_restore_state_at_startup(
     hass: HomeAssistant,
@@ -16,6 +16,7 @@ from pyg90alarm import G90TimeoutError
 
 from custom_components.gs_alarm.const import DOMAIN, SCAN_INTERVAL
 from custom_components.gs_alarm.coordinator import GsAlarmCoordinator
+from custom_components.gs_alarm.binary_sensor import G90BinarySensor
 
 from .conftest import AlarmMockT
 
@@ -57,3 +58,48 @@ async def test_coordinator_sets_retry_after_on_timeout(
     assert isinstance(exc.retry_after, float)
     assert exc.retry_after == SCAN_INTERVAL.total_seconds()
     assert "Timeout updating panel" in str(exc)
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_coordinator_id_cache(hass: HomeAssistant) -> None:
+    """
+    Verify that generated IDs and device info are memoized per coordinator
+    and not reused for the sensor renamed outside of the integration.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"ip_addr": "dummy-ip"},
+        entry_id="test",
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = config_entry.runtime_data
+    sensor = coordinator.data.sensors[0]
+
+    # Device info is shared by all entities of the sensor
+    device_info = G90BinarySensor.generate_device_info(coordinator, sensor)
+    assert G90BinarySensor.generate_device_info(
+        coordinator, sensor
+    ) is device_info
+    entity_id = G90BinarySensor.generate_entity_id(coordinator, sensor)
+    assert entity_id == 'binary_sensor.dummy_guid_dummy_sensor'
+    entries = len(coordinator.id_cache)
+
+    # Renaming the sensor (e.g. from the keypad) should result in new entries
+    # with no explicit invalidation
+    await sensor.set_name('Renamed sensor')
+
+    assert G90BinarySensor.generate_device_info(
+        coordinator, sensor
+    ) is not device_info
+    assert G90BinarySensor.generate_entity_id(
+        coordinator, sensor
+    ) == 'binary_sensor.dummy_guid_renamed_sensor'
+    # Entries for the previous name are evicted rather than kept around
+    assert len(coordinator.id_cache) == entries
+    # Unique ID doesn't depend on the name
+    assert G90BinarySensor.generate_unique_id(
+        coordinator, sensor
+    ) == 'dummy_guid_sensor_0'
@@ -3,10 +3,16 @@
 """
 Tests for integration diagnostics.
 """
+from typing import Any
+from datetime import timedelta
+from unittest.mock import patch
+import asyncio
+import time
 import pytest
 from pytest_unordered import unordered
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
+    async_capture_events,
 )
 from pytest_homeassistant_custom_component.typing import (
     ClientSessionGenerator
@@ -15,9 +21,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.helpers.device_registry as dr
 
-from pyg90alarm import G90Error
+from pyg90alarm import G90Error, G90TimeoutError
 
-from custom_components.gs_alarm.const import DOMAIN
+from custom_components.gs_alarm.const import DOMAIN, EVENT_SLOW_CALLBACK
 from .conftest import AlarmMockT, allow_callbacks_to_complete
 
 
@@ -41,14 +47,15 @@ from .conftest import AlarmMockT, allow_callbacks_to_complete
         id="CID not supported",
     ),
 ])
-@pytest.mark.usefixtures('mock_g90alarm')
 async def test_diagnostics(
     hass: HomeAssistant, hass_client: ClientSessionGenerator,
+    mock_g90alarm: AlarmMockT,
     sia_supported: bool,
     cid_supported: bool
 ) -> None:
     """
-    Verifies diagnostics are successfully generated.
+    Verifies diagnostics are successfully generated from the data the
+    integration holds, with no requests to the panel.
     """
     config_entry = MockConfigEntry(
         domain=DOMAIN,
@@ -69,7 +76,9 @@ async def test_diagnostics(
 
     # Keys expected for the response
     expected_data_keys = unordered([
-        'config_entry', 'device_entry', 'alarm_panel'
+        'config_entry', 'device_entry', 'alarm_panel', 'sections',
+        'live_callbacks', 'notification_metrics', 'panel_index',
+        'alert_simulation', 'performance', 'trace',
     ])
     # And its `alarm_panel` nested element
     expected_alarm_panel_keys = unordered([
@@ -87,6 +96,7 @@ async def test_diagnostics(
     )
 
     # Simulate diagnostics download for the config entry
+    mock_g90alarm.return_value.reset_mock()
     client = await hass_client()
     response = await client.get(
         f"/api/diagnostics/config_entry/{config_entry.entry_id}"
@@ -96,6 +106,16 @@ async def test_diagnostics(
     data = response_dict.get('data')
     assert list(data.keys()) == expected_data_keys
     assert list(data['alarm_panel'].keys()) == expected_alarm_panel_keys
+    # Status of each section is recorded
+    assert data['sections']['host_info']['status'] == 'ok'
+    assert data['sections']['host_info']['source'] == 'cache'
+    assert data['sections']['host_info']['fetched_at'] is not None
+    assert data['sections']['host_info']['error'] is None
+    assert data['sections']['sia_config']['status'] == (
+        'ok' if sia_supported else 'unsupported'
+    )
+    # The history has not been synchronized yet
+    assert data['sections']['history']['fetched_at'] is None
 
     # Same but for the device
     response = await client.get(
@@ -108,19 +128,68 @@ async def test_diagnostics(
     assert list(data.keys()) == expected_data_keys
     assert list(data['alarm_panel'].keys()) == expected_alarm_panel_keys
 
+    # No requests to the panel have been made
+    assert mock_g90alarm.return_value.method_calls == []
+
+
+async def test_diagnostics_live(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator,
+    mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies only the sections older than the maximum age are fetched from the
+    panel in live mode.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={'live_diagnostics': True},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await async_setup_component(hass, "diagnostics", {})
+    await allow_callbacks_to_complete(hass)
+    g90_client = mock_g90alarm.return_value
+    g90_client.reset_mock()
+
+    # The data is recent enough, except the history never synchronized
+    client = await hass_client()
+    response = await client.get(
+        f"/api/diagnostics/config_entry/{config_entry.entry_id}"
+    )
+    data = (await response.json()).get('data')
+    assert data['sections']['host_info']['source'] == 'cache'
+    assert data['sections']['history']['source'] == 'live'
+    g90_client.get_host_info.assert_not_called()
+    g90_client.history.assert_called_once()
+
+    # The data held becomes outdated
+    with patch(
+        'custom_components.gs_alarm.diagnostics.DIAGNOSTICS_LIVE_MAX_AGE',
+        timedelta(seconds=-1)
+    ):
+        response = await client.get(
+            f"/api/diagnostics/config_entry/{config_entry.entry_id}"
+        )
+    data = (await response.json()).get('data')
+    assert data['sections']['host_info']['source'] == 'live'
+    assert data['sections']['host_info']['duration'] is not None
+    g90_client.get_host_info.assert_called_once()
+
 
 async def test_diagnostics_exception(
     hass: HomeAssistant, hass_client: ClientSessionGenerator,
     mock_g90alarm: AlarmMockT
 ) -> None:
     """
-    Verify the `pyg90alarm` error doesn't lead to diagnostics resulting in
-    internal error sent back to the client.
+    Verify the `pyg90alarm` error or timeout fetching a section in live mode
+    doesn't prevent other sections from being fetched, the data held is
+    provided instead and the failure is recorded in the section status.
     """
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         data={'ip_addr': 'dummy-ip'},
-        options={},
+        options={'live_diagnostics': True},
         entry_id="test-diag"
     )
     config_entry.add_to_hass(hass)
@@ -128,18 +197,181 @@ async def test_diagnostics_exception(
     await async_setup_component(hass, "diagnostics", {})
     await allow_callbacks_to_complete(hass)
 
+    async def hang(*_args: Any, **_kwargs: Any) -> None:
+        await asyncio.sleep(10)
+
     # Simulate exception raised from `G90Alarm.history()`
     mock_g90alarm.return_value.history.side_effect = G90Error()
+    # And `G90Alarm.get_alert_config()` not responding
+    mock_g90alarm.return_value.get_alert_config.side_effect = hang
 
     client = await hass_client()
-    response = await client.get(
-        f"/api/diagnostics/config_entry/{config_entry.entry_id}"
-    )
+    with (
+        patch(
+            'custom_components.gs_alarm.diagnostics'
+            '.DIAGNOSTICS_SECTION_TIMEOUT',
+            timedelta(milliseconds=100)
+        ),
+        # Have the data held outdated, so it is fetched in live mode
+        patch(
+            'custom_components.gs_alarm.diagnostics.DIAGNOSTICS_LIVE_MAX_AGE',
+            timedelta(seconds=-1)
+        ),
+    ):
+        response = await client.get(
+            f"/api/diagnostics/config_entry/{config_entry.entry_id}"
+        )
     # Verify the response
     response_dict = await response.json()
     data = response_dict.get('data')
-    assert data == {
-        'error':
-            "Unable to gather diagnostics data for"
-            " panel 'Dummy GUID': G90Error()"
+    assert data['alarm_panel']['history'] == []
+    assert 'alert_config' in data['alarm_panel']
+    assert data['sections']['host_info']['source'] == 'live'
+    assert data['sections']['history'] == {
+        'status': 'error',
+        'source': 'cache',
+        'fetched_at': None,
+        'duration': data['sections']['history']['duration'],
+        'error': 'G90Error()',
+    }
+    assert data['sections']['alert_config']['status'] == 'timeout'
+    assert data['sections']['alert_config']['source'] == 'cache'
+    assert data['sections']['alert_config']['duration'] >= 0.1
+
+
+async def test_diagnostics_performance(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator,
+    mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies diagnostics include the runtime performance metrics.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await async_setup_component(hass, "diagnostics", {})
+    await allow_callbacks_to_complete(hass)
+    coordinator = config_entry.runtime_data
+    polls = coordinator.performance.as_dict()['polls']['count']
+
+    # Update with no changes, the state writes are suppressed
+    await coordinator.async_refresh()
+    # Update timing out
+    mock_g90alarm.return_value.get_host_status.side_effect = (
+        G90TimeoutError()
+    )
+    await coordinator.async_refresh()
+    # Packet from the panel
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', True
+    )
+    await allow_callbacks_to_complete(hass)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/diagnostics/config_entry/{config_entry.entry_id}"
+    )
+    data = (await response.json()).get('data')
+    performance = data['performance']
+    assert performance['polls']['count'] == polls + 2
+    assert performance['polls']['failed'] == 1
+    assert performance['polls']['max'] >= performance['polls']['min']
+    assert performance['commands']['get_sensors']['count'] == polls + 2
+    assert performance['commands']['get_host_status']['timeouts'] == 1
+    assert performance['commands']['get_host_status']['errors'] == 0
+    assert performance['entities']['binary_sensor'] > 0
+    assert performance['callbacks'] == len(coordinator.callbacks)
+    assert performance['state_writes']['binary_sensor']['emitted'] > 0
+    assert performance['state_writes']['alarm_control_panel'][
+        'suppressed'
+    ] > 0
+    assert performance['event_loop_time']['panel_callbacks'][
+        'invocations'
+    ] > 0
+    assert performance['event_loop_time']['coordinator_listeners'][
+        'invocations'
+    ] > 0
+    assert 'device_notifications_per_minute' in performance
+
+
+class SlowEntity:  # pylint: disable=too-few-public-methods
+    """
+    Entity with the callback blocking the event loop.
+    """
+    entity_id = 'binary_sensor.slow'
+
+    def slow_sensor_callback(self, *_args: Any) -> None:
+        """
+        Callback blocking the event loop.
+        """
+        time.sleep(0.01)
+
+
+async def test_diagnostics_slow_callbacks(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator,
+    mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies the callbacks running longer than the threshold are reported
+    with the event and aggregated by the entity class in diagnostics.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await async_setup_component(hass, "diagnostics", {})
+    await allow_callbacks_to_complete(hass)
+    coordinator = config_entry.runtime_data
+    coordinator.callbacks.add(
+        mock_g90alarm.return_value.sensor_callback,
+        SlowEntity().slow_sensor_callback
+    )
+    slow_callback_events = async_capture_events(hass, EVENT_SLOW_CALLBACK)
+
+    # Detection is disabled by default
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', True
+    )
+    await allow_callbacks_to_complete(hass)
+    assert not slow_callback_events
+
+    # Enabling the detection takes effect with no reload
+    hass.config_entries.async_update_entry(
+        config_entry, options={'slow_callback_threshold': 5}
+    )
+    await allow_callbacks_to_complete(hass)
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', False
+    )
+    await allow_callbacks_to_complete(hass)
+
+    events = [
+        event.data for event in slow_callback_events
+        if event.data['entity_class'] == 'SlowEntity'
+    ]
+    assert len(events) == 1
+    assert events[0]['callback'] == 'slow_sensor_callback'
+    assert events[0]['entity_id'] == 'binary_sensor.slow'
+    assert events[0]['duration'] >= 0.01
+    assert events[0]['guid'] == 'Dummy GUID'
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/diagnostics/config_entry/{config_entry.entry_id}"
+    )
+    data = (await response.json()).get('data')
+    slow_callbacks = data['performance']['slow_callbacks']
+    assert slow_callbacks['threshold'] == 0.005
+    assert slow_callbacks['by_entity_class']['SlowEntity'] == {
+        'count': 1,
+        'total': events[0]['duration'],
+        'max': events[0]['duration'],
+        'worst_callback': 'slow_sensor_callback',
     }
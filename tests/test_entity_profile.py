@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for entity profiles controlling per-sensor entities.
+"""
+from __future__ import annotations
+from typing import List
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_UNAVAILABLE
+import homeassistant.helpers.entity_registry as er
+
+from custom_components.gs_alarm.const import (
+    DOMAIN,
+    CONF_ENTITY_PROFILE,
+    CONF_OPT_ENTITY_PROFILE_MINIMAL,
+    CONF_OPT_ENTITY_PROFILE_STANDARD,
+    CONF_OPT_ENTITY_PROFILE_FULL,
+)
+from .conftest import allow_callbacks_to_complete
+
+
+def sensor_unique_ids(hass: HomeAssistant, entry_id: str) -> List[str]:
+    """
+    Returns sorted unique IDs of entities for the sensor with index 0.
+    """
+    return sorted(
+        x.unique_id for x in er.async_entries_for_config_entry(
+            er.async_get(hass), entry_id
+        )
+        if x.unique_id.startswith('dummy_guid_sensor_0')
+    )
+
+
+SENSOR_STATE_IDS = [
+    'dummy_guid_sensor_0',
+]
+SENSOR_ATTRIBUTE_IDS = [
+    'dummy_guid_sensor_0_low_battery',
+    'dummy_guid_sensor_0_open_when_armed',
+    'dummy_guid_sensor_0_tampered',
+]
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_entity_profile_switch(hass: HomeAssistant) -> None:
+    """
+    Tests switching entity profiles adds and removes per-sensor entities
+    without reloading the config entry.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_MINIMAL},
+        entry_id='test-entity-profile',
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    # Only the sensor itself is created with minimal profile
+    assert sensor_unique_ids(
+        hass, config_entry.entry_id
+    ) == SENSOR_STATE_IDS
+
+    coordinator = config_entry.runtime_data
+
+    # Switch to standard profile, sensor attributes should be added
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_STANDARD}
+    )
+    await allow_callbacks_to_complete(hass)
+    assert sensor_unique_ids(
+        hass, config_entry.entry_id
+    ) == sorted(SENSOR_STATE_IDS + SENSOR_ATTRIBUTE_IDS)
+    for unique_id in SENSOR_ATTRIBUTE_IDS:
+        entity_id = er.async_get(hass).async_get_entity_id(
+            'binary_sensor', DOMAIN, unique_id
+        )
+        assert entity_id is not None
+        assert hass.states.get(entity_id) is not None
+
+    # Switch to full profile, configuration entities should be added
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_FULL}
+    )
+    await allow_callbacks_to_complete(hass)
+    full_ids = sensor_unique_ids(hass, config_entry.entry_id)
+    assert 'dummy_guid_sensor_0_alert_mode' in full_ids
+    assert 'dummy_guid_sensor_0_delete' in full_ids
+    assert len(full_ids) > len(SENSOR_STATE_IDS + SENSOR_ATTRIBUTE_IDS)
+    removed_entity_ids = [
+        x.entity_id for x in er.async_entries_for_config_entry(
+            er.async_get(hass), config_entry.entry_id
+        )
+        if x.unique_id in full_ids and x.unique_id not in SENSOR_STATE_IDS
+    ]
+    # Customize one of the entities to be removed
+    alert_mode_entity_id = er.async_get(hass).async_get_entity_id(
+        'select', DOMAIN, 'dummy_guid_sensor_0_alert_mode'
+    )
+    assert alert_mode_entity_id is not None
+    er.async_get(hass).async_update_entity(
+        alert_mode_entity_id, name='Custom alert mode'
+    )
+
+    # Switch back to minimal profile, all but sensor itself should be removed,
+    # while kept in the entity registry
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_MINIMAL}
+    )
+    await allow_callbacks_to_complete(hass)
+    assert sensor_unique_ids(hass, config_entry.entry_id) == full_ids
+    for entity_id in removed_entity_ids:
+        state = hass.states.get(entity_id)
+        assert state is not None
+        assert state.state == STATE_UNAVAILABLE
+
+    # Switch to full profile again, the customization should be retained
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_FULL}
+    )
+    await allow_callbacks_to_complete(hass)
+    state = hass.states.get(alert_mode_entity_id)
+    assert state is not None
+    assert state.state != STATE_UNAVAILABLE
+    assert state.name == 'Custom alert mode'
+
+    # No reload should have happened
+    assert config_entry.runtime_data is coordinator
@@ -46,16 +46,6 @@ from .conftest import (
         ('get_devices', G90Error, ConfigEntryState.SETUP_RETRY),
         ('get_sensors', G90TimeoutError, ConfigEntryState.SETUP_RETRY),
         ('get_sensors', G90Error, ConfigEntryState.SETUP_RETRY),
-        # The simulated errors below will trigger inside entry update listener,
-        # and won't result in state being error
-        (
-            'start_simulating_alerts_from_history',
-            G90Error, ConfigEntryState.LOADED
-        ),
-        (
-            'stop_simulating_alerts_from_history',
-            G90Error, ConfigEntryState.LOADED
-        ),
     ]
 )
 @pytest.mark.usefixtures('mock_g90alarm')
@@ -69,11 +59,7 @@ async def test_setup_entry_exception(
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         data={'ip_addr': 'dummy-ip'},
-        options={
-            # Required for `G90Alarm.stop_simulating_alerts_from_history()`
-            # method to be called
-            'simulate_alerts_from_history': False
-        },
+        options={},
         entry_id="test-exc"
     )
     config_entry.add_to_hass(hass)
@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for incremental synchronization of panel history into the local store.
+"""
+from typing import Any, Dict, cast
+from datetime import timedelta
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from pyg90alarm import G90History
+
+from custom_components.gs_alarm.const import DOMAIN
+from .conftest import AlarmMockT, allow_callbacks_to_complete
+
+
+def history_entry(
+    unix_time: int, event_id: int = 3, alert_type: int = 2, source: int = 0,
+    state: int = 0, sensor_name: str = ''
+) -> G90History:
+    """
+    Creates the history entry for the tests.
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    return G90History(
+        type=alert_type,
+        event_id=event_id,
+        source=source,
+        state=state,
+        sensor_name=sensor_name,
+        unix_time=unix_time,
+        other=''
+    )
+
+
+async def test_history_sync(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    hass_storage: dict[str, Any]
+) -> None:
+    """
+    Verifies only new history entries are added to the local store, those
+    exceeding retention limits are dropped, and the store persists across
+    reloads.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id='test_history'
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    now = int(dt_util.utcnow().timestamp())
+    g90_client = mock_g90alarm.return_value
+    g90_client.history.return_value = [
+        history_entry(now - 10),
+        history_entry(now - 20),
+        # Exceeds the retention age
+        history_entry(now - int(timedelta(days=31).total_seconds())),
+    ]
+
+    history = config_entry.runtime_data.history
+    assert await history.async_sync() == 3
+    g90_client.history.assert_called_with(start=1, count=20)
+    assert [x.datetime.timestamp() for x in history.entries] == [
+        now - 10, now - 20
+    ]
+
+    # Entries synchronized already are skipped, new entry with the same time
+    # stamp as the most recent one is added
+    g90_client.history.return_value = [
+        history_entry(now),
+        history_entry(now - 10, event_id=4),
+        history_entry(now - 10),
+        history_entry(now - 20),
+    ]
+    assert await history.async_sync() == 2
+    assert await history.async_sync() == 0
+    assert [x.datetime.timestamp() for x in history.entries] == [
+        now, now - 10, now - 10, now - 20
+    ]
+
+    # The history is persisted when unloading, and loaded back from the store
+    await hass.config_entries.async_reload(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    assert f'{DOMAIN}.history.test_history' in hass_storage
+    history = config_entry.runtime_data.history
+    assert len(history.entries) == 4
+    assert await history.async_sync() == 0
+
+    # Removing the entry removes the store as well
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    assert f'{DOMAIN}.history.test_history' not in hass_storage
+
+
+async def get_history(hass: HomeAssistant, **data: Any) -> Dict[str, Any]:
+    """
+    Calls the service to get the history.
+    """
+    return cast(Dict[str, Any], await hass.services.async_call(
+        DOMAIN, 'get_history', data, blocking=True, return_response=True
+    ))
+
+
+async def test_get_history_service(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verifies the service provides the stored history, filtered and paginated.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    now = int(dt_util.utcnow().timestamp())
+    g90_client = mock_g90alarm.return_value
+    g90_client.history.return_value = [
+        # Alarm from the door sensor
+        history_entry(
+            now - 10, event_id=1, alert_type=3, source=1, state=1,
+            sensor_name='Door'
+        ),
+        # Disarm
+        history_entry(now - 20),
+        history_entry(
+            now - 30, event_id=1, alert_type=3, source=1, state=1,
+            sensor_name='Door'
+        ),
+        history_entry(
+            now - 40, event_id=2, alert_type=3, source=1, state=1,
+            sensor_name='Window'
+        ),
+        history_entry(now - 50),
+    ]
+
+    # First page, history is synchronized from the panel
+    response = await get_history(
+        hass,
+        config_entry_id=config_entry.entry_id,
+        event_type='alarm',
+        limit=2,
+    )
+    g90_client.history.assert_called_with(start=1, count=20)
+    assert response['entries'] == [
+        {
+            'datetime': dt_util.utc_from_timestamp(now - 10).isoformat(),
+            'type': 'alarm',
+            'source': 'sensor',
+            'state': 'door_open',
+            'sensor_name': 'Door',
+            'sensor_idx': 1,
+        },
+        {
+            'datetime': dt_util.utc_from_timestamp(now - 30).isoformat(),
+            'type': 'alarm',
+            'source': 'sensor',
+            'state': 'door_open',
+            'sensor_name': 'Door',
+            'sensor_idx': 1,
+        },
+    ]
+    assert isinstance(response['next_cursor'], str)
+
+    # Next page, not synchronizing the history again even if the panel has
+    # new entries
+    g90_client.history.reset_mock()
+    response = await get_history(
+        hass,
+        config_entry_id=config_entry.entry_id,
+        event_type='alarm',
+        limit=2,
+        cursor=response['next_cursor'],
+    )
+    g90_client.history.assert_not_called()
+    assert [x['sensor_name'] for x in response['entries']] == ['Window']
+    assert response['next_cursor'] is None
+
+    # First page again, the history synchronized recently is served from the
+    # store
+    response = await get_history(
+        hass,
+        config_entry_id=config_entry.entry_id,
+        event_type='alarm',
+    )
+    g90_client.history.assert_not_called()
+    assert len(response['entries']) == 3
+
+    # The history is synchronized again once it is older than the age
+    freezer.tick(timedelta(seconds=61))
+    response = await get_history(
+        hass,
+        config_entry_id=config_entry.entry_id,
+        event_type='alarm',
+    )
+    g90_client.history.assert_called_with(start=1, count=20)
+    assert len(response['entries']) == 3
+
+    # Filtering by sensor index and time range
+    response = await get_history(
+        hass,
+        config_entry_id=config_entry.entry_id,
+        sensor_idx=1,
+        start_time=dt_util.utc_from_timestamp(now - 20).isoformat(),
+    )
+    assert [x['datetime'] for x in response['entries']] == [
+        dt_util.utc_from_timestamp(now - 10).isoformat()
+    ]
+
+    response = await get_history(
+        hass,
+        config_entry_id=config_entry.entry_id,
+        end_time=dt_util.utc_from_timestamp(now - 40).isoformat(),
+    )
+    assert [x['type'] for x in response['entries']] == [
+        'alarm', 'state_change'
+    ]
+
+    # Invalid cursor and unknown config entry are rejected
+    with pytest.raises(ServiceValidationError):
+        await get_history(
+            hass,
+            config_entry_id=config_entry.entry_id,
+            cursor='invalid',
+        )
+    with pytest.raises(ServiceValidationError):
+        await get_history(
+            hass,
+            config_entry_id='unknown',
+        )
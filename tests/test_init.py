@@ -6,7 +6,7 @@ Tests for loading/unloading the custom component.
 import re
 from typing import Any
 from datetime import timedelta
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 import pytest
 from pytest_unordered import unordered
 
@@ -14,9 +14,12 @@ from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     async_fire_time_changed,
 )
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt
 
+from pyg90alarm import G90TimeoutError
+
 from custom_components.gs_alarm.const import DOMAIN
 from .conftest import (
     AlarmMockT, hass_get_state_by_unique_id, entry_ids_for_integration_devices,
@@ -337,6 +340,58 @@ async def test_setup_unload_and_reload_entry_afresh(
                 'unique_id': 'dummy_guid_sensor_battery_voltage',
                 'entity_id': 'sensor.dummy_guid_battery_voltage',
                 'name': 'Battery voltage',
+            }, {
+                'unique_id': 'dummy_guid_sensor_device_notification_rate',
+                'entity_id': 'sensor.dummy_guid_device_notification_rate',
+                'name': 'Device notification rate',
+            }, {
+                'unique_id': 'dummy_guid_sensor_upstream_notification_rate',
+                'entity_id': 'sensor.dummy_guid_upstream_notification_rate',
+                'name': 'Upstream notification rate',
+            }, {
+                'unique_id': 'dummy_guid_sensor_max_device_notification_gap',
+                'entity_id': 'sensor.dummy_guid_max_device_notification_gap',
+                'name': 'Max device notification gap',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_flag_enabled',
+                'entity_id':
+                    'switch.dummy_guid_sensor_editor_flag_enabled',
+                'name': 'Sensor editor: enabled',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_flag_arm_delay',
+                'entity_id':
+                    'switch.dummy_guid_sensor_editor_flag_arm_delay',
+                'name': 'Sensor editor: arm delay',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_flag_detect_door',
+                'entity_id':
+                    'switch.dummy_guid_sensor_editor_flag_detect_door',
+                'name': 'Sensor editor: check active when arming',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_flag_door_chime',
+                'entity_id':
+                    'switch.dummy_guid_sensor_editor_flag_door_chime',
+                'name': 'Sensor editor: door chime',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_flag_independent_zone',
+                'entity_id':
+                    'switch.dummy_guid_sensor_editor_flag_independent_zone',
+                'name': 'Sensor editor: disarm from app only',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_alert_mode',
+                'entity_id':
+                    'select.dummy_guid_sensor_editor_alert_mode',
+                'name': 'Sensor editor: alert mode',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_name',
+                'entity_id':
+                    'text.dummy_guid_sensor_editor_name',
+                'name': 'Sensor editor: panel name',
+            }, {
+                'unique_id': 'dummy_guid_sensor_editor_target',
+                'entity_id':
+                    'select.dummy_guid_sensor_editor_target',
+                'name': 'Sensor editor: sensor',
             },
                 # Test for CID sensors if CID is supported
             ] + ([{
@@ -581,3 +636,166 @@ async def test_setup_set_cloud_server_address_not_called(
     await allow_callbacks_to_complete(hass)
 
     mock_g90alarm.return_value.set_cloud_server_address.assert_not_called()
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_callbacks_unregistered_on_reload(hass: HomeAssistant) -> None:
+    """
+    Verifies callbacks registered with `pyg90alarm` are unregistered when the
+    config entry is unloaded, so their number stays flat across reloads.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    coordinator = config_entry.runtime_data
+    live_callbacks = len(coordinator.callbacks)
+    assert live_callbacks > 0
+
+    await hass.config_entries.async_reload(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    # All callbacks of the previous instance should have been unregistered
+    assert len(coordinator.callbacks) == 0
+    assert len(config_entry.runtime_data.callbacks) == live_callbacks
+
+
+async def test_callbacks_unregistered_on_failed_setup(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies callbacks are unregistered and the client isn't pooled when the
+    setup fails, so retries don't accumulate callbacks.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    with patch(
+        'pyg90alarm.G90Alarm.get_sensors', side_effect=G90TimeoutError()
+    ):
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await allow_callbacks_to_complete(hass)
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+
+    # Callbacks of the failed setup should have been unregistered
+    assert len(config_entry.runtime_data.callbacks) == 0
+    failed_client = mock_g90alarm.return_value
+
+    # Retry creates the client afresh, since the failed one isn't pooled
+    await hass.config_entries.async_reload(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    reloaded_entry = hass.config_entries.async_get_entry(
+        config_entry.entry_id
+    )
+    assert reloaded_entry is not None
+    assert reloaded_entry.state is ConfigEntryState.LOADED
+    assert mock_g90alarm.call_count == 2
+    assert config_entry.runtime_data.client is not failed_client
+
+
+async def test_client_reused_on_reload(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies the client is kept across reloads of the config entry, with its
+    notifications not reconfigured, and released once the entry is removed.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    g90_client = mock_g90alarm.return_value
+    await hass.config_entries.async_reload(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    # The client should have been created only once, and notifications
+    # configured only once
+    mock_g90alarm.assert_called_once()
+    assert config_entry.runtime_data.client is g90_client
+    g90_client.listen_notifications.assert_called_once()
+    g90_client.close_notifications.assert_not_called()
+
+    # Entities of the sensors and relays should have been created again
+    assert hass_get_state_by_unique_id(
+        hass, 'binary_sensor', 'dummy_guid_sensor_0'
+    ).state == 'off'
+    assert hass_get_state_by_unique_id(
+        hass, 'switch', 'dummy_guid_switch_0_1'
+    ).state == 'off'
+
+    # Removing the entry should release the client
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    g90_client.close_notifications.assert_called_once()
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_panel_index(hass: HomeAssistant) -> None:
+    """
+    Verifies sensors and relays, along with their entities, are indexed by
+    panel index, and the entities are removed from the index once unloaded.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    panel_index = config_entry.runtime_data.panel_index
+    sensor = panel_index.sensor(0)
+    assert sensor is not None
+    assert sensor.name == 'Dummy sensor'
+    assert panel_index.primary_sensor_entity_id(0) == (
+        'binary_sensor.dummy_guid_dummy_sensor'
+    )
+    assert panel_index.entity_ids(sensor) == unordered([
+        'binary_sensor.dummy_guid_dummy_sensor',
+        'binary_sensor.dummy_guid_dummy_sensor_tampered',
+        'binary_sensor.dummy_guid_dummy_sensor_low_battery',
+        'binary_sensor.dummy_guid_dummy_sensor_open_when_armed',
+        'switch.dummy_guid_dummy_sensor_enabled',
+        'switch.dummy_guid_dummy_sensor_arm_delay',
+        'switch.dummy_guid_dummy_sensor_detect_door',
+        'switch.dummy_guid_dummy_sensor_door_chime',
+        'switch.dummy_guid_dummy_sensor_independent_zone',
+        'button.dummy_guid_dummy_sensor_delete',
+        'select.dummy_guid_dummy_sensor_alert_mode',
+        'text.dummy_guid_dummy_sensor_panel_name',
+    ])
+
+    # Nodes of multi-node relay share the panel index, and so the entities
+    device = panel_index.device(1, 1)
+    assert device is not None
+    assert device.name == 'Dummy switch 2 multi-node#2'
+    assert panel_index.entity_ids(device) == unordered([
+        'switch.dummy_guid_dummy_switch_2_multi_node_1',
+        'switch.dummy_guid_dummy_switch_2_multi_node_2',
+        'button.dummy_guid_dummy_switch_2_multi_node_1_delete',
+        'text.dummy_guid_dummy_switch_2_multi_node_1_panel_name',
+    ])
+    # Relays are never looked up as sensors
+    assert panel_index.primary_sensor_entity_id(1) is None
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    assert not panel_index.entity_ids(sensor)
@@ -156,3 +156,58 @@ async def test_config_flow_options_notifications_protocol(
             cloud_ip=user_input['cloud_ip'],
             cloud_port=user_input['cloud_port'],
         )
+
+
+async def test_options_update_notifications_unchanged(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Tests updates of the config entry not changing the effective notifications
+    settings don't reconfigure the notifications.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            'notifications_protocol': CONF_OPT_NOTIFICATIONS_CLOUD,
+            'cloud_ip': '127.0.0.1',
+            'cloud_port': 4321,
+            'cloud_local_port': 1234,
+        },
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    g90_client = mock_g90alarm.return_value
+    g90_client.listen_notifications.assert_called_once()
+
+    # Title-only update
+    hass.config_entries.async_update_entry(config_entry, title='New title')
+    await allow_callbacks_to_complete(hass)
+    # Update of the option irrelevant to the protocol selected
+    hass.config_entries.async_update_entry(
+        config_entry, options={
+            **config_entry.options,
+            'cloud_upstream_host': 'test-host.example.com',
+        }
+    )
+    await allow_callbacks_to_complete(hass)
+    g90_client.listen_notifications.assert_called_once()
+
+    # Changing the relevant option should reconfigure the notifications
+    hass.config_entries.async_update_entry(
+        config_entry, options={
+            **config_entry.options,
+            'cloud_local_port': 5678,
+        }
+    )
+    await allow_callbacks_to_complete(hass)
+    assert g90_client.listen_notifications.call_count == 2
+    g90_client.use_cloud_notifications.assert_called_with(
+        cloud_ip='127.0.0.1',
+        cloud_port=4321,
+        cloud_local_port=5678,
+        upstream_host=None,
+        upstream_port=None
+    )
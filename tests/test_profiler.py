@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for on-demand profiling of the integration.
+"""
+from typing import Any, Dict, cast
+from pathlib import Path
+import asyncio
+import pstats
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_mock_service,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.gs_alarm.const import DOMAIN
+from .conftest import AlarmMockT, allow_callbacks_to_complete
+
+
+async def profile(hass: HomeAssistant, **data: Any) -> Dict[str, Any]:
+    """
+    Calls the service to profile the integration.
+    """
+    return cast(Dict[str, Any], await hass.services.async_call(
+        DOMAIN, 'profile', data, blocking=True, return_response=True
+    ))
+
+
+async def test_profile_service(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT, tmp_path: Path
+) -> None:
+    """
+    Verifies the service profiles the integration, writing the stats scoped to
+    it and summarizing the hotspots in the persistent notification.
+    """
+    hass.config.config_dir = str(tmp_path)
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    notifications = async_mock_service(
+        hass, 'persistent_notification', 'create'
+    )
+
+    profiling = hass.async_create_task(profile(hass, duration=1))
+    await asyncio.sleep(0.1)
+    # Second profiling is rejected while the first one is in progress
+    with pytest.raises(ServiceValidationError):
+        await profile(hass, duration=1)
+
+    # Exercise the integration while profiling
+    await config_entry.runtime_data.async_refresh()
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', True
+    )
+    await allow_callbacks_to_complete(hass)
+    response = await profiling
+
+    # Stats are written under the config directory, scoped to the integration
+    path = Path(response['path'])
+    assert path.parent == tmp_path
+    stats = await hass.async_add_executor_job(pstats.Stats, str(path))
+    file_names = {
+        function.file_name
+        for function in stats.get_stats_profile().func_profiles.values()
+    }
+    assert any('gs_alarm' in file_name for file_name in file_names)
+    assert all(
+        'gs_alarm' in file_name or 'pyg90alarm' in file_name
+        for file_name in file_names
+    )
+    functions = [hotspot['function'] for hotspot in response['hotspots']]
+    assert 0 < len(functions) <= 10
+    assert all(
+        hotspot['calls'] > 0 for hotspot in response['hotspots']
+    )
+
+    assert len(notifications) == 1
+    assert str(path) in notifications[0].data['message']
+    assert functions[0] in notifications[0].data['message']
@@ -4,8 +4,8 @@
 Test cases for registering and deleting sensors/devices in the alarm panel.
 """
 from __future__ import annotations
-from typing import List
-from unittest.mock import ANY
+from typing import Any, AsyncGenerator, List
+from unittest.mock import ANY, patch
 import pytest
 from pytest_unordered import unordered
 
@@ -24,12 +24,15 @@ from homeassistant.components.button.const import (
     SERVICE_PRESS
 )
 from homeassistant.components.select.const import DOMAIN as SELECT_DOMAIN
+from homeassistant.helpers import device_registry as dr
 from homeassistant.components.text.const import (
     DOMAIN as TEXT_DOMAIN,
     ATTR_VALUE,
     SERVICE_SET_VALUE,
 )
 
+from pyg90alarm import G90Sensor
+
 from custom_components.gs_alarm.const import (
     DOMAIN,
 )
@@ -127,6 +130,64 @@ async def test_delete(
     } not in entry_ids_for_integration_devices(hass, config_entry.entry_id)
 
 
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_sensor_removed_from_panel(hass: HomeAssistant) -> None:
+    """
+    Tests entities and HASS device of the sensor deleted on the panel itself
+    are removed, along with the callbacks registered for the sensor.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test_sensor_removed_from_panel"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    coordinator = config_entry.runtime_data
+    sensor = coordinator.data.sensors[0]
+    device_identifiers = {(DOMAIN, 'dummy_guid_sensor_0')}
+    assert dr.async_get(hass).async_get_device(
+        identifiers=device_identifiers
+    ) is not None
+
+    async def empty_sensor_list_fetch(
+        *_args: Any, **_kwargs: Any
+    ) -> AsyncGenerator[G90Sensor, None]:
+        """
+        Simulates the sensor has been deleted on the panel.
+        """
+        mock_sensors: List[G90Sensor] = []
+        for mock_sensor in mock_sensors:
+            yield mock_sensor
+
+    with (
+        patch(
+            'pyg90alarm.entities.sensor_list.G90SensorList._fetch',
+            side_effect=empty_sensor_list_fetch
+        ),
+        patch.object(
+            sensor.state_callback, 'remove',
+            wraps=sensor.state_callback.remove
+        ) as state_callback_remove,
+    ):
+        await coordinator.async_refresh()
+        await allow_callbacks_to_complete(hass)
+
+    assert sensor.is_unavailable
+    # HASS device of the sensor and its entities should have been removed
+    assert dr.async_get(hass).async_get_device(
+        identifiers=device_identifiers
+    ) is None
+    assert hass.states.get('binary_sensor.dummy_guid_dummy_sensor') is None
+    # The callbacks should have been unregistered
+    state_callback_remove.assert_called_once()
+    # Config entry should not have been reloaded
+    assert config_entry.runtime_data is coordinator
+
+
 @pytest.mark.parametrize(
     "register_unique_id,"
     "new_type_unique_id,new_name_unique_id,new_type,new_name,"
@@ -4,21 +4,26 @@
 Tests sensor entities for the custom component.
 """
 from datetime import timedelta
+from freezegun.api import FrozenDateTimeFactory
 
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
     async_fire_time_changed,
+    async_capture_events,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.util import dt
 
 from custom_components.gs_alarm.const import (
     DOMAIN,
     NOTIFICATIONS_PROTOCOL_SENSOR_LAST_DEVICE_TIMESTAMP_ATTR,
     NOTIFICATIONS_PROTOCOL_SENSOR_LAST_UPSTREAM_TIMESTAMP_ATTR,
+    NOTIFICATIONS_PROTOCOL_SENSOR_TTL,
 )
 from .conftest import (
-    AlarmMockT, hass_get_state_by_unique_id, allow_callbacks_to_complete,
+    AlarmMockT, hass_get_state_by_unique_id, hass_get_entity_id_by_unique_id,
+    allow_callbacks_to_complete,
 )
 
 
@@ -108,3 +113,148 @@ async def test_notifications_protocol_binary_sensor(
         hass, 'binary_sensor', 'dummy_guid_sensor_notifications_protocol'
     )
     assert sensor_state.state == 'off'
+
+
+async def test_notifications_protocol_binary_sensor_packet_and_expiry(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verify notifications protocol binary sensor is updated upon packet
+    received, expires once TTL is over, and is written only when changed.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={'notifications_protocol': 'local'},
+        entry_id='test-notifications-protocol',
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    entity_id = hass_get_entity_id_by_unique_id(
+        hass, 'binary_sensor', 'dummy_guid_sensor_notifications_protocol'
+    )
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    # Simulate a packet received, the sensor should be updated without
+    # waiting for coordinator refresh
+    last_device_packet_time = dt.utcnow()
+    mock_g90alarm.return_value.last_device_packet_time = (
+        last_device_packet_time
+    )
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', True
+    )
+    await allow_callbacks_to_complete(hass)
+    sensor_state = hass.states.get(entity_id)
+    assert sensor_state is not None
+    assert sensor_state.state == 'on'
+
+    # Further packets while connected shouldn't write the state
+    freezer.tick(timedelta(seconds=5))
+    last_device_packet_time = dt.utcnow()
+    mock_g90alarm.return_value.last_device_packet_time = (
+        last_device_packet_time
+    )
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', False
+    )
+    await allow_callbacks_to_complete(hass)
+    assert [
+        event.data['new_state'].state for event in state_changes
+        if event.data['entity_id'] == entity_id
+    ] == ['on']
+
+    # Coordinator refreshes don't write the state while connected, the
+    # timestamps are refreshed upon next transition
+    sensor_state = hass.states.get(entity_id)
+    assert sensor_state is not None
+    last_reported = sensor_state.last_reported
+    for _ in range(2):
+        freezer.tick(timedelta(seconds=31))
+        async_fire_time_changed(hass)
+        await allow_callbacks_to_complete(hass)
+    assert [
+        event.data['new_state'].state for event in state_changes
+        if event.data['entity_id'] == entity_id
+    ] == ['on']
+    sensor_state = hass.states.get(entity_id)
+    assert sensor_state is not None
+    assert sensor_state.last_reported == last_reported
+
+    # The sensor should go off once the packet is out of TTL window, with the
+    # timestamps refreshed
+    freezer.move_to(
+        last_device_packet_time + NOTIFICATIONS_PROTOCOL_SENSOR_TTL
+    )
+    async_fire_time_changed(hass)
+    await allow_callbacks_to_complete(hass)
+    assert [
+        event.data['new_state'].state for event in state_changes
+        if event.data['entity_id'] == entity_id
+    ] == ['on', 'off']
+    sensor_state = hass.states.get(entity_id)
+    assert sensor_state is not None
+    assert sensor_state.attributes[
+        NOTIFICATIONS_PROTOCOL_SENSOR_LAST_DEVICE_TIMESTAMP_ATTR
+    ] == last_device_packet_time
+
+
+async def test_notification_metrics_sensors(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verify notification rate and gap sensors reflect the notifications
+    observed.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={'notifications_protocol': 'local'},
+        entry_id='test-packet-metrics',
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    # No packets received yet
+    assert hass_get_state_by_unique_id(
+        hass, 'sensor', 'dummy_guid_sensor_device_notification_rate'
+    ).state == '0.0'
+    assert hass_get_state_by_unique_id(
+        hass, 'sensor', 'dummy_guid_sensor_max_device_notification_gap'
+    ).state == 'unknown'
+
+    # Simulate three device packets received 60 seconds apart, and single
+    # upstream one
+    for _ in range(3):
+        freezer.tick(timedelta(seconds=60))
+        mock_g90alarm.return_value.last_device_packet_time = dt.utcnow()
+        await mock_g90alarm.return_value.on_sensor_activity(
+            0, 'Dummy sensor', True
+        )
+        await allow_callbacks_to_complete(hass)
+    mock_g90alarm.return_value.last_upstream_packet_time = dt.utcnow()
+
+    # Sensors are updated upon coordinator refresh
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await allow_callbacks_to_complete(hass)
+
+    # 3 and 1 notifications within 15 minutes window
+    assert hass_get_state_by_unique_id(
+        hass, 'sensor', 'dummy_guid_sensor_device_notification_rate'
+    ).state == '0.2'
+    assert hass_get_state_by_unique_id(
+        hass, 'sensor', 'dummy_guid_sensor_upstream_notification_rate'
+    ).state == '0.07'
+    assert hass_get_state_by_unique_id(
+        hass, 'sensor', 'dummy_guid_sensor_max_device_notification_gap'
+    ).state == '60.0'
+
+    diagnostics = config_entry.runtime_data.notification_metrics.as_dict()
+    assert diagnostics['device_notifications'] == 3
+    assert diagnostics['upstream_notifications'] == 1
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for the panel-level sensor editor.
+"""
+from __future__ import annotations
+from unittest.mock import patch
+import pytest
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_ENTITY_ID, SERVICE_TURN_ON, STATE_UNAVAILABLE, STATE_ON,
+)
+from homeassistant.components.switch.const import DOMAIN as SWITCH_DOMAIN
+from homeassistant.components.select.const import (
+    DOMAIN as SELECT_DOMAIN, ATTR_OPTION, SERVICE_SELECT_OPTION,
+)
+from homeassistant.components.text.const import (
+    DOMAIN as TEXT_DOMAIN, ATTR_VALUE, SERVICE_SET_VALUE,
+)
+from homeassistant.helpers import device_registry as dr
+
+from pyg90alarm import G90SensorUserFlags, G90SensorAlertModes
+
+from custom_components.gs_alarm.const import (
+    DOMAIN, CONF_ENTITY_PROFILE, CONF_OPT_ENTITY_PROFILE_MINIMAL,
+    CONF_OPT_ENTITY_PROFILE_FULL,
+)
+from .conftest import (
+    AlarmMockT,
+    hass_get_entity_id_by_unique_id,
+    hass_get_state_by_unique_id,
+    allow_callbacks_to_complete,
+)
+
+
+async def test_sensor_editor(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Tests the sensor editor loads and saves configuration of the selected
+    sensor.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_MINIMAL},
+        entry_id='test_sensor_editor'
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    # No sensor is selected initially, so the editor entities are
+    # unavailable
+    target_state = hass_get_state_by_unique_id(
+        hass, SELECT_DOMAIN, 'dummy_guid_sensor_editor_target'
+    )
+    assert target_state.attributes['options'] == ['Dummy sensor (#0)']
+    assert hass_get_state_by_unique_id(
+        hass, SWITCH_DOMAIN, 'dummy_guid_sensor_editor_flag_enabled'
+    ).state == STATE_UNAVAILABLE
+
+    # Select the sensor to edit
+    await hass.services.async_call(
+        SELECT_DOMAIN,
+        SERVICE_SELECT_OPTION,
+        {
+            ATTR_ENTITY_ID: target_state.entity_id,
+            ATTR_OPTION: 'Dummy sensor (#0)',
+        },
+        blocking=True,
+    )
+    await allow_callbacks_to_complete(hass)
+
+    # Editor entities should reflect the configuration of the sensor
+    assert hass_get_state_by_unique_id(
+        hass, SWITCH_DOMAIN, 'dummy_guid_sensor_editor_flag_enabled'
+    ).state == STATE_ON
+    assert hass_get_state_by_unique_id(
+        hass, SELECT_DOMAIN, 'dummy_guid_sensor_editor_alert_mode'
+    ).state == 'alert_when_away'
+    assert hass_get_state_by_unique_id(
+        hass, TEXT_DOMAIN, 'dummy_guid_sensor_editor_name'
+    ).state == 'Dummy sensor'
+
+    sensor = (await mock_g90alarm.return_value.get_sensors())[0]
+
+    # Change the sensor flag
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_ON,
+        {
+            ATTR_ENTITY_ID: hass_get_entity_id_by_unique_id(
+                hass, SWITCH_DOMAIN, 'dummy_guid_sensor_editor_flag_arm_delay'
+            ),
+        },
+        blocking=True,
+    )
+    sensor.set_flag.assert_called_once_with(
+        G90SensorUserFlags.ARM_DELAY, True
+    )
+
+    # Change the sensor alert mode, data update from panel should be
+    # requested to reflect it
+    with patch.object(
+        config_entry.runtime_data, 'async_request_refresh'
+    ) as mock_refresh:
+        await hass.services.async_call(
+            SELECT_DOMAIN,
+            SERVICE_SELECT_OPTION,
+            {
+                ATTR_ENTITY_ID: hass_get_entity_id_by_unique_id(
+                    hass, SELECT_DOMAIN, 'dummy_guid_sensor_editor_alert_mode'
+                ),
+                ATTR_OPTION: 'alert_always',
+            },
+            blocking=True,
+        )
+    sensor.set_alert_mode.assert_called_once_with(
+        G90SensorAlertModes.ALERT_ALWAYS
+    )
+    mock_refresh.assert_awaited_once()
+
+    # Rename the sensor
+    await hass.services.async_call(
+        TEXT_DOMAIN,
+        SERVICE_SET_VALUE,
+        {
+            ATTR_ENTITY_ID: hass_get_entity_id_by_unique_id(
+                hass, TEXT_DOMAIN, 'dummy_guid_sensor_editor_name'
+            ),
+            ATTR_VALUE: 'Renamed sensor',
+        },
+        blocking=True,
+    )
+    sensor.set_name.assert_called_once_with('Renamed sensor')
+    await allow_callbacks_to_complete(hass)
+
+    # The HASS device of the sensor should be renamed, not the panel one
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, 'dummy_guid_sensor_0')}
+    )
+    assert device is not None
+    assert device.name == 'Renamed sensor'
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_sensor_editor_created_for_full_profile(
+    hass: HomeAssistant
+) -> None:
+    """
+    Tests the sensor editor is created along with per-sensor configuration
+    entities, so full profile is the superset of others.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={CONF_ENTITY_PROFILE: CONF_OPT_ENTITY_PROFILE_FULL},
+        entry_id='test_sensor_editor_full'
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    assert hass.states.get(
+        'select.dummy_guid_sensor_editor_target'
+    ) is not None
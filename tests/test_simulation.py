@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for simulation of alerts from panel history.
+"""
+from datetime import timedelta
+from unittest.mock import patch
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+    mock_restore_cache,
+)
+from homeassistant.core import HomeAssistant, State
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON
+from homeassistant.components.switch.const import (
+    DOMAIN as SWITCH_DOMAIN,
+)
+from homeassistant.util import dt as dt_util
+
+from pyg90alarm import G90History
+
+from custom_components.gs_alarm.const import DOMAIN, EVENT_ALARM
+from .conftest import AlarmMockT, allow_callbacks_to_complete
+
+SWITCH_ENTITY_ID = 'switch.dummy_guid_simulate_alerts_from_history'
+
+
+def alarm_history_entry(unix_time: int) -> G90History:
+    """
+    Creates the history entry for the alarm triggered by the sensor.
+    """
+    return G90History(
+        type=3,
+        event_id=0,
+        source=1,
+        state=1,
+        sensor_name='Dummy sensor',
+        unix_time=unix_time,
+        other=''
+    )
+
+
+async def advance_time(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, seconds: float
+) -> None:
+    """
+    Advances the time, allowing the simulation to poll the history.
+    """
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await allow_callbacks_to_complete(hass)
+
+
+async def setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """
+    Sets up the integration.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    return config_entry
+
+
+async def enable_simulation(hass: HomeAssistant) -> None:
+    """
+    Enables the simulation thru its switch.
+    """
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: SWITCH_ENTITY_ID},
+        blocking=True,
+    )
+    await allow_callbacks_to_complete(hass)
+
+
+async def test_simulation_adaptive_cadence(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verifies only history entries newer than those existed when the simulation
+    started are simulated, and the polling interval grows while there are no
+    new entries and is reset once those are found.
+    """
+    config_entry = await setup_integration(hass)
+    g90_client = mock_g90alarm.return_value
+    now = int(dt_util.utcnow().timestamp())
+    g90_client.history.return_value = [alarm_history_entry(now - 10)]
+    alarm_events = async_capture_events(hass, EVENT_ALARM)
+
+    await enable_simulation(hass)
+    simulation = config_entry.runtime_data.simulation
+    assert simulation.is_running
+    g90_client.history.assert_called_with(start=1, count=20)
+    assert simulation.as_dict()['interval_seconds'] == 5
+
+    # No new entries, the interval grows
+    await advance_time(hass, freezer, 5)
+    assert simulation.as_dict()['interval_seconds'] == 10
+    await advance_time(hass, freezer, 10)
+    assert simulation.as_dict()['interval_seconds'] == 20
+    # Entry existed before the simulation started isn't simulated
+    assert not alarm_events
+
+    # New entry is simulated, and the interval is reset
+    g90_client.history.return_value = [
+        alarm_history_entry(now + 20), alarm_history_entry(now - 10)
+    ]
+    await advance_time(hass, freezer, 20)
+    assert simulation.as_dict()['interval_seconds'] == 5
+    assert len(alarm_events) == 1
+    assert alarm_events[0].data['sensor_idx'] == 0
+
+    # Interval doesn't exceed the maximum
+    for _ in range(10):
+        await advance_time(hass, freezer, 60)
+    assert simulation.as_dict()['interval_seconds'] == 60
+    assert len(alarm_events) == 1
+
+
+async def test_simulation_packet_budget(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verifies polling the history is delayed once the budget of requests to
+    the panel is exhausted.
+    """
+    config_entry = await setup_integration(hass)
+    g90_client = mock_g90alarm.return_value
+    with (
+        patch(
+            'custom_components.gs_alarm.simulation.SIMULATION_PACKET_BUDGET',
+            2
+        ),
+        patch(
+            'custom_components.gs_alarm.simulation.SIMULATION_INTERVAL_FACTOR',
+            1
+        ),
+    ):
+        await enable_simulation(hass)
+        simulation = config_entry.runtime_data.simulation
+
+        g90_client.history.reset_mock()
+        await advance_time(hass, freezer, 5)
+        await advance_time(hass, freezer, 5)
+        assert g90_client.history.call_count == 2
+        assert simulation.as_dict()['requests_in_budget_window'] == 2
+
+        # Budget is exhausted, no further polls until the window passes (the
+        # time is advanced short of periodic history synchronization)
+        await advance_time(hass, freezer, 5)
+        await advance_time(hass, freezer, 200)
+        assert g90_client.history.call_count == 2
+
+        # Requests counted in the budget expire, and the poll happens
+        await advance_time(hass, freezer, 3400)
+        assert simulation.as_dict()['requests_in_budget_window'] == 1
+
+
+async def test_simulation_packet_budget_history_pages(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verifies each request for a page of history entries the poll sends is
+    charged to the budget.
+    """
+    config_entry = await setup_integration(hass)
+    g90_client = mock_g90alarm.return_value
+    await enable_simulation(hass)
+    simulation = config_entry.runtime_data.simulation
+
+    # Full pages of new entries make the synchronization fetch the next
+    # ones, up to the limit
+    now = int(dt_util.utcnow().timestamp())
+    g90_client.history.return_value = [
+        alarm_history_entry(now + 20 - i) for i in range(20)
+    ]
+    g90_client.history.reset_mock()
+    await advance_time(hass, freezer, 5)
+    assert g90_client.history.call_count == 10
+    assert simulation.as_dict()['requests_in_budget_window'] == 10
+
+
+async def test_simulation_stops_on_push(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT,
+    freezer: FrozenDateTimeFactory
+) -> None:
+    """
+    Verifies the simulation stops once packets from the panel are received,
+    turning its switch off.
+    """
+    config_entry = await setup_integration(hass)
+    g90_client = mock_g90alarm.return_value
+    await enable_simulation(hass)
+    simulation = config_entry.runtime_data.simulation
+    switch_state = hass.states.get(SWITCH_ENTITY_ID)
+    assert switch_state is not None
+    assert switch_state.state == 'on'
+
+    g90_client.configure_mock(
+        last_device_packet_time=dt_util.utcnow() + timedelta(seconds=1)
+    )
+    await advance_time(hass, freezer, 5)
+    assert not simulation.is_running
+    switch_state = hass.states.get(SWITCH_ENTITY_ID)
+    assert switch_state is not None
+    assert switch_state.state == 'off'
+
+    # No more polls once stopped
+    g90_client.history.reset_mock()
+    await advance_time(hass, freezer, 60)
+    g90_client.history.assert_not_called()
+
+
+async def test_simulation_restore_state(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies the simulation is started at startup if it was enabled, and
+    stopped when the integration is unloaded.
+    """
+    mock_restore_cache(hass, [State(SWITCH_ENTITY_ID, 'on')])
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    simulation = config_entry.runtime_data.simulation
+    assert simulation.is_running
+    mock_g90alarm.return_value.history.assert_called_with(start=1, count=20)
+    switch_state = hass.states.get(SWITCH_ENTITY_ID)
+    assert switch_state is not None
+    assert switch_state.state == 'on'
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    assert not simulation.is_running
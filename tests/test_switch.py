@@ -300,16 +300,6 @@ async def test_sensor_flags_exception(
             None, ('sms_alert_when_armed', False),
             id="SMS alert when armed disabled"
         ),
-        pytest.param(
-            "dummy_guid_simulate_alerts_from_history", SERVICE_TURN_ON,
-            'start_simulating_alerts_from_history', (),
-            id="Simulate alerts from history enabled"
-        ),
-        pytest.param(
-            "dummy_guid_simulate_alerts_from_history", SERVICE_TURN_OFF,
-            'stop_simulating_alerts_from_history', (),
-            id="Simulate alerts from history disabled"
-        ),
     ],
 )
 # pylint: disable=too-many-positional-arguments,too-many-arguments
@@ -384,15 +374,10 @@ async def test_config_flags(
         pytest.param(
             "dummy_guid_simulate_alerts_from_history", SERVICE_TURN_ON,
             G90Error('dummy exception'),
-            'start_simulating_alerts_from_history', 'off',
+            # Simulation synchronizes the history when starting
+            'history', 'off',
             id="Exception when starting simulate alerts from history"
         ),
-        pytest.param(
-            "dummy_guid_simulate_alerts_from_history", SERVICE_TURN_OFF,
-            G90Error('dummy exception'),
-            'stop_simulating_alerts_from_history', 'on',
-            id="Exception when stopping simulate alerts from history"
-        ),
     ]
 )
 async def test_config_flags_exception(
@@ -541,24 +526,6 @@ async def test_device(
 @pytest.mark.parametrize(
     "entity_id,restored_state,expected_state,simulated_exception,"
     "expected_call,expected_args,expect_no_call", [
-        pytest.param(
-            "switch.dummy_guid_simulate_alerts_from_history", "on", "on",
-            None,
-            'start_simulating_alerts_from_history', (), False,
-            id="Enabled simulating alerts from history"
-        ),
-        pytest.param(
-            "switch.dummy_guid_simulate_alerts_from_history", "on", "off",
-            G90Error('dummy exception'),
-            'start_simulating_alerts_from_history', (), False,
-            id="Exception with enabled simulating alerts from history"
-        ),
-        pytest.param(
-            "switch.dummy_guid_simulate_alerts_from_history", "off", "off",
-            None,
-            'stop_simulating_alerts_from_history', (), True,
-            id="Disabled simulating alerts from history"
-        ),
         pytest.param(
             "switch.dummy_guid_sms_alert_when_armed", "on", "on",
             None,
@@ -15,6 +15,7 @@ from pytest_homeassistant_custom_component.common import (
 from homeassistant.core import HomeAssistant
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.util import dt
+from homeassistant.helpers import entity_registry as er
 
 from homeassistant.components.text.const import (
     ATTR_VALUE,
@@ -473,3 +474,56 @@ async def test_rename_text_entities(
         # Verify the corresponding call has been made (either successfully
         # or with an exception)
         alarm_entity.set_name.assert_called_once_with(new_name)
+
+
+@pytest.mark.usefixtures('mock_g90alarm')
+async def test_rename_multi_node_relay_in_place(
+    hass: HomeAssistant
+) -> None:
+    """
+    Tests renaming multi-node relay updates its entities in place, without
+    reloading the config entry.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+        entry_id="test_rename_multi_node_relay_in_place"
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+    coordinator = config_entry.runtime_data
+
+    await hass.services.async_call(
+        TEXT_DOMAIN,
+        SERVICE_SET_VALUE,
+        {
+            ATTR_ENTITY_ID: hass_get_entity_id_by_unique_id(
+                hass, TEXT_DOMAIN, 'dummy_guid_switch_1_panel_name'
+            ),
+            ATTR_VALUE: 'Renamed relay',
+        },
+        blocking=True,
+    )
+    await allow_callbacks_to_complete(hass)
+
+    # Names of all nodes should reflect the new name
+    devices = entry_ids_for_integration_devices(hass, config_entry.entry_id)
+    relay = next(x for x in devices if x['device'] == 'Renamed relay')
+    assert {
+        x['name'] for x in relay['entities']
+        if x['entity_id'].startswith('switch.')
+    } == {'Renamed relay#1', 'Renamed relay#2'}
+    # Original name in entity registry should be updated as well
+    entity_registry = er.async_get(hass)
+    assert {
+        entry.original_name for entry in er.async_entries_for_config_entry(
+            entity_registry, config_entry.entry_id
+        )
+        if entry.entity_id.startswith('switch.')
+        and entry.unique_id.startswith('dummy_guid_switch_1_')
+    } == {'Renamed relay#1', 'Renamed relay#2'}
+
+    # No reload should have happened
+    assert config_entry.runtime_data is coordinator
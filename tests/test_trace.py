@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2026 Ilia Sotnikov
+"""
+Tests for the in-memory trace of hot-path events.
+"""
+from typing import Any, Dict, cast
+import asyncio
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+)
+from homeassistant.core import HomeAssistant
+
+from custom_components.gs_alarm.const import DOMAIN
+from custom_components.gs_alarm.trace import GsAlarmTrace
+from .conftest import AlarmMockT, allow_callbacks_to_complete
+
+
+def test_trace_ring_buffer() -> None:
+    """
+    Verifies the trace keeps the most recent records only, from older to
+    newer.
+    """
+    trace = GsAlarmTrace(size=3)
+    assert not trace.as_list()
+
+    for value in range(5):
+        trace.record('kind', 1, value, 0.5)
+
+    records = trace.as_list()
+    assert [record['value'] for record in records] == [2, 3, 4]
+    assert records[0]['kind'] == 'kind'
+    assert records[0]['index'] == 1
+    assert records[0]['latency'] == 0.5
+
+
+async def test_get_trace_service(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies the service provides the trace of panel callbacks, commands sent
+    to the panel and state writes of the entities.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', True
+    )
+    await allow_callbacks_to_complete(hass)
+
+    response = cast(Dict[str, Any], await hass.services.async_call(
+        DOMAIN, 'get_trace', {'config_entry_id': config_entry.entry_id},
+        blocking=True, return_response=True
+    ))
+    records = response['records']
+    kinds = {record['kind'] for record in records}
+    assert {'command', 'poll', 'state_write'} <= kinds
+
+    # Sensor callback is recorded along with its index and value
+    state_callbacks = [
+        record for record in records if record['kind'] == 'state_callback'
+    ]
+    assert state_callbacks[-1]['index'] == 0
+    assert state_callbacks[-1]['value'] == [True]
+    assert state_callbacks[-1]['latency'] is not None
+
+    # Sensor name is left out of the client callback arguments
+    sensor_callbacks = [
+        record for record in records if record['kind'] == 'sensor_callback'
+    ]
+    assert sensor_callbacks[-1]['value'] == [0, True]
+
+    # State write of the sensor entity, recorded by its platform and index
+    state_writes = [
+        record for record in records if record['kind'] == 'state_write'
+    ]
+    assert state_writes[-1]['index'] == 0
+    assert state_writes[-1]['value'] == 'binary_sensor'
+
+    # Neither the panel GUID nor sensor names are in the trace
+    assert 'dummy_guid' not in repr(records).lower()
+    assert 'dummy sensor' not in repr(records).lower()
+
+
+async def test_trace_coroutine_callback(
+    hass: HomeAssistant, mock_g90alarm: AlarmMockT
+) -> None:
+    """
+    Verifies coroutine callbacks are recorded into the trace and their
+    latencies, timed around the await, but not accounted as time spent in the
+    event loop nor as slow callbacks.
+    """
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={'ip_addr': 'dummy-ip'},
+        options={'slow_callback_threshold': 1},
+    )
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await allow_callbacks_to_complete(hass)
+
+    invoked = asyncio.Event()
+
+    async def coroutine_sensor_callback(*_args: Any) -> None:
+        await asyncio.sleep(0.01)
+        invoked.set()
+
+    coordinator = config_entry.runtime_data
+    coordinator.callbacks.add(
+        mock_g90alarm.return_value.sensor_callback,
+        coroutine_sensor_callback, 0
+    )
+    await mock_g90alarm.return_value.on_sensor_activity(
+        0, 'Dummy sensor', True
+    )
+    # The callback is run as the task not tracked by HASS
+    await asyncio.wait_for(invoked.wait(), timeout=1)
+    await allow_callbacks_to_complete(hass)
+
+    records = [
+        record for record in coordinator.trace.as_list()
+        if record['kind'] == 'coroutine_sensor_callback'
+    ]
+    assert len(records) == 1
+    assert records[0]['index'] == 0
+    assert records[0]['value'] == [0, True]
+    assert records[0]['latency'] >= 0.01
+
+    performance = coordinator.performance.as_dict()
+    assert performance['coroutine_callbacks'][
+        'coroutine_sensor_callback'
+    ]['count'] == 1
+    # The callback is plain function, its latency exceeds the threshold
+    assert 'function' not in performance['slow_callbacks']['by_entity_class']